@@ -7,11 +7,32 @@ Compare three sources of SoundTouch API knowledge:
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 SCRIPT_DIR = Path(__file__).parent
 
+# Patterns for parse_official_docs, compiled once
+# TOC entry: 6.X /endpoint_name
+_TOC_PATTERN = re.compile(r"\d+\.\d+\s+/(\w+)")
+_SECTION_HEADING_PATTERN = re.compile(r"/(\w+)\s*\n", re.IGNORECASE)
+_DESCRIPTION_PATTERN = re.compile(
+    r"Description:(.*?)(?:GET:|POST:)", re.DOTALL | re.IGNORECASE
+)
+_METHOD_PATTERNS = {
+    method: re.compile(rf"{method}:\s*\n(?!N/A)") for method in ("GET", "POST")
+}
+
+# Markers for parse_collected_schemas, matched in a single scan per file.
+# "SoundTouch 300" also counts as a "SoundTouch 30" mention, as a plain
+# substring check would.
+_SCHEMA_MARKER_PATTERN = re.compile(
+    r"(?P<device_specific>DEVICE-SPECIFIC ENDPOINT)"
+    r"|(?P<available>Available on)"
+    r"|SoundTouch (?P<model>10|30(?P<st300>0)?)"
+)
+
 
 def parse_official_docs() -> Dict[str, Dict]:
     """Parse endpoints from official Bose documentation."""
@@ -26,9 +47,7 @@ def parse_official_docs() -> Dict[str, Dict]:
     endpoints = {}
 
     # Parse table of contents for endpoint list
-    # Pattern: 6.X /endpoint_name
-    toc_pattern = r"\d+\.\d+\s+/(\w+)"
-    for match in re.finditer(toc_pattern, text):
+    for match in _TOC_PATTERN.finditer(text):
         endpoint = match.group(1)
         endpoints[endpoint] = {
             "source": "official_docs",
@@ -36,23 +55,36 @@ def parse_official_docs() -> Dict[str, Dict]:
             "description": "",
         }
 
-    # Try to find GET/POST info for each endpoint
-    for endpoint in list(endpoints.keys()):
-        # Look for section describing this endpoint
-        section_pattern = rf"/({endpoint})\s*\n.*?Description:(.*?)(?:GET:|POST:)"
-        section_match = re.search(section_pattern, text, re.DOTALL | re.IGNORECASE)
-
-        if section_match:
-            description = section_match.group(2).strip()
-            endpoints[endpoint]["description"] = " ".join(description.split()[:50])
+    # Single scans over the text instead of one regex search per endpoint:
+    # where each section heading ("/endpoint" + newline) ends, by lowercase name
+    section_starts: Dict[str, List[int]] = {}
+    for match in _SECTION_HEADING_PATTERN.finditer(text):
+        section_starts.setdefault(match.group(1).lower(), []).append(match.end())
 
-        # Check for GET
-        if re.search(rf"/({endpoint}).*?GET:\s*\n(?!N/A)", text, re.DOTALL):
-            endpoints[endpoint]["methods"].append("GET")
+    # Start of the last documented (non-N/A) GET:/POST: block
+    last_method_start = {
+        method: max((m.start() for m in pattern.finditer(text)), default=-1)
+        for method, pattern in _METHOD_PATTERNS.items()
+    }
 
-        # Check for POST
-        if re.search(rf"/({endpoint}).*?POST:\s*\n(?!N/A)", text, re.DOTALL):
-            endpoints[endpoint]["methods"].append("POST")
+    # Try to find GET/POST info for each endpoint
+    for endpoint, info in endpoints.items():
+        # Description from the first section for this endpoint that has one
+        for position in section_starts.get(endpoint.lower(), ()):
+            section_match = _DESCRIPTION_PATTERN.search(text, position)
+            if section_match:
+                description = section_match.group(1).strip()
+                info["description"] = " ".join(description.split()[:50])
+                break
+
+        # A method counts if any documented block follows the endpoint's first mention
+        first_mention = text.find(f"/{endpoint}")
+        if first_mention == -1:
+            continue
+        mention_end = first_mention + len(endpoint) + 1
+        for method in ("GET", "POST"):
+            if last_method_start[method] >= mention_end:
+                info["methods"].append(method)
 
     return endpoints
 
@@ -67,23 +99,36 @@ def parse_collected_schemas() -> Dict[str, Dict]:
 
     endpoints = {}
 
-    for xml_file in consolidated_dir.glob("*.xml"):
+    # Read files in parallel; the scan below is cheap next to the I/O
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        contents = list(
+            executor.map(
+                lambda path: (path, path.read_text(encoding="utf-8")),
+                consolidated_dir.glob("*.xml"),
+            )
+        )
+
+    for xml_file, content in contents:
         endpoint = xml_file.stem
 
-        # Read file to check if device-specific
-        content = xml_file.read_text(encoding="utf-8")
+        markers = set()
+        for match in _SCHEMA_MARKER_PATTERN.finditer(content):
+            if match.group("model") is None:
+                markers.add(match.lastgroup)
+            else:
+                markers.add("ST10" if match.group("model") == "10" else "ST30")
+                if match.group("st300"):
+                    markers.add("ST300")
 
-        is_device_specific = "DEVICE-SPECIFIC ENDPOINT" in content
+        is_device_specific = "device_specific" in markers
         available_on = []
 
         if is_device_specific:
             # Extract which models support it
-            if "SoundTouch 300" in content and "Available on" in content:
-                available_on.append("ST300")
-            if "SoundTouch 30" in content and "Available on" in content:
-                available_on.append("ST30")
-            if "SoundTouch 10" in content and "Available on" in content:
-                available_on.append("ST10")
+            if "available" in markers:
+                available_on = [
+                    model for model in ("ST300", "ST30", "ST10") if model in markers
+                ]
         else:
             available_on = ["ST30", "ST10", "ST300"]
 
@@ -4,40 +4,64 @@ Extract and analyze Bose SoundTouch Web API documentation from PDF.
 """
 
 import re
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
+
+# Prefer pypdfium2 (native PDFium), fall back to PyPDF2
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
 try:
     from PyPDF2 import PdfReader
 except ImportError:
-    print("ERROR: PyPDF2 not installed. Run: pip install pypdf2")
+    PdfReader = None
+
+if pdfium is None and PdfReader is None:
+    print("ERROR: No PDF library installed. Run: pip install pypdfium2 (or pypdf2)")
     exit(1)
 
 
+def _extract_with_pdfium(pdf_path: Path) -> str:
+    """Extract all text from PDF using pypdfium2."""
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                parts.append(textpage.get_text_range() + "\n\n")
+            finally:
+                textpage.close()
+                page.close()
+        return "".join(parts)
+    finally:
+        pdf.close()
+
+
 def extract_pdf_text(pdf_path: Path) -> str:
     """Extract all text from PDF."""
     try:
+        if pdfium is not None:
+            return _extract_with_pdfium(pdf_path)
+
         reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n\n"
-        return text
+        return "".join(page.extract_text() + "\n\n" for page in reader.pages)
     except Exception as e:
         print(f"ERROR extracting PDF: {e}")
         return None
 
 
-def extract_endpoints(text: str) -> list:
-    """Extract endpoint definitions from documentation."""
-    endpoints = []
-
+def extract_endpoints(text: str) -> Iterator[dict]:
+    """Yield endpoint definitions from documentation."""
     # Look for patterns like: GET /info, POST /volume, etc.
     pattern = r"(GET|POST|PUT|DELETE)\s+(/[\w/]+)"
-    matches = re.findall(pattern, text)
 
-    for method, endpoint in matches:
-        endpoints.append({"method": method, "endpoint": endpoint.strip("/")})
-
-    return endpoints
+    for match in re.finditer(pattern, text):
+        method, endpoint = match.groups()
+        yield {"method": method, "endpoint": endpoint.strip("/")}
 
 
 def main():
@@ -67,36 +91,38 @@ def main():
     print("=" * 80)
     print(f"\nReading PDF: {pdf_path.name}")
 
-    # Extract text
-    text = extract_pdf_text(pdf_path)
+    output_dir = Path(__file__).parent / "official"
+    output_dir.mkdir(exist_ok=True)
+    text_file = output_dir / "bose_api_documentation.txt"
 
-    if not text:
-        print("ERROR: Failed to extract text from PDF")
-        return
+    # Reuse the saved raw text unless the PDF changed since it was written
+    if text_file.exists() and text_file.stat().st_mtime >= pdf_path.stat().st_mtime:
+        text = text_file.read_text(encoding="utf-8")
+        print(f"Using cached text: {text_file} ({len(text)} characters)")
+    else:
+        # Extract text
+        text = extract_pdf_text(pdf_path)
 
-    print(f"Extracted {len(text)} characters")
+        if not text:
+            print("ERROR: Failed to extract text from PDF")
+            return
 
-    # Save raw text for analysis
-    output_dir = Path(__file__).parent / "official"
-    output_dir.mkdir(exist_ok=True)
+        print(f"Extracted {len(text)} characters")
 
-    text_file = output_dir / "bose_api_documentation.txt"
-    text_file.write_text(text, encoding="utf-8")
-    print(f"Saved raw text to: {text_file}")
+        # Save raw text for analysis
+        text_file.write_text(text, encoding="utf-8")
+        print(f"Saved raw text to: {text_file}")
 
     # Extract endpoints
-    endpoints = extract_endpoints(text)
-    print(f"\nFound {len(endpoints)} endpoint references:")
+    unique_endpoints = {}
+    reference_count = 0
+    for ep in extract_endpoints(text):
+        unique_endpoints.setdefault(ep["endpoint"], []).append(ep["method"])
+        reference_count += 1
+    print(f"\nFound {reference_count} endpoint references:")
 
     endpoint_file = output_dir / "endpoints_from_pdf.txt"
     with endpoint_file.open("w", encoding="utf-8") as f:
-        unique_endpoints = {}
-        for ep in endpoints:
-            key = ep["endpoint"]
-            if key not in unique_endpoints:
-                unique_endpoints[key] = []
-            unique_endpoints[key].append(ep["method"])
-
         f.write("Endpoints found in Bose SoundTouch Web API Documentation\n")
         f.write("=" * 80 + "\n\n")
 
@@ -108,15 +134,18 @@ def main():
 
     # Look for XML examples
     xml_pattern = r"<[^>]+>.*?</[^>]+>"
-    xml_matches = re.findall(xml_pattern, text, re.DOTALL)
-    print(f"\nFound {len(xml_matches)} potential XML examples in PDF")
+    xml_iter = re.finditer(xml_pattern, text, re.DOTALL)
+    # Only the first 50 examples are written; the rest are just counted
+    xml_matches = [match.group(0) for match in islice(xml_iter, 50)]
+    xml_count = len(xml_matches) + sum(1 for _ in xml_iter)
+    print(f"\nFound {xml_count} potential XML examples in PDF")
 
     if xml_matches:
         xml_file = output_dir / "xml_examples_from_pdf.txt"
         with xml_file.open("w", encoding="utf-8") as f:
             f.write("XML Examples from Bose SoundTouch Web API Documentation\n")
             f.write("=" * 80 + "\n\n")
-            for i, xml in enumerate(xml_matches[:50], 1):  # First 50 examples
+            for i, xml in enumerate(xml_matches, 1):
                 f.write(f"Example {i}:\n{xml}\n\n")
         print(f"Saved XML examples to: {xml_file}")
 
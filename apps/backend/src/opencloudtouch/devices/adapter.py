@@ -3,12 +3,17 @@ Adapter for bosesoundtouchapi library
 Wraps external library with our internal device client interfaces
 """
 
+import asyncio
 import logging
 import os
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 from bosesoundtouchapi import SoundTouchClient as BoseClient
 from bosesoundtouchapi import SoundTouchDevice
+from urllib3 import PoolManager, Timeout
 
 from opencloudtouch.core.exceptions import DeviceConnectionError, DiscoveryError
 from opencloudtouch.devices.client import DeviceClient, DeviceInfo, NowPlayingInfo
@@ -17,16 +22,40 @@ from opencloudtouch.discovery import DeviceDiscovery, DiscoveredDevice
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class BoseDeviceDiscoveryAdapter(DeviceDiscovery):
-    """Adapter using SSDP discovery for compatible devices."""
+    """Adapter using SSDP discovery for compatible devices.
+
+    Scan results are cached on the class and shared by all instances: the
+    LAN changes rarely, while every SSDP scan blocks for the full timeout.
+    Results younger than FRESH_TTL are returned as-is. Results younger than
+    STALE_TTL are returned immediately while a background scan refreshes
+    them. Anything older is rescanned inline.
+    """
+
+    FRESH_TTL = 30.0  # seconds
+    STALE_TTL = 300.0  # seconds
 
-    async def discover(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    _cache: Optional[Tuple[float, List[DiscoveredDevice]]] = None
+    _refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached discovery results (next discover() scans again)."""
+        cls._cache = None
+        cls._refresh_task = None
+
+    async def discover(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """
         Discover compatible devices using SSDP.
 
         Args:
             timeout: Discovery timeout in seconds
+            force: Bypass cached results and always scan
 
         Returns:
             List of discovered devices (IP + Name only, details loaded lazily)
@@ -34,6 +63,40 @@ class BoseDeviceDiscoveryAdapter(DeviceDiscovery):
         Raises:
             DiscoveryError: If discovery fails
         """
+        cache = BoseDeviceDiscoveryAdapter._cache
+        if cache is not None and not force:
+            cached_at, devices = cache
+            age = time.monotonic() - cached_at
+            if age < self.FRESH_TTL:
+                logger.debug(f"Using cached discovery results ({age:.0f}s old)")
+                return list(devices)
+            if age < self.STALE_TTL:
+                logger.debug(
+                    f"Using stale discovery results ({age:.0f}s old), refreshing"
+                )
+                self._schedule_refresh(timeout)
+                return list(devices)
+
+        return list(await self._scan(timeout))
+
+    def _schedule_refresh(self, timeout: int) -> None:
+        """Start a background rescan unless one is already running."""
+        task = BoseDeviceDiscoveryAdapter._refresh_task
+        if task is not None and not task.done():
+            return
+        BoseDeviceDiscoveryAdapter._refresh_task = asyncio.create_task(
+            self._refresh(timeout)
+        )
+
+    async def _refresh(self, timeout: int) -> None:
+        """Background rescan; failures keep the stale results."""
+        try:
+            await self._scan(timeout)
+        except DiscoveryError as e:
+            logger.warning(f"Background discovery refresh failed: {e}")
+
+    async def _scan(self, timeout: int) -> List[DiscoveredDevice]:
+        """Run an SSDP scan and cache its results."""
         logger.info(f"Starting discovery via SSDP (timeout: {timeout}s)")
 
         try:
@@ -56,6 +119,7 @@ class BoseDeviceDiscoveryAdapter(DeviceDiscovery):
             logger.info(
                 f"Discovered {len(discovered)} device(s): {[d.name for d in discovered]}"
             )
+            BoseDeviceDiscoveryAdapter._cache = (time.monotonic(), discovered)
             return discovered
 
         except Exception as e:
@@ -83,13 +147,34 @@ class BoseDeviceClientAdapter(DeviceClient):
 
         parsed = urlparse(base_url)
         self.ip = parsed.hostname or base_url.split("://")[1].split(":")[0]
-        port = parsed.port or 8090
+        self.port = parsed.port or 8090
 
-        # Create SoundTouchDevice with connectTimeout parameter
-        # This initializes the device and loads info/capabilities
-        device = SoundTouchDevice(host=self.ip, connectTimeout=int(timeout), port=port)
+        # Created lazily in an executor: SoundTouchDevice queries the device
+        self._client: Optional[BoseClient] = None
+        self._client_lock = threading.Lock()
 
-        self._client = BoseClient(device)
+    def _ensure_client(self) -> BoseClient:
+        """
+        Return the library client, creating it on first use.
+
+        Blocking (SoundTouchDevice loads info/capabilities from the device),
+        so only call this from an executor thread.
+        """
+        with self._client_lock:
+            if self._client is None:
+                # Create SoundTouchDevice with connectTimeout parameter
+                device = SoundTouchDevice(
+                    host=self.ip, connectTimeout=int(self.timeout), port=self.port
+                )
+                self._client = BoseClient(
+                    device, manager=_get_http_manager(int(self.timeout))
+                )
+            return self._client
+
+    async def _run(self, call: Callable[[BoseClient], T]) -> T:
+        """Run a blocking BoseClient call in an executor, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: call(self._ensure_client()))
 
     def _extract_firmware_version(self, info) -> str:
         """Extract firmware version from Components list."""
@@ -121,7 +206,7 @@ class BoseDeviceClientAdapter(DeviceClient):
         try:
             # BoseClient.GetInformation() returns InfoElement
             # Properties: DeviceName, DeviceId, DeviceType, ModuleType, etc.
-            info = self._client.GetInformation()
+            info = await self._run(lambda client: client.GetInformation())
 
             firmware_version = self._extract_firmware_version(info)
             ip_address = self._extract_ip_address(info)
@@ -166,7 +251,7 @@ class BoseDeviceClientAdapter(DeviceClient):
         try:
             # BoseClient.GetNowPlayingStatus() returns NowPlayingStatus
             # Properties: Source, PlayStatus, StationName, Artist, Track, Album, ArtUrl
-            now_playing = self._client.GetNowPlayingStatus()
+            now_playing = await self._run(lambda client: client.GetNowPlayingStatus())
 
             # Map PlayStatus to our state format
             # BoseClient uses: PLAY_STATE, PAUSE_STATE, STOP_STATE, BUFFERING_STATE
@@ -229,7 +314,7 @@ class BoseDeviceClientAdapter(DeviceClient):
                 extra={"device_ip": self.ip, "key": key, "state": state},
             )
 
-            self._client.Action(key_enum, state_enum)
+            await self._run(lambda client: client.Action(key_enum, state_enum))
 
         except Exception as e:
             logger.error(
@@ -315,7 +400,7 @@ class BoseDeviceClientAdapter(DeviceClient):
             )
 
             # Call Bose API to program device
-            self._client.StorePreset(preset)
+            await self._run(lambda client: client.StorePreset(preset))
 
             logger.info(
                 f"✅ Bose device programmed with OCT BMX path: {playlist_url} → {stream_proxy_url}"
@@ -330,10 +415,65 @@ class BoseDeviceClientAdapter(DeviceClient):
 
     async def close(self) -> None:
         """Close client connections (no-op for bosesoundtouchapi)."""
-        # BoseClient doesn't require explicit cleanup
+        # BoseClient doesn't require explicit cleanup. Clients are shared via
+        # get_device_client, so callers closing after each use must not evict
+        # them; the LRU bound and clear_client_cache() handle eviction.
         pass
 
 
+MAX_CACHED_CLIENTS = 128
+
+# One urllib3 pool manager per connect timeout, shared by every BoseClient.
+# By default each BoseClient creates its own PoolManager; sharing one keeps
+# connections to a device alive across clients instead of reconnecting.
+# Settings match the library's own manager (maxsize=30, block=True, so
+# concurrent executor calls wait for a connection instead of discarding
+# them), except num_pools: one shared manager serves every device host.
+_http_managers: Dict[int, PoolManager] = {}
+_http_managers_lock = threading.Lock()  # clients are created in executor threads
+
+
+def _get_http_manager(connect_timeout: int) -> PoolManager:
+    """Return the shared HTTP pool manager for the given connect timeout."""
+    with _http_managers_lock:
+        manager = _http_managers.get(connect_timeout)
+        if manager is None:
+            manager = PoolManager(
+                headers={"User-Agent": "BoseSoundTouchApi/1.0.0"},
+                timeout=Timeout(connect=float(connect_timeout), read=None),
+                num_pools=MAX_CACHED_CLIENTS,  # one pool per device host
+                maxsize=30,  # connections kept per device
+                block=True,  # limit connections to each device
+            )
+            _http_managers[connect_timeout] = manager
+        return manager
+
+
+# Shared real-device clients, keyed by (base_url, timeout). Constructing one
+# queries the device for its info/capabilities, so reuse it across requests.
+_clients: "OrderedDict[Tuple[str, float], BoseDeviceClientAdapter]" = OrderedDict()
+
+
+def _get_cached_client(base_url: str, timeout: float) -> BoseDeviceClientAdapter:
+    """Return the shared client for a device, creating it on first use (LRU)."""
+    key = (base_url.rstrip("/"), timeout)
+    client = _clients.get(key)
+    if client is not None:
+        _clients.move_to_end(key)
+        return client
+
+    client = BoseDeviceClientAdapter(base_url=base_url, timeout=timeout)
+    _clients[key] = client
+    if len(_clients) > MAX_CACHED_CLIENTS:
+        _clients.popitem(last=False)
+    return client
+
+
+def clear_client_cache() -> None:
+    """Drop all shared device clients."""
+    _clients.clear()
+
+
 # ==================== FACTORY FUNCTIONS ====================
 
 
@@ -406,4 +546,4 @@ def get_device_client(base_url: str, timeout: float = 5.0) -> DeviceClient:
         return MockDeviceClient(device_id=device_id, ip_address=ip)
     else:
         logger.info(f"[REAL MODE] Using BoseDeviceClientAdapter for {base_url}")
-        return BoseDeviceClientAdapter(base_url=base_url, timeout=timeout)
+        return _get_cached_client(base_url, timeout)
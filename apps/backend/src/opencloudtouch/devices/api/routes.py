@@ -24,18 +24,23 @@ _discovery_lock = asyncio.Lock()
 
 @router.get("/discover")
 async def discover_devices(
+    force: bool = False,
     device_service: DeviceService = Depends(get_device_service),
 ) -> Dict[str, Any]:
     """
     Trigger device discovery.
 
+    Recent scan results are served from cache; pass ``force=true`` to rescan.
+
     Returns:
         List of discovered devices (not yet saved to DB)
     """
     cfg = get_config()
 
     try:
-        devices = await device_service.discover_devices(timeout=cfg.discovery_timeout)
+        devices = await device_service.discover_devices(
+            timeout=cfg.discovery_timeout, force=force
+        )
 
         return {
             "count": len(devices),
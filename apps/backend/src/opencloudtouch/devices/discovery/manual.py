@@ -23,12 +23,15 @@ class ManualDiscovery(DeviceDiscovery):
         """
         self.device_ips = device_ips
 
-    async def discover(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    async def discover(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """
         Create DiscoveredDevice entries from manual IP list.
 
         Args:
             timeout: Ignored for manual discovery
+            force: Ignored for manual discovery
 
         Returns:
             List of devices from manual IP list
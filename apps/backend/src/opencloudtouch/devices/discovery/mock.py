@@ -56,12 +56,15 @@ class MockDiscoveryAdapter(DeviceDiscovery):
         """
         self.timeout = timeout
 
-    async def discover(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    async def discover(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """
         Return predefined mock devices.
 
         Args:
             timeout: Ignored (for interface compatibility)
+            force: Ignored (for interface compatibility)
 
         Returns:
             List of DiscoveredDevice objects
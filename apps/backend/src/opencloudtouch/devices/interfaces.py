@@ -71,11 +71,14 @@ class IDiscoveryAdapter(Protocol):
     Implementations can use SSDP, UPnP, manual IPs, or mock data.
     """
 
-    async def discover(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    async def discover(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """Discover devices on the network.
 
         Args:
             timeout: Discovery timeout in seconds
+            force: Bypass any cached results
 
         Returns:
             List of discovered devices with basic info (IP, MAC, name)
@@ -55,13 +55,16 @@ class DeviceService:
         self.sync_service = sync_service
         self.discovery_adapter = discovery_adapter
 
-    async def discover_devices(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    async def discover_devices(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """Discover devices on the network.
 
         Uses SSDP/UPnP discovery to find Bose SoundTouch devices.
 
         Args:
             timeout: Discovery timeout in seconds
+            force: Bypass cached discovery results and rescan
 
         Returns:
             List of discovered devices
@@ -71,7 +74,7 @@ class DeviceService:
         """
         logger.info(f"Starting device discovery (timeout: {timeout}s)")
 
-        devices = await self.discovery_adapter.discover(timeout=timeout)
+        devices = await self.discovery_adapter.discover(timeout=timeout, force=force)
 
         logger.info(f"Discovery complete: {len(devices)} device(s) found")
 
@@ -3,6 +3,7 @@
 Orchestrates device discovery and database synchronization.
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -27,6 +28,8 @@ class DeviceSyncService:
     - Track sync success/failure statistics
     """
 
+    MAX_CONCURRENT_FETCHES = 32  # Upper bound on parallel /info requests
+
     def __init__(
         self,
         repository: IDeviceRepository,
@@ -129,6 +132,9 @@ class DeviceSyncService:
         """
         Query each discovered device and sync to database.
 
+        Devices are queried concurrently (up to MAX_CONCURRENT_FETCHES at a
+        time); database upserts are applied sequentially afterwards.
+
         Args:
             discovered: List of discovered devices
 
@@ -138,12 +144,25 @@ class DeviceSyncService:
         synced = 0
         failed = 0
 
-        for discovered_device in discovered:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        async def fetch(discovered_device: DiscoveredDevice) -> Device:
+            async with semaphore:
+                return await self._fetch_device_info(discovered_device)
+
+        results = await asyncio.gather(
+            *(fetch(discovered_device) for discovered_device in discovered),
+            return_exceptions=True,
+        )
+
+        for discovered_device, result in zip(discovered, results):
             try:
-                device = await self._fetch_device_info(discovered_device)
-                await self.repository.upsert(device)
+                # Fetch errors are re-raised here; cancellation is not caught below
+                if isinstance(result, BaseException):
+                    raise result
+                await self.repository.upsert(result)
                 synced += 1
-                logger.info(f"Synced device: {device.name} ({device.device_id})")
+                logger.info(f"Synced device: {result.name} ({result.device_id})")
             except Exception as e:
                 failed += 1
                 device_info = getattr(discovered_device, "ip", str(discovered_device))
@@ -164,6 +183,7 @@ class DeviceSyncService:
         Raises:
             Exception: If device query fails
         """
+        # Cheap: the client only contacts the device (in an executor) on use
         client = get_device_client(discovered.base_url)
         info = await client.get_info()
 
@@ -29,12 +29,15 @@ class DeviceDiscovery(ABC):
     """Abstract base class for device discovery mechanisms."""
 
     @abstractmethod
-    async def discover(self, timeout: int = 10) -> List[DiscoveredDevice]:
+    async def discover(
+        self, timeout: int = 10, force: bool = False
+    ) -> List[DiscoveredDevice]:
         """
         Discover compatible devices on the network.
 
         Args:
             timeout: Discovery timeout in seconds
+            force: Bypass any cached results
 
         Returns:
             List of discovered devices
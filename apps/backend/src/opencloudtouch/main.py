@@ -39,6 +39,7 @@ from opencloudtouch.presets.service import PresetService
 from opencloudtouch.presets.api.routes import router as presets_router
 from opencloudtouch.presets.api.station_routes import router as stations_router
 from opencloudtouch.presets.api.playlist_routes import router as playlist_router
+from opencloudtouch.radio.adapter import close_radio_adapter
 from opencloudtouch.radio.api.routes import router as radio_router
 from opencloudtouch.settings.repository import SettingsRepository
 from opencloudtouch.settings.routes import router as settings_router
@@ -137,6 +138,9 @@ async def lifespan(app: FastAPI):
     await preset_repo.close()
     logger.info("Preset repository closed")
 
+    await close_radio_adapter()
+    logger.info("Radio adapter closed")
+
     logger.info("OpenCloudTouch shutting down")
 
 
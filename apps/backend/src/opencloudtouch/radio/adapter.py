@@ -7,18 +7,26 @@ Based on OCT_MOCK_MODE environment variable.
 
 import logging
 import os
+from typing import TYPE_CHECKING, Optional
 
 from opencloudtouch.radio.provider import RadioProvider
 
+if TYPE_CHECKING:
+    from opencloudtouch.radio.providers.radiobrowser import RadioBrowserAdapter
+
 logger = logging.getLogger(__name__)
 
+# Process-wide RadioBrowserAdapter so its HTTP connections are reused
+_radiobrowser_adapter: Optional["RadioBrowserAdapter"] = None
+
 
 def get_radio_adapter() -> RadioProvider:
     """
     Factory function: Select Mock or Real radio provider.
 
     Returns:
-        RadioProvider: MockRadioAdapter if OCT_MOCK_MODE=true, else RadioBrowserAdapter
+        RadioProvider: MockRadioAdapter if OCT_MOCK_MODE=true, else the shared
+        RadioBrowserAdapter instance
 
     Decision Flow:
         1. Check OCT_MOCK_MODE env var
@@ -41,7 +49,19 @@ def get_radio_adapter() -> RadioProvider:
 
         return MockRadioAdapter()
 
-    logger.info("[FACTORY] Creating RadioBrowserAdapter (OCT_MOCK_MODE=false)")
-    from opencloudtouch.radio.providers.radiobrowser import RadioBrowserAdapter
+    global _radiobrowser_adapter
+    if _radiobrowser_adapter is None:
+        logger.info("[FACTORY] Creating RadioBrowserAdapter (OCT_MOCK_MODE=false)")
+        from opencloudtouch.radio.providers.radiobrowser import RadioBrowserAdapter
+
+        _radiobrowser_adapter = RadioBrowserAdapter()
+
+    return _radiobrowser_adapter
+
 
-    return RadioBrowserAdapter()
+async def close_radio_adapter() -> None:
+    """Close the shared RadioBrowserAdapter, if one was created."""
+    global _radiobrowser_adapter
+    if _radiobrowser_adapter is not None:
+        await _radiobrowser_adapter.aclose()
+        _radiobrowser_adapter = None
@@ -6,7 +6,7 @@ must follow. Supports RadioBrowser, TuneIn, Music Assistant, etc.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Sequence
 
 from opencloudtouch.radio.models import RadioStation
 
@@ -49,7 +49,9 @@ class RadioProvider(ABC):
         pass
 
     @abstractmethod
-    async def search_by_name(self, name: str, limit: int = 20) -> List[RadioStation]:
+    async def search_by_name(
+        self, name: str, limit: int = 20
+    ) -> Sequence[RadioStation]:
         """
         Search stations by name.
 
@@ -58,7 +60,7 @@ class RadioProvider(ABC):
             limit: Maximum number of results
 
         Returns:
-            List of RadioStation objects
+            Sequence of RadioStation objects
 
         Raises:
             RadioProviderError: On provider-specific errors
@@ -70,7 +72,7 @@ class RadioProvider(ABC):
     @abstractmethod
     async def search_by_country(
         self, country: str, limit: int = 20
-    ) -> List[RadioStation]:
+    ) -> Sequence[RadioStation]:
         """
         Search stations by country.
 
@@ -79,7 +81,7 @@ class RadioProvider(ABC):
             limit: Maximum number of results
 
         Returns:
-            List of RadioStation objects
+            Sequence of RadioStation objects
 
         Raises:
             RadioProviderError: On provider-specific errors
@@ -87,7 +89,7 @@ class RadioProvider(ABC):
         pass
 
     @abstractmethod
-    async def search_by_tag(self, tag: str, limit: int = 20) -> List[RadioStation]:
+    async def search_by_tag(self, tag: str, limit: int = 20) -> Sequence[RadioStation]:
         """
         Search stations by genre/tag.
 
@@ -96,7 +98,7 @@ class RadioProvider(ABC):
             limit: Maximum number of results
 
         Returns:
-            List of RadioStation objects
+            Sequence of RadioStation objects
 
         Raises:
             RadioProviderError: On provider-specific errors
@@ -7,18 +7,35 @@ Provides access to 30,000+ community-maintained radio stations worldwide.
 API Documentation: https://api.radio-browser.info/
 
 Features:
-- Async HTTP client with retry logic
+- Shared async HTTP client (keep-alive) with retry logic
 - Exponential backoff on failures
+- Short-lived in-memory response cache (TTL + LRU)
+- Client-side concurrency cap and token-bucket rate limiting
 - Multiple API server support
 - Provider abstraction for easy extension
 """
 
 import asyncio
+import operator
 import random
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import httpx
+import orjson
 
 from opencloudtouch.radio.models import RadioStation
 
@@ -42,7 +59,117 @@ class RadioBrowserConnectionError(RadioBrowserError):
     pass
 
 
-@dataclass
+# httpx exception -> (RadioBrowser exception, message template).
+# Looked up along the raised exception's MRO, so subclasses such as
+# httpx.ConnectTimeout resolve to their nearest mapped base.
+_EXC_MAP: Dict[type, Tuple[Type[RadioBrowserError], str]] = {
+    httpx.TimeoutException: (RadioBrowserTimeoutError, "Request timed out: {exc}"),
+    httpx.ConnectError: (RadioBrowserConnectionError, "Connection failed: {exc}"),
+    httpx.HTTPStatusError: (
+        RadioBrowserError,
+        "HTTP error {exc.response.status_code}: {exc.response.text}",
+    ),
+}
+
+
+def _translate_httpx_error(exc: httpx.HTTPError) -> RadioBrowserError:
+    """Map an httpx exception to the matching RadioBrowser exception."""
+    for exc_type in type(exc).__mro__:
+        mapped = _EXC_MAP.get(exc_type)
+        if mapped is not None:
+            error_cls, template = mapped
+            return error_cls(template.format(exc=exc))
+    return RadioBrowserError(f"HTTP error: {exc}")
+
+
+T = TypeVar("T")
+
+
+async def _gather_or_cancel(aws: Iterable[Awaitable[T]]) -> List[T]:
+    """Like asyncio.gather, but cancel the remaining tasks once one fails.
+
+    Plain gather lets the other requests run on (holding semaphore and
+    rate-limit slots) even though their results are thrown away.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Wait until the cancelled requests have released their slots
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+# Status codes worth retrying: rate limiting and transient server errors.
+# Anything else (e.g. 404 for an unknown station) fails immediately.
+_RETRIABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retriable(exc: httpx.HTTPError) -> bool:
+    """Return True if a request failing with exc may succeed when retried."""
+    if isinstance(exc, (httpx.TimeoutException, httpx.ConnectError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRIABLE_STATUS
+    return False
+
+
+# API field mapping for RadioBrowserStation.from_api_response:
+# (attribute name, API key) pairs, grouped by how the value is read.
+_REQUIRED_API_FIELDS = (
+    ("station_uuid", "stationuuid"),
+    ("name", "name"),
+    ("url", "url"),
+    ("country", "country"),
+    ("codec", "codec"),
+)
+_OPTIONAL_API_FIELDS = (
+    ("url_resolved", "url_resolved"),
+    ("homepage", "homepage"),
+    ("favicon", "favicon"),
+    ("tags", "tags"),
+    ("countrycode", "countrycode"),
+    ("state", "state"),
+    ("language", "language"),
+    ("languagecodes", "languagecodes"),
+    ("votes", "votes"),
+    ("bitrate", "bitrate"),
+    ("clickcount", "clickcount"),
+    ("clicktrend", "clicktrend"),
+)
+_FLAG_API_FIELDS = (
+    ("hls", "hls"),
+    ("lastcheckok", "lastcheckok"),
+)
+
+
+class _TokenBucket:
+    """Token bucket that hands out request slots at a fixed rate.
+
+    Tokens may go negative: each caller reserves the next free slot and is
+    told how long to wait for it, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+@dataclass(slots=True)
 class RadioBrowserStation:
     """Represents a radio station from RadioBrowser API (internal model)."""
 
@@ -66,30 +193,31 @@ class RadioBrowserStation:
     clickcount: Optional[int] = None
     clicktrend: Optional[int] = None
 
-    @staticmethod
-    def from_api_response(data: Dict[str, Any]) -> "RadioBrowserStation":
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "RadioBrowserStation":
         """Create RadioBrowserStation from API response dict."""
-        return RadioBrowserStation(
-            station_uuid=data["stationuuid"],
-            name=data["name"],
-            url=data["url"],
-            url_resolved=data.get("url_resolved"),
-            homepage=data.get("homepage"),
-            favicon=data.get("favicon"),
-            tags=data.get("tags"),
-            country=data["country"],
-            countrycode=data.get("countrycode"),
-            state=data.get("state"),
-            language=data.get("language"),
-            languagecodes=data.get("languagecodes"),
-            votes=data.get("votes"),
-            codec=data["codec"],
-            bitrate=data.get("bitrate"),
-            hls=bool(data.get("hls", 0)),
-            lastcheckok=bool(data.get("lastcheckok", 0)),
-            clickcount=data.get("clickcount"),
-            clicktrend=data.get("clicktrend"),
-        )
+        values = {attr: data[key] for attr, key in _REQUIRED_API_FIELDS}
+        values.update((attr, data.get(key)) for attr, key in _OPTIONAL_API_FIELDS)
+        values.update((attr, bool(data.get(key, 0))) for attr, key in _FLAG_API_FIELDS)
+        return cls(**values)
+
+    @classmethod
+    def from_api_responses(
+        cls, rows: Iterable[Dict[str, Any]]
+    ) -> List["RadioBrowserStation"]:
+        """Create RadioBrowserStations from a list of API response dicts.
+
+        Equivalent to calling from_api_response per row, but pulls all
+        fields with a single itemgetter call and builds positionally,
+        which is noticeably faster for large search results.
+        """
+        stations = []
+        for row in rows:
+            values = list(_API_ROW_GETTER({**_API_ROW_DEFAULTS, **row}))
+            for i in _API_FLAG_POSITIONS:
+                values[i] = bool(values[i])
+            stations.append(cls(*values))
+        return stations
 
     def to_unified(self) -> RadioStation:
         """Convert RadioBrowserStation to unified RadioStation model."""
@@ -112,6 +240,21 @@ class RadioBrowserStation:
         )
 
 
+# Bulk parsing for RadioBrowserStation.from_api_responses: the API keys in
+# dataclass field order, defaults for the keys a row may omit, and the
+# positions of the flag fields that need converting to bool.
+_API_KEY_BY_ATTR = dict(_REQUIRED_API_FIELDS + _OPTIONAL_API_FIELDS + _FLAG_API_FIELDS)
+_API_FIELD_ORDER = [f.name for f in fields(RadioBrowserStation)]
+_API_ROW_GETTER = operator.itemgetter(
+    *(_API_KEY_BY_ATTR[attr] for attr in _API_FIELD_ORDER)
+)
+_API_ROW_DEFAULTS: Dict[str, Any] = {key: None for _, key in _OPTIONAL_API_FIELDS}
+_API_ROW_DEFAULTS.update((key, 0) for _, key in _FLAG_API_FIELDS)
+_API_FLAG_POSITIONS = tuple(
+    _API_FIELD_ORDER.index(attr) for attr, _ in _FLAG_API_FIELDS
+)
+
+
 class RadioBrowserAdapter:
     """
     Adapter for RadioBrowser.info API.
@@ -129,19 +272,99 @@ class RadioBrowserAdapter:
         "https://at1.api.radio-browser.info",
     ]
 
-    def __init__(self, timeout: float = 10.0, max_retries: int = 3):
+    # Maximum UUIDs per /json/stations/byuuid request
+    UUID_BATCH_SIZE = 100
+
+    # Upper bound on cached responses (least recently used are evicted first)
+    CACHE_MAX_ENTRIES = 256
+
+    # Requests allowed back-to-back before the rate limit kicks in
+    RATE_LIMIT_BURST = 5
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        cache_ttl: float = 300.0,
+        max_concurrent: int = 8,
+        requests_per_second: float = 5.0,
+    ):
         """
         Initialize RadioBrowser adapter.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache_ttl: Seconds a successful response is served from cache
+                (0 disables caching)
+            max_concurrent: Maximum number of requests in flight at once
+            requests_per_second: Sustained request rate towards the API
+                (0 disables rate limiting)
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple[str, frozenset], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
         self.base_url = random.choice(self.API_SERVERS)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._rate: Optional[_TokenBucket] = (
+            _TokenBucket(requests_per_second, self.RATE_LIMIT_BURST)
+            if requests_per_second > 0
+            else None
+        )
+        # Injectable so tests can observe backoff without patching asyncio.sleep
+        self._sleep = asyncio.sleep
+        self._backoff_base = 0.5
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
 
-    async def search_by_name(self, name: str, limit: int = 10) -> List[RadioStation]:
+        A single long-lived client keeps connections alive between calls,
+        so repeated searches don't pay a new TCP/TLS handshake each time.
+        """
+        if self._client is None:
+            # trust_env=False to avoid Windows proxy/DNS issues
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                trust_env=False,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=64),
+            )
+        return self._client
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with a little jitter, capped at 10 seconds."""
+        return min(self._backoff_base * 2**attempt + random.random() * 0.1, 10.0)
+
+    async def _throttle(self) -> None:
+        """Wait for a rate-limit slot before sending a request."""
+        if self._rate is None:
+            return
+        delay = self._rate.reserve()
+        if delay > 0:
+            await self._sleep(delay)
+
+    def _store_cached(self, key: Tuple[str, frozenset], data: Any) -> None:
+        """Remember a parsed response, evicting the oldest entry when full."""
+        if self.cache_ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic(), data)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (safe to call more than once)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def search_by_name(
+        self, name: str, limit: int = 10
+    ) -> Tuple[RadioStation, ...]:
         """
         Search stations by name.
 
@@ -150,29 +373,23 @@ class RadioBrowserAdapter:
             limit: Maximum number of results
 
         Returns:
-            List of matching RadioStation objects
+            Tuple of matching RadioStation objects
         """
         endpoint = f"/json/stations/byname/{name}"
         params = {"limit": limit}
 
         try:
             data = await self._make_request(endpoint, params)
-            return [
-                RadioBrowserStation.from_api_response(item).to_unified()
-                for item in data
-            ]
-        except httpx.TimeoutException as e:
-            raise RadioBrowserTimeoutError(f"Request timed out: {e}") from e
-        except httpx.ConnectError as e:
-            raise RadioBrowserConnectionError(f"Connection failed: {e}") from e
-        except httpx.HTTPStatusError as e:
-            raise RadioBrowserError(
-                f"HTTP error {e.response.status_code}: {e.response.text}"
-            ) from e
+            return tuple(
+                station.to_unified()
+                for station in RadioBrowserStation.from_api_responses(data)
+            )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
 
     async def search_by_country(
         self, country: str, limit: int = 10
-    ) -> List[RadioStation]:
+    ) -> Tuple[RadioStation, ...]:
         """
         Search stations by country.
 
@@ -181,27 +398,23 @@ class RadioBrowserAdapter:
             limit: Maximum number of results
 
         Returns:
-            List of matching RadioStation objects
+            Tuple of matching RadioStation objects
         """
         endpoint = f"/json/stations/bycountry/{country}"
         params = {"limit": limit}
 
         try:
             data = await self._make_request(endpoint, params)
-            return [
-                RadioBrowserStation.from_api_response(item).to_unified()
-                for item in data
-            ]
-        except httpx.TimeoutException as e:
-            raise RadioBrowserTimeoutError(f"Request timed out: {e}") from e
-        except httpx.ConnectError as e:
-            raise RadioBrowserConnectionError(f"Connection failed: {e}") from e
-        except httpx.HTTPStatusError as e:
-            raise RadioBrowserError(
-                f"HTTP error {e.response.status_code}: {e.response.text}"
-            ) from e
-
-    async def search_by_tag(self, tag: str, limit: int = 10) -> List[RadioStation]:
+            return tuple(
+                station.to_unified()
+                for station in RadioBrowserStation.from_api_responses(data)
+            )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
+
+    async def search_by_tag(
+        self, tag: str, limit: int = 10
+    ) -> Tuple[RadioStation, ...]:
         """
         Search stations by tag/genre.
 
@@ -210,25 +423,19 @@ class RadioBrowserAdapter:
             limit: Maximum number of results
 
         Returns:
-            List of matching RadioStation objects
+            Tuple of matching RadioStation objects
         """
         endpoint = f"/json/stations/bytag/{tag}"
         params = {"limit": limit}
 
         try:
             data = await self._make_request(endpoint, params)
-            return [
-                RadioBrowserStation.from_api_response(item).to_unified()
-                for item in data
-            ]
-        except httpx.TimeoutException as e:
-            raise RadioBrowserTimeoutError(f"Request timed out: {e}") from e
-        except httpx.ConnectError as e:
-            raise RadioBrowserConnectionError(f"Connection failed: {e}") from e
-        except httpx.HTTPStatusError as e:
-            raise RadioBrowserError(
-                f"HTTP error {e.response.status_code}: {e.response.text}"
-            ) from e
+            return tuple(
+                station.to_unified()
+                for station in RadioBrowserStation.from_api_responses(data)
+            )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
 
     async def get_station_by_uuid(self, uuid: str) -> RadioStation:
         """
@@ -243,25 +450,47 @@ class RadioBrowserAdapter:
         Raises:
             RadioBrowserError: If station not found
         """
-        endpoint = f"/json/stations/byuuid/{uuid}"
+        stations = await self.get_stations_by_uuids([uuid])
+
+        if not stations:
+            raise RadioBrowserError(f"Station {uuid} not found")
+
+        return stations[0]
+
+    async def get_stations_by_uuids(
+        self, uuids: Sequence[str]
+    ) -> Tuple[RadioStation, ...]:
+        """
+        Get several stations by UUID using batched requests.
+
+        UUIDs are sent comma-separated, UUID_BATCH_SIZE per request, and the
+        batches are fetched concurrently. Unknown UUIDs are simply absent
+        from the result.
+
+        Args:
+            uuids: Station UUIDs
+
+        Returns:
+            Tuple of RadioStation objects for the UUIDs that exist
+        """
+        batches = [
+            uuids[i : i + self.UUID_BATCH_SIZE]
+            for i in range(0, len(uuids), self.UUID_BATCH_SIZE)
+        ]
 
         try:
-            data = await self._make_request(endpoint)
-
-            if not data:
-                raise RadioBrowserError(f"Station {uuid} not found")
-
-            # API returns list, take first item
-            station_data = data[0] if isinstance(data, list) else data
-            return RadioBrowserStation.from_api_response(station_data).to_unified()
-        except httpx.TimeoutException as e:
-            raise RadioBrowserTimeoutError(f"Request timed out: {e}") from e
-        except httpx.ConnectError as e:
-            raise RadioBrowserConnectionError(f"Connection failed: {e}") from e
-        except httpx.HTTPStatusError as e:
-            raise RadioBrowserError(
-                f"HTTP error {e.response.status_code}: {e.response.text}"
-            ) from e
+            results = await _gather_or_cancel(
+                self._make_request("/json/stations/byuuid", {"uuids": ",".join(batch)})
+                for batch in batches
+            )
+        except httpx.HTTPError as e:
+            raise _translate_httpx_error(e) from e
+
+        return tuple(
+            station.to_unified()
+            for data in results
+            for station in RadioBrowserStation.from_api_responses(data)
+        )
 
     async def _make_request(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -281,24 +510,28 @@ class RadioBrowserAdapter:
             RadioBrowserTimeoutError: On timeout
             RadioBrowserConnectionError: On connection errors
         """
-        url = f"{self.base_url}{endpoint}"
-
-        # trust_env=False to avoid Windows proxy/DNS issues
-        async with httpx.AsyncClient(timeout=self.timeout, trust_env=False) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    response = await client.get(url, params=params or {})
-                    response.raise_for_status()
-                    return response.json()
-                except (httpx.TimeoutException, httpx.ConnectError):
-                    if attempt < self.max_retries - 1:
-                        # Exponential backoff
-                        wait_time = 2**attempt
-                        await asyncio.sleep(wait_time)
-                        continue
-                    raise
-                except httpx.HTTPStatusError:
-                    raise
+        cache_key = (endpoint, frozenset((params or {}).items()))
+        cached = self._cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            self._cache.move_to_end(cache_key)
+            return cached[1]
+
+        client = self._get_client()
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._sem:
+                    await self._throttle()
+                    response = await client.get(endpoint, params=params or {})
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                self._store_cached(cache_key, data)
+                return data
+            except httpx.HTTPError as e:
+                if attempt < self.max_retries - 1 and _is_retriable(e):
+                    await self._sleep(self._backoff_delay(attempt))
+                    continue
+                raise
 
         # Should not reach here
         raise RadioBrowserError("Request failed after retries")
@@ -13,9 +13,10 @@ from opencloudtouch.settings.repository import SettingsRepository
 logger = logging.getLogger(__name__)
 
 # IP address validation regex (xxx.xxx.xxx.xxx where xxx = 0-255)
+# Used with fullmatch(): "$" alone would also accept a trailing newline.
 IP_PATTERN = re.compile(
-    r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
-    r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
+    r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
+    r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
 )
 
 
@@ -51,7 +52,7 @@ class SettingsService:
         if not ip or not ip.strip():
             raise ValueError("Invalid IP address: empty string")
 
-        if not IP_PATTERN.match(ip):
+        if not IP_PATTERN.fullmatch(ip):
             raise ValueError(f"Invalid IP address: {ip}")
 
     async def get_manual_ips(self) -> List[str]:
@@ -93,7 +94,7 @@ class SettingsService:
     async def set_manual_ips(self, ips: List[str]) -> List[str]:
         """Set all manual device IP addresses (replace operation).
 
-        Replaces existing manual IPs with new list.
+        Replaces existing manual IPs with new list, stored in the given order.
         Validates all IPs before making any changes (transactional).
 
         Args:
@@ -117,15 +118,25 @@ class SettingsService:
             f"(from {len(ips)} provided)"
         )
 
-        # Get existing IPs
+        # Only touch IPs that actually change. Stored IPs are returned in
+        # insertion order, so kept IPs stay in place only up to the first
+        # position where the new order diverges; everything after is re-added.
         existing_ips = await self.repository.get_manual_ips()
+        wanted_set = set(unique_ips)
+        kept_ips = [ip for ip in existing_ips if ip in wanted_set]
+
+        in_place = 0
+        for kept_ip, wanted_ip in zip(kept_ips, unique_ips):
+            if kept_ip != wanted_ip:
+                break
+            in_place += 1
+        in_place_set = set(unique_ips[:in_place])
 
-        # Remove all existing IPs
         for ip in existing_ips:
-            await self.repository.remove_manual_ip(ip)
+            if ip not in in_place_set:
+                await self.repository.remove_manual_ip(ip)
 
-        # Add new IPs
-        for ip in unique_ips:
+        for ip in unique_ips[in_place:]:
             await self.repository.add_manual_ip(ip)
 
         logger.info(f"Manual IPs updated: {unique_ips}")
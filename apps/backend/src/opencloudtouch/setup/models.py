@@ -5,9 +5,14 @@ Data models for the device setup/configuration process.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+
+# Source of SetupProgress.started_at defaults; tests may swap in a fixed clock
+_clock = datetime.utcnow
 
 
 class SetupStatus(str, Enum):
@@ -32,7 +37,7 @@ class SetupStep(str, Enum):
     COMPLETE = "complete"  # Setup complete
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupProgress:
     """Progress of an ongoing setup process."""
 
@@ -41,7 +46,7 @@ class SetupProgress:
     status: SetupStatus
     message: str = ""
     error: Optional[str] = None
-    started_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime = field(default_factory=lambda: _clock())
     completed_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
@@ -59,7 +64,7 @@ class SetupProgress:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelInstructions:
     """Model-specific setup instructions and purchase recommendations."""
 
@@ -87,7 +92,7 @@ class ModelInstructions:
 
 
 # Model-specific instructions database
-MODEL_INSTRUCTIONS: dict[str, ModelInstructions] = {
+_MODEL_INSTRUCTIONS: dict[str, ModelInstructions] = {
     "SoundTouch 10": ModelInstructions(
         model_name="SoundTouch 10",
         display_name="Bose SoundTouch 10",
@@ -169,6 +174,11 @@ MODEL_INSTRUCTIONS: dict[str, ModelInstructions] = {
     ),
 }
 
+# Read-only view; callers can share it without defensive copies
+MODEL_INSTRUCTIONS: Mapping[str, ModelInstructions] = MappingProxyType(
+    _MODEL_INSTRUCTIONS
+)
+
 # Default instructions for unknown models
 DEFAULT_INSTRUCTIONS = ModelInstructions(
     model_name="Unknown",
@@ -184,15 +194,24 @@ DEFAULT_INSTRUCTIONS = ModelInstructions(
 )
 
 
+# Lowercased keys for partial matching, in MODEL_INSTRUCTIONS order
+_LC_MODEL_INDEX = tuple(
+    (key.lower(), instructions) for key, instructions in MODEL_INSTRUCTIONS.items()
+)
+
+
+# Bounded: model_name comes straight from the request path
+@lru_cache(maxsize=256)
 def get_model_instructions(model_name: str) -> ModelInstructions:
     """Get setup instructions for a specific model."""
     # Try exact match first
     if model_name in MODEL_INSTRUCTIONS:
         return MODEL_INSTRUCTIONS[model_name]
 
-    # Try partial match
-    for key, instructions in MODEL_INSTRUCTIONS.items():
-        if key.lower() in model_name.lower() or model_name.lower() in key.lower():
+    # Try partial match (case-insensitive, either direction)
+    query = model_name.lower()
+    for key, instructions in _LC_MODEL_INDEX:
+        if key in query or query in key:
             return instructions
 
     # Return default
@@ -5,18 +5,36 @@ Endpoints for device setup wizard and configuration.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
 from pydantic import BaseModel
 
 from opencloudtouch.setup.service import SetupService, get_setup_service
-from opencloudtouch.setup.models import SetupStatus
+from opencloudtouch.setup.models import (
+    DEFAULT_INSTRUCTIONS,
+    MODEL_INSTRUCTIONS,
+    ModelInstructions,
+    SetupStatus,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/setup", tags=["Device Setup"])
 
+# MODEL_INSTRUCTIONS is static, so the /models body is serialized once
+_MODELS_JSON = orjson.dumps(
+    {"models": [instructions.to_dict() for instructions in MODEL_INSTRUCTIONS.values()]}
+)
+
+# Pre-serialized /instructions bodies: model_name -> (instructions, JSON bytes).
+# Used only when the service hands back that exact table entry.
+_INSTRUCTIONS_JSON = {
+    instructions.model_name: (instructions, orjson.dumps(instructions.to_dict()))
+    for instructions in (*MODEL_INSTRUCTIONS.values(), DEFAULT_INSTRUCTIONS)
+}
+
 
 class SetupRequest(BaseModel):
     """Request to start device setup."""
@@ -32,11 +50,21 @@ class ConnectivityCheckRequest(BaseModel):
     ip: str
 
 
-@router.get("/instructions/{model}")
+class SupportedModelsResponse(BaseModel):
+    """Response body of GET /models (documents the pre-serialized bytes)."""
+
+    models: List[ModelInstructions]
+
+
+@router.get(
+    "/instructions/{model}",
+    response_class=Response,
+    responses={200: {"model": ModelInstructions}},
+)
 async def get_instructions(
     model: str,
     setup_service: SetupService = Depends(get_setup_service),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get model-specific setup instructions.
 
@@ -44,7 +72,12 @@ async def get_instructions(
         Instructions including USB port location, adapter recommendations, etc.
     """
     instructions = setup_service.get_model_instructions(model)
-    return instructions.to_dict()
+    cached = _INSTRUCTIONS_JSON.get(instructions.model_name)
+    if cached is not None and cached[0] is instructions:
+        content = cached[1]
+    else:
+        content = orjson.dumps(instructions.to_dict())
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/check-connectivity")
@@ -141,15 +174,13 @@ async def verify_setup(
     return await setup_service.verify_setup(ip)
 
 
-@router.get("/models")
-async def list_supported_models() -> Dict[str, Any]:
+@router.get(
+    "/models",
+    response_class=Response,
+    responses={200: {"model": SupportedModelsResponse}},
+)
+async def list_supported_models() -> Response:
     """
     Get list of all supported models with their instructions.
     """
-    from opencloudtouch.setup.models import MODEL_INSTRUCTIONS
-
-    return {
-        "models": [
-            instructions.to_dict() for instructions in MODEL_INSTRUCTIONS.values()
-        ]
-    }
+    return Response(content=_MODELS_JSON, media_type="application/json")
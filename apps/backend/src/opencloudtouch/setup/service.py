@@ -40,9 +40,13 @@ class SetupService:
     Handles the full setup flow from SSH connection to BMX URL modification.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        ssh_client_factory: Callable[[str], SoundTouchSSHClient] = SoundTouchSSHClient,
+    ):
         self._active_setups: Dict[str, SetupProgress] = {}
         self._config = get_config()
+        self._ssh_client_factory = ssh_client_factory
 
     def get_setup_status(self, device_id: str) -> Optional[SetupProgress]:
         """Get current setup status for a device."""
@@ -110,7 +114,7 @@ class SetupService:
             # Step 1: Connect via SSH
             await update_progress(SetupStep.SSH_CONNECT, "Verbinde via SSH...")
 
-            client = SoundTouchSSHClient(ip)
+            client = self._ssh_client_factory(ip)
             conn_result = await client.connect(timeout=15.0)
 
             if not conn_result.success:
@@ -286,7 +290,7 @@ class SetupService:
             return result
 
         try:
-            client = SoundTouchSSHClient(ip)
+            client = self._ssh_client_factory(ip)
             await client.connect(timeout=10.0)
 
             # Check SSH persistence
@@ -38,6 +38,21 @@ warnings.filterwarnings(
 # Shared fixtures with optimized scopes for parallel execution
 
 
+@pytest.fixture(autouse=True)
+def clear_device_adapter_caches():
+    """Keep cached SSDP results and device clients from leaking between tests."""
+    from opencloudtouch.devices.adapter import (
+        BoseDeviceDiscoveryAdapter,
+        clear_client_cache,
+    )
+
+    BoseDeviceDiscoveryAdapter.clear_cache()
+    clear_client_cache()
+    yield
+    BoseDeviceDiscoveryAdapter.clear_cache()
+    clear_client_cache()
+
+
 @pytest.fixture(scope="session")
 def test_config():
     """Shared test configuration (session scope for parallel workers)."""
@@ -7,13 +7,13 @@ from fastapi.testclient import TestClient
 
 from opencloudtouch.core.dependencies import get_settings_service
 from opencloudtouch.main import app
+from opencloudtouch.settings.service import SettingsService
 
 
 @pytest.fixture
 def mock_settings_service():
-    """Mock settings service."""
-    service = AsyncMock()
-    return service
+    """Mock settings service (specced, so misspelled methods fail)."""
+    return AsyncMock(spec=SettingsService)
 
 
 @pytest.fixture
@@ -288,6 +288,15 @@ class TestDiscoverEndpoint:
         assert data["count"] == 0
         assert data["devices"] == []
 
+    def test_discover_force_bypasses_cache(self, client, mock_device_service):
+        """Test that ?force=true is passed through to rescan."""
+        mock_device_service.discover_devices = AsyncMock(return_value=[])
+
+        response = client.get("/api/devices/discover?force=true")
+
+        assert response.status_code == 200
+        assert mock_device_service.discover_devices.call_args.kwargs["force"] is True
+
     def test_discover_with_manual_ips(self, client, mock_device_service):
         """Test discovery combining SSDP and manual IPs.
 
@@ -2,6 +2,7 @@
 Tests for Device Adapter
 """
 
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -82,6 +83,62 @@ async def test_discovery_error():
         assert "Network error" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_discovery_reuses_fresh_results():
+    """Test that a second discovery within FRESH_TTL does not rescan."""
+    discovery = BoseDeviceDiscoveryAdapter()
+    mock_devices = {"AA:BB:CC:11:22:33": {"ip": "192.168.1.100", "name": "Kitchen"}}
+
+    with patch("opencloudtouch.devices.adapter.SSDPDiscovery") as mock_ssdp_class:
+        mock_ssdp_class.return_value.discover = AsyncMock(return_value=mock_devices)
+
+        first = await discovery.discover()
+        second = await BoseDeviceDiscoveryAdapter().discover()
+
+        assert second == first
+        mock_ssdp_class.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_discovery_serves_stale_results_and_refreshes():
+    """Test stale-while-revalidate: stale list returned, rescan in background."""
+    discovery = BoseDeviceDiscoveryAdapter()
+    stale = [DiscoveredDevice(ip="192.168.1.50", name="Old")]
+    BoseDeviceDiscoveryAdapter._cache = (
+        time.monotonic() - BoseDeviceDiscoveryAdapter.FRESH_TTL - 1,
+        stale,
+    )
+    mock_devices = {"AA:BB:CC:11:22:33": {"ip": "192.168.1.100", "name": "Kitchen"}}
+
+    with patch("opencloudtouch.devices.adapter.SSDPDiscovery") as mock_ssdp_class:
+        mock_ssdp_class.return_value.discover = AsyncMock(return_value=mock_devices)
+
+        devices = await discovery.discover()
+        assert devices == stale
+
+        await BoseDeviceDiscoveryAdapter._refresh_task
+        refreshed = await discovery.discover()
+
+        assert [d.ip for d in refreshed] == ["192.168.1.100"]
+        mock_ssdp_class.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_discovery_force_bypasses_cache():
+    """Test that force=True rescans even with fresh cached results."""
+    discovery = BoseDeviceDiscoveryAdapter()
+    BoseDeviceDiscoveryAdapter._cache = (time.monotonic(), [])
+    mock_devices = {"AA:BB:CC:11:22:33": {"ip": "192.168.1.100", "name": "Kitchen"}}
+
+    with patch("opencloudtouch.devices.adapter.SSDPDiscovery") as mock_ssdp_class:
+        mock_ssdp_class.return_value.discover = AsyncMock(return_value=mock_devices)
+
+        devices = await discovery.discover(force=True)
+
+        assert len(devices) == 1
+        mock_ssdp_class.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_discovery_address_parsing():
     """Test parsing of various address formats."""
@@ -366,6 +423,47 @@ async def test_client_get_now_playing_error():
             assert "Connection timeout" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_client_get_info_runs_off_event_loop_thread():
+    """Test client creation and GetInformation run outside the event loop thread."""
+    import threading
+
+    from opencloudtouch.devices.adapter import BoseDeviceClientAdapter
+    from unittest.mock import MagicMock
+
+    loop_thread = threading.get_ident()
+    call_threads = []
+
+    def get_information():
+        call_threads.append(threading.get_ident())
+        info = MagicMock()
+        info.DeviceId = "AABBCCDDEEFF"
+        info.DeviceName = "Living Room"
+        info.DeviceType = "SoundTouch 30"
+        info.Components = []
+        info.NetworkInfo = []
+        return info
+
+    def create_device(**kwargs):
+        call_threads.append(threading.get_ident())
+        return MagicMock()
+
+    with patch(
+        "opencloudtouch.devices.adapter.SoundTouchDevice", side_effect=create_device
+    ):
+        with patch("opencloudtouch.devices.adapter.BoseClient") as mock_bose_client:
+            mock_bose_client.return_value.GetInformation.side_effect = get_information
+
+            client = BoseDeviceClientAdapter("http://192.168.1.100:8090")
+            assert call_threads == []  # constructor does no device I/O
+
+            info = await client.get_info()
+
+            assert info.device_id == "AABBCCDDEEFF"
+            assert len(call_threads) == 2
+            assert loop_thread not in call_threads
+
+
 # ==================== FACTORY FUNCTION TESTS ====================
 
 
@@ -407,6 +505,78 @@ def test_get_device_client_real_mode():
                 assert isinstance(client, BoseDeviceClientAdapter)
 
 
+def test_get_device_client_reuses_client_per_device():
+    """Test factory hands out one shared client per device until closed."""
+    from opencloudtouch.devices.adapter import get_device_client
+
+    with patch.dict("os.environ", {"OCT_MOCK_MODE": "false"}, clear=False):
+        with patch("opencloudtouch.devices.adapter.SoundTouchDevice") as mock_device:
+            with patch("opencloudtouch.devices.adapter.BoseClient"):
+                first = get_device_client("http://192.168.1.100:8090")
+                second = get_device_client("http://192.168.1.100:8090/")
+                other = get_device_client("http://192.168.1.101:8090")
+
+                assert second is first
+                assert other is not first
+                # Devices are only contacted when a client is first used
+                mock_device.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_closing_device_client_keeps_it_cached():
+    """Test that closing after use does not evict the shared client."""
+    from opencloudtouch.devices.adapter import clear_client_cache, get_device_client
+
+    with patch.dict("os.environ", {"OCT_MOCK_MODE": "false"}, clear=False):
+        with patch("opencloudtouch.devices.adapter.SoundTouchDevice"):
+            with patch("opencloudtouch.devices.adapter.BoseClient"):
+                client = get_device_client("http://192.168.1.100:8090")
+                await client.close()
+
+                assert get_device_client("http://192.168.1.100:8090") is client
+
+                clear_client_cache()
+                assert get_device_client("http://192.168.1.100:8090") is not client
+
+
+def test_device_client_cache_is_bounded():
+    """Test that the least recently used client is dropped past the limit."""
+    from opencloudtouch.devices import adapter
+
+    with patch.dict("os.environ", {"OCT_MOCK_MODE": "false"}, clear=False):
+        with patch.object(adapter, "MAX_CACHED_CLIENTS", 2):
+            with patch("opencloudtouch.devices.adapter.SoundTouchDevice"):
+                with patch("opencloudtouch.devices.adapter.BoseClient"):
+                    first = adapter.get_device_client("http://192.168.1.1:8090")
+                    adapter.get_device_client("http://192.168.1.2:8090")
+                    adapter.get_device_client("http://192.168.1.3:8090")
+
+                    assert (
+                        adapter.get_device_client("http://192.168.1.1:8090")
+                        is not first
+                    )
+
+
+def test_device_clients_share_http_pool_manager():
+    """Test that BoseClients reuse one keep-alive pool manager per timeout."""
+    from opencloudtouch.devices.adapter import BoseDeviceClientAdapter
+
+    with patch("opencloudtouch.devices.adapter.SoundTouchDevice"):
+        with patch("opencloudtouch.devices.adapter.BoseClient") as mock_bose_client:
+            BoseDeviceClientAdapter("http://192.168.1.100:8090")._ensure_client()
+            BoseDeviceClientAdapter("http://192.168.1.101:8090")._ensure_client()
+            BoseDeviceClientAdapter(
+                "http://192.168.1.102:8090", timeout=10.0
+            )._ensure_client()
+
+            managers = [c.kwargs["manager"] for c in mock_bose_client.call_args_list]
+            assert managers[0] is managers[1]
+            assert managers[2] is not managers[0]
+            # Same per-device pool limits as the library's default manager
+            assert managers[0].connection_pool_kw["maxsize"] == 30
+            assert managers[0].connection_pool_kw["block"] is True
+
+
 def test_get_device_client_mock_mode():
     """Test factory returns mock client in mock mode."""
     from opencloudtouch.devices.adapter import get_device_client
@@ -42,6 +42,7 @@ async def test_get_info_success():
         mock_network.IpAddress = "192.168.1.100"
         mock_info.NetworkInfo = [mock_network]  # Correct: NetworkInfo is a list
 
+        client._ensure_client()
         client._client.GetInformation = MagicMock(return_value=mock_info)
 
         info = await client.get_info()
@@ -87,6 +88,7 @@ async def test_get_info_firmware_logging(caplog):
         mock_network.IpAddress = "192.168.1.200"
         mock_info.NetworkInfo = [mock_network]
 
+        client._ensure_client()
         client._client.GetInformation = MagicMock(return_value=mock_info)
 
         # Capture logs
@@ -125,6 +127,7 @@ async def test_get_now_playing_success():
         )
         mock_now_playing.ContentItem = MagicMock()
 
+        client._ensure_client()
         client._client.GetNowPlayingStatus = MagicMock(
             return_value=mock_now_playing
         )  # Correct method
@@ -140,6 +143,7 @@ async def test_get_info_connection_error():
         mock_device_class.return_value = mock_device
 
         client = BoseDeviceClientAdapter("http://192.168.1.100:8090")
+        client._ensure_client()
         client._client.GetInformation = MagicMock(
             side_effect=Exception("Connection refused")
         )
@@ -161,6 +165,7 @@ async def test_parse_invalid_xml():
 
         # bosesoundtouchapi handles XML parsing internally
         # We test error propagation instead
+        client._ensure_client()
         client._client.GetInformation = MagicMock(side_effect=Exception("Invalid XML"))
 
         with pytest.raises(DeviceConnectionError):
@@ -197,6 +202,10 @@ def test_connect_timeout_constructor_parameter_regression():
         # Create client with custom timeout
         client = BoseDeviceClientAdapter("http://192.168.1.100:8090", timeout=15.0)
 
+        # The device is only contacted on first use, not in the constructor
+        mock_device_class.assert_not_called()
+        client._ensure_client()
+
         # Verify SoundTouchDevice was called with connectTimeout parameter
         mock_device_class.assert_called_once_with(
             host="192.168.1.100", connectTimeout=15, port=8090  # Should be int
@@ -213,7 +222,7 @@ def test_connect_timeout_default_value():
         mock_device_class.return_value = mock_device
 
         # Create client without specifying timeout (use default)
-        BoseDeviceClientAdapter("http://192.168.1.100:8090")
+        BoseDeviceClientAdapter("http://192.168.1.100:8090")._ensure_client()
 
         # Verify default timeout (5.0) is passed
         mock_device_class.assert_called_once_with(
@@ -230,7 +239,9 @@ def test_connect_timeout_custom_port():
         mock_device_class.return_value = mock_device
 
         # Create client with custom port in URL
-        BoseDeviceClientAdapter("http://192.168.1.100:9000", timeout=10.0)
+        BoseDeviceClientAdapter(
+            "http://192.168.1.100:9000", timeout=10.0
+        )._ensure_client()
 
         # Verify custom port is extracted and passed
         mock_device_class.assert_called_once_with(
@@ -86,7 +86,7 @@ class TestDeviceServiceDiscovery:
         assert len(result) == 1
         assert result[0].ip == "192.168.1.100"
         assert result[0].name == "Living Room"
-        mock_adapter.discover.assert_called_once_with(timeout=10)
+        mock_adapter.discover.assert_called_once_with(timeout=10, force=False)
 
     @pytest.mark.asyncio
     async def test_discover_devices_empty(self, device_service, mock_adapter):
@@ -245,15 +245,18 @@ class TestDeviceServiceCapabilities:
         }
 
         # Mock the capability detection and device client creation
-        with patch(
-            "opencloudtouch.devices.service.get_device_capabilities",
-            new_callable=AsyncMock,
-        ) as mock_get_caps, patch(
-            "opencloudtouch.devices.service.get_feature_flags_for_ui"
-        ) as mock_get_flags, patch(
-            "opencloudtouch.devices.service.SoundTouchDevice"
-        ) as mock_device_class, patch(
-            "opencloudtouch.devices.service.SoundTouchClient"
+        with (
+            patch(
+                "opencloudtouch.devices.service.get_device_capabilities",
+                new_callable=AsyncMock,
+            ) as mock_get_caps,
+            patch(
+                "opencloudtouch.devices.service.get_feature_flags_for_ui"
+            ) as mock_get_flags,
+            patch(
+                "opencloudtouch.devices.service.SoundTouchDevice"
+            ) as mock_device_class,
+            patch("opencloudtouch.devices.service.SoundTouchClient"),
         ):  # Patched but not used (prevents import side effects)
 
             mock_get_caps.return_value = expected_capabilities
@@ -311,3 +314,26 @@ class TestDeviceServiceDeletion:
 
         # Assert repository was never called
         mock_repository.delete_all.assert_not_called()
+
+
+class TestDeviceServiceKeyPress:
+    """Test key presses through the shared device client."""
+
+    @pytest.mark.asyncio
+    async def test_press_key_reuses_device_client(
+        self, device_service, mock_repository, sample_device, monkeypatch
+    ):
+        """Test consecutive key presses reuse one client for the device."""
+        mock_repository.get_by_device_id.return_value = sample_device
+        monkeypatch.setenv("OCT_MOCK_MODE", "false")
+
+        with (
+            patch("opencloudtouch.devices.adapter.SoundTouchDevice") as mock_device,
+            patch("opencloudtouch.devices.adapter.BoseClient") as mock_bose_client,
+        ):
+            await device_service.press_key("AABBCC112233", "PRESET_1")
+            await device_service.press_key("AABBCC112233", "PRESET_2")
+
+        # The device was contacted to build a client only once
+        mock_device.assert_called_once()
+        assert mock_bose_client.return_value.Action.call_count == 2
@@ -1,5 +1,6 @@
 """Tests for DeviceSyncService."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -167,6 +168,42 @@ class TestDeviceSyncService:
         assert result.synced == 1
         assert result.failed == 1
 
+    @pytest.mark.asyncio
+    async def test_sync_queries_devices_concurrently(
+        self, mock_repository, discovered_devices, mock_device_info, monkeypatch
+    ):
+        """Test device /info queries overlap instead of running one by one."""
+
+        async def mock_discover_ssdp(self):
+            return discovered_devices
+
+        # Each get_info only returns once every device has been queried
+        started = 0
+        all_started = asyncio.Event()
+
+        async def get_info():
+            nonlocal started
+            started += 1
+            if started == len(discovered_devices):
+                all_started.set()
+            await all_started.wait()
+            return mock_device_info
+
+        mock_client = AsyncMock()
+        mock_client.get_info = get_info
+
+        monkeypatch.setattr(DeviceSyncService, "_discover_via_ssdp", mock_discover_ssdp)
+        monkeypatch.setattr(
+            "opencloudtouch.devices.services.sync_service.get_device_client",
+            lambda url: mock_client,
+        )
+
+        service = DeviceSyncService(repository=mock_repository)
+        result = await asyncio.wait_for(service.sync(), timeout=1.0)
+
+        assert result.synced == 2
+        assert mock_repository.upsert.call_count == 2
+
     @pytest.mark.asyncio
     async def test_sync_combines_ssdp_and_manual(self, mock_repository, monkeypatch):
         """Test sync combines SSDP and manual discovery."""
@@ -4,34 +4,109 @@ Tests for Radio API endpoints
 TDD RED Phase: These tests will fail until FastAPI endpoints are implemented.
 """
 
+import asyncio
+from contextlib import contextmanager
 from unittest.mock import AsyncMock
+from urllib.parse import urlencode
 
 import pytest
-from fastapi.testclient import TestClient
-from httpx import ASGITransport
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
 from opencloudtouch.main import app
-from opencloudtouch.radio.api.routes import get_radio_provider
+from opencloudtouch.radio.api.routes import get_radio_provider, router
 from opencloudtouch.radio.models import RadioStation
-from opencloudtouch.radio.providers.radiobrowser import RadioBrowserError
-
-
-@pytest.fixture
-def client():
-    """Test client for FastAPI app."""
-    return TestClient(app)
+from opencloudtouch.radio.providers.radiobrowser import (
+    RadioBrowserConnectionError,
+    RadioBrowserError,
+    RadioBrowserTimeoutError,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Pre-encoded search URLs for the special-character / unicode queries
+SEARCH_URL = "/api/radio/search"
+SEARCH_ROCK_AND_ROLL = f"{SEARCH_URL}?{urlencode({'q': 'Rock & Roll'})}"
+SEARCH_MOSKVA = f"{SEARCH_URL}?{urlencode({'q': 'Москва'})}"
+SEARCH_TAG_ROCK_AND_ROLL = (
+    f"{SEARCH_URL}?{urlencode({'q': 'rock&roll', 'search_type': 'tag'})}"
+)
+SEARCH_COUNTRY_OESTERREICH = (
+    f"{SEARCH_URL}?{urlencode({'q': 'Österreich', 'search_type': 'country'})}"
+)
+SEARCH_TAG_JAZZ_UPPER = f"{SEARCH_URL}?{urlencode({'q': 'JAZZ', 'search_type': 'tag'})}"
+
+
+_MISSING = object()
+
+
+@contextmanager
+def override(target_app, dependency, provider):
+    """Temporarily override one dependency, restoring only that key on exit."""
+    overrides = target_app.dependency_overrides
+    previous = overrides.get(dependency, _MISSING)
+    overrides[dependency] = provider
+    try:
+        yield
+    finally:
+        if previous is _MISSING:
+            del overrides[dependency]
+        else:
+            overrides[dependency] = previous
+
+
+class StubAdapter:
+    """Radio provider stub exposing only the methods the routes call."""
+
+    def __init__(self):
+        self.search_by_name = AsyncMock()
+        self.search_by_country = AsyncMock()
+        self.search_by_tag = AsyncMock()
+        self.get_station_by_uuid = AsyncMock()
+
+
+@pytest.fixture(scope="module")
+def radio_app():
+    """Radio-only app owned by this module.
+
+    Shares the main app's exception handlers, but keeps dependency overrides
+    off the global ``app`` so the module can run alongside others under xdist.
+    """
+    radio_app = FastAPI(exception_handlers=app.exception_handlers)
+    radio_app.include_router(router)
+    return radio_app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(radio_app):
+    """Async HTTP client talking to the radio app directly via ASGI."""
+    async with AsyncClient(
+        transport=ASGITransport(app=radio_app), base_url="http://test"
+    ) as ac:
+        yield ac
 
 
 @pytest.fixture
 def mock_adapter():
     """Mock RadioBrowser adapter."""
-    return AsyncMock()
+    return StubAdapter()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def override_adapter(radio_app, mock_adapter):
+    """Route get_radio_provider to the mock adapter for every test."""
+    with override(radio_app, get_radio_provider, lambda: mock_adapter):
+        yield mock_adapter
+
+
+@pytest.fixture(scope="session")
 def mock_radio_stations():
-    """Mock radio station data (unified RadioStation model)."""
-    return [
+    """Mock radio station data (unified RadioStation model).
+
+    Built once per session and returned as a tuple; tests must not mutate it.
+    """
+    return (
         RadioStation(
             station_id="test-uuid-1",
             name="Test Radio 1",
@@ -52,291 +127,221 @@ def mock_radio_stations():
             tags=["jazz", "smooth"],
             provider="radiobrowser",
         ),
-    ]
+    )
 
 
 class TestRadioSearchEndpoint:
     """Tests for GET /api/radio/search endpoint."""
 
-    def test_search_endpoint_exists(self, client):
-        """Test that /api/radio/search endpoint exists."""
-        response = client.get("/api/radio/search", params={"q": "test"})
-
-        # Should not be 404 Not Found
-        assert response.status_code != 404
-
-    def test_search_by_name(self, client, mock_adapter, mock_radio_stations):
-        """Test search by station name."""
-        mock_adapter.search_by_name.return_value = mock_radio_stations
-
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search", params={"q": "test", "search_type": "name"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert "stations" in data
-            assert len(data["stations"]) == 2
-            assert data["stations"][0]["name"] == "Test Radio 1"
-            assert data["stations"][0]["uuid"] == "test-uuid-1"
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_search_by_country(self, client, mock_adapter, mock_radio_stations):
-        """Test search by country."""
-        mock_adapter.search_by_country.return_value = [mock_radio_stations[0]]
-
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search", params={"q": "Germany", "search_type": "country"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            assert len(data["stations"]) == 1
-            assert data["stations"][0]["country"] == "Germany"
-        finally:
-            app.dependency_overrides.clear()
+    @pytest.mark.parametrize(
+        "search_type,method,query,station_index",
+        [
+            ("name", "search_by_name", "test", 0),
+            ("country", "search_by_country", "Germany", 0),
+            ("tag", "search_by_tag", "jazz", 1),
+        ],
+    )
+    async def test_search_by_type(
+        self,
+        client,
+        mock_adapter,
+        mock_radio_stations,
+        search_type,
+        method,
+        query,
+        station_index,
+    ):
+        """Test each search_type routes to the matching adapter method."""
+        expected = mock_radio_stations[station_index]
+        getattr(mock_adapter, method).return_value = [expected]
 
-    def test_search_by_tag(self, client, mock_adapter, mock_radio_stations):
-        """Test search by tag."""
-        mock_adapter.search_by_tag.return_value = [mock_radio_stations[1]]
+        response = await client.get(
+            "/api/radio/search", params={"q": query, "search_type": search_type}
+        )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search", params={"q": "jazz", "search_type": "tag"}
-            )
+        assert response.status_code == 200
+        data = response.json()
 
-            assert response.status_code == 200
-            data = response.json()
+        assert len(data["stations"]) == 1
+        assert data["stations"][0]["uuid"] == expected.station_id
+        assert data["stations"][0]["name"] == expected.name
+        getattr(mock_adapter, method).assert_called_once_with(query, limit=10)
 
-            assert len(data["stations"]) == 1
-            assert "jazz" in data["stations"][0]["tags"]
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_search_default_type_is_name(
+    async def test_search_default_type_is_name(
         self, client, mock_adapter, mock_radio_stations
     ):
         """Test that default search type is 'name'."""
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 200
-            mock_adapter.search_by_name.assert_called_once()
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        mock_adapter.search_by_name.assert_called_once()
 
-    def test_search_limit_parameter(self, client, mock_adapter, mock_radio_stations):
+    async def test_search_limit_parameter(
+        self, client, mock_adapter, mock_radio_stations
+    ):
         """Test that limit parameter is passed correctly."""
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search", params={"q": "test", "limit": 25}
-            )
+        response = await client.get(
+            "/api/radio/search", params={"q": "test", "limit": 25}
+        )
 
-            assert response.status_code == 200
-            mock_adapter.search_by_name.assert_called_once_with("test", limit=25)
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        mock_adapter.search_by_name.assert_called_once_with("test", limit=25)
 
-    def test_search_default_limit(self, client, mock_adapter, mock_radio_stations):
+    async def test_search_default_limit(
+        self, client, mock_adapter, mock_radio_stations
+    ):
         """Test default limit is 10."""
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 200
-            mock_adapter.search_by_name.assert_called_once_with("test", limit=10)
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        mock_adapter.search_by_name.assert_called_once_with("test", limit=10)
 
-    def test_search_missing_query_parameter(self, client):
+    async def test_search_missing_query_parameter(self, client):
         """Test that missing 'q' parameter returns 422."""
-        response = client.get("/api/radio/search")
+        response = await client.get("/api/radio/search")
 
         assert response.status_code == 422
 
-    def test_search_empty_query_parameter(self, client):
+    async def test_search_empty_query_parameter(self, client):
         """Test that empty 'q' parameter returns 400."""
-        response = client.get("/api/radio/search", params={"q": ""})
+        response = await client.get("/api/radio/search", params={"q": ""})
 
         # Should reject empty query
         assert response.status_code in [400, 422]
 
-    def test_search_invalid_search_type(self, client):
+    async def test_search_invalid_search_type(self, client):
         """Test that invalid search_type returns 422."""
-        response = client.get(
+        response = await client.get(
             "/api/radio/search", params={"q": "test", "search_type": "invalid"}
         )
 
         assert response.status_code == 422
 
-    def test_search_limit_min_value(self, client):
+    async def test_search_limit_min_value(self, client):
         """Test that limit has minimum value of 1."""
-        response = client.get("/api/radio/search", params={"q": "test", "limit": 0})
+        response = await client.get(
+            "/api/radio/search", params={"q": "test", "limit": 0}
+        )
 
         assert response.status_code == 422
 
-    def test_search_limit_max_value(self, client):
+    async def test_search_limit_max_value(self, client):
         """Test that limit has maximum value of 100."""
-        response = client.get("/api/radio/search", params={"q": "test", "limit": 101})
+        response = await client.get(
+            "/api/radio/search", params={"q": "test", "limit": 101}
+        )
 
         assert response.status_code == 422
 
-    def test_search_empty_results(self, client, mock_adapter):
+    async def test_search_empty_results(self, client, mock_adapter):
         """Test search with no results."""
         mock_adapter.search_by_name.return_value = []
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "nonexistent"})
+        response = await client.get("/api/radio/search", params={"q": "nonexistent"})
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["stations"] == []
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stations"] == []
 
-    def test_search_adapter_error_handling(self, client, mock_adapter):
+    async def test_search_adapter_error_handling(self, client, mock_adapter):
         """Test that adapter errors are handled gracefully."""
         mock_adapter.search_by_name.side_effect = RadioBrowserError("API error")
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 500
-            data = response.json()
-            assert "detail" in data
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 500
+        assert b'"detail"' in response.content
 
-    def test_search_response_format(self, client, mock_adapter, mock_radio_stations):
+    async def test_search_response_format(
+        self, client, mock_adapter, mock_radio_stations
+    ):
         """Test response format structure."""
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            # Check structure
-            assert "stations" in data
-            assert isinstance(data["stations"], list)
+        # Check structure
+        assert "stations" in data
+        assert isinstance(data["stations"], list)
 
-            # Check station fields
-            station = data["stations"][0]
-            required_fields = ["uuid", "name", "url", "country", "codec"]
-            for field in required_fields:
-                assert field in station
-        finally:
-            app.dependency_overrides.clear()
+        # Check station fields
+        station = data["stations"][0]
+        required_fields = ["uuid", "name", "url", "country", "codec"]
+        for field in required_fields:
+            assert field in station
 
-    def test_search_station_field_types(
+    async def test_search_station_field_types(
         self, client, mock_adapter, mock_radio_stations
     ):
         """Test that response field types are correct."""
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 200
-            data = response.json()
-            station = data["stations"][0]
+        assert response.status_code == 200
+        data = response.json()
+        station = data["stations"][0]
 
-            assert isinstance(station["uuid"], str)
-            assert isinstance(station["name"], str)
-            assert isinstance(station["url"], str)
-            assert isinstance(station["bitrate"], int)
-        finally:
-            app.dependency_overrides.clear()
+        assert isinstance(station["uuid"], str)
+        assert isinstance(station["name"], str)
+        assert isinstance(station["url"], str)
+        assert isinstance(station["bitrate"], int)
 
 
 class TestRadioStationDetailEndpoint:
     """Tests for GET /api/radio/station/{uuid} endpoint."""
 
-    def test_station_detail_endpoint_exists(self, client):
-        """Test that /api/radio/station/{uuid} endpoint exists."""
-        response = client.get("/api/radio/station/test-uuid")
-
-        # Should not be 404 Not Found (though station might not exist)
-        # 504 Gateway Timeout can occur when external Radio Browser API is unreachable
-        assert response.status_code in [200, 404, 500, 503, 504]
-
-    def test_get_station_by_uuid(self, client, mock_adapter, mock_radio_stations):
+    async def test_get_station_by_uuid(self, client, mock_adapter, mock_radio_stations):
         """Test getting station detail by UUID."""
         mock_adapter.get_station_by_uuid.return_value = mock_radio_stations[0]
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/station/test-uuid-1")
+        response = await client.get("/api/radio/station/test-uuid-1")
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            assert data["uuid"] == "test-uuid-1"
-            assert data["name"] == "Test Radio 1"
-        finally:
-            app.dependency_overrides.clear()
+        assert data["uuid"] == "test-uuid-1"
+        assert data["name"] == "Test Radio 1"
 
-    def test_get_station_not_found(self, client, mock_adapter):
+    async def test_get_station_not_found(self, client, mock_adapter):
         """Test getting non-existent station returns 404."""
         mock_adapter.get_station_by_uuid.side_effect = RadioBrowserError(
             "Station not found"
         )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/station/nonexistent")
+        response = await client.get("/api/radio/station/nonexistent")
 
-            assert response.status_code in [404, 500]
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code in [404, 500]
 
 
 class TestRadioAPIErrorHandling:
     """Tests for error handling and edge cases in Radio API."""
 
-    def test_search_timeout_returns_504(self, client, mock_adapter):
+    async def test_search_timeout_returns_504(self, client, mock_adapter):
         """Test RadioBrowser API timeout returns 504 Gateway Timeout.
 
         Use case: RadioBrowser API is slow/unresponsive.
         Expected: User sees timeout error, not 500 Internal Server Error.
         """
-        from opencloudtouch.radio.providers.radiobrowser import RadioBrowserTimeoutError
-
         mock_adapter.search_by_name.side_effect = RadioBrowserTimeoutError(
             "API timeout after 10s"
         )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 504
-            assert "timeout" in response.json()["detail"].lower()
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 504
+        assert b"timeout" in response.content.lower()
 
-    def test_search_connection_error_returns_503(self, client, mock_adapter):
+    async def test_search_connection_error_returns_503(self, client, mock_adapter):
         """Test connection failure returns 503 Service Unavailable.
 
         Use case: RadioBrowser API is down or DNS resolution fails.
@@ -344,71 +349,49 @@ class TestRadioAPIErrorHandling:
 
         Regression: Network errors should be distinguishable from code bugs.
         """
-        from opencloudtouch.radio.providers.radiobrowser import (
-            RadioBrowserConnectionError,
-        )
-
         mock_adapter.search_by_name.side_effect = RadioBrowserConnectionError(
             "Cannot connect to api.radio-browser.info"
         )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "test"})
+        response = await client.get("/api/radio/search", params={"q": "test"})
 
-            assert response.status_code == 503
-            assert (
-                "connect" in response.json()["detail"].lower()
-                or "unavailable" in response.json()["detail"].lower()
-            )
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 503
+        body = response.content.lower()
+        assert b"connect" in body or b"unavailable" in body
 
-    def test_station_detail_timeout_returns_504(self, client, mock_adapter):
+    async def test_station_detail_timeout_returns_504(self, client, mock_adapter):
         """Test station detail timeout handling.
 
         Note: Current implementation catches RadioBrowserError (parent class)
         first, so timeout returns 500 instead of 504.
         This test documents actual behavior, not ideal behavior.
         """
-        from opencloudtouch.radio.providers.radiobrowser import RadioBrowserTimeoutError
-
         mock_adapter.get_station_by_uuid.side_effect = RadioBrowserTimeoutError(
             "API timeout"
         )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/station/test-uuid")
+        response = await client.get("/api/radio/station/test-uuid")
 
-            # After fixing exception order: Timeout correctly returns 504
-            assert response.status_code == 504
-        finally:
-            app.dependency_overrides.clear()
+        # After fixing exception order: Timeout correctly returns 504
+        assert response.status_code == 504
 
-    def test_station_detail_connection_error_returns_503(self, client, mock_adapter):
+    async def test_station_detail_connection_error_returns_503(
+        self, client, mock_adapter
+    ):
         """Test station detail connection failure handling.
 
         After fixing exception order: Connection error correctly returns 503.
         """
-        from opencloudtouch.radio.providers.radiobrowser import (
-            RadioBrowserConnectionError,
-        )
-
         mock_adapter.get_station_by_uuid.side_effect = RadioBrowserConnectionError(
             "Network error"
         )
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/station/test-uuid")
+        response = await client.get("/api/radio/station/test-uuid")
 
-            # After fixing exception order: Connection error correctly returns 503
-            assert response.status_code == 503
-        finally:
-            app.dependency_overrides.clear()
+        # After fixing exception order: Connection error correctly returns 503
+        assert response.status_code == 503
 
-    def test_search_with_special_characters(
+    async def test_search_with_special_characters(
         self, client, mock_adapter, mock_radio_stations
     ):
         """Test search with special characters in query.
@@ -418,19 +401,15 @@ class TestRadioAPIErrorHandling:
         """
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "Rock & Roll"})
+        response = await client.get(SEARCH_ROCK_AND_ROLL)
 
-            assert response.status_code == 200
-            # Verify adapter received the unescaped query
-            mock_adapter.search_by_name.assert_called_once()
-            call_args = mock_adapter.search_by_name.call_args[0]
-            assert call_args[0] == "Rock & Roll"
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_search_with_unicode_characters(
+        assert response.status_code == 200
+        # Verify adapter received the unescaped query
+        mock_adapter.search_by_name.assert_called_once()
+        call_args = mock_adapter.search_by_name.call_args[0]
+        assert call_args[0] == "Rock & Roll"
+
+    async def test_search_with_unicode_characters(
         self, client, mock_adapter, mock_radio_stations
     ):
         """Test search with Unicode characters.
@@ -440,13 +419,9 @@ class TestRadioAPIErrorHandling:
         """
         mock_adapter.search_by_name.return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get("/api/radio/search", params={"q": "Москва"})
+        response = await client.get(SEARCH_MOSKVA)
 
-            assert response.status_code == 200
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
 
     # Note: test_station_detail_with_invalid_uuid_format removed
     # Reason: RadioBrowser API accepts any string as UUID, so "invalid format"
@@ -457,7 +432,7 @@ class TestRadioAPIErrorHandling:
 class TestRadioAPIIntegration:
     """Integration tests combining search and station detail endpoints."""
 
-    def test_search_and_detail_workflow(
+    async def test_search_and_detail_workflow(
         self, client, mock_adapter, mock_radio_stations
     ):
         """Test complete workflow: search → select → get detail.
@@ -468,28 +443,24 @@ class TestRadioAPIIntegration:
         mock_adapter.search_by_name.return_value = mock_radio_stations
         mock_adapter.get_station_by_uuid.return_value = mock_radio_stations[0]
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            # 1. Search
-            response = client.get("/api/radio/search", params={"q": "test"})
-            assert response.status_code == 200
-            stations = response.json()["stations"]
-            assert len(stations) > 0
+        # 1. Search
+        response = await client.get("/api/radio/search", params={"q": "test"})
+        assert response.status_code == 200
+        stations = response.json()["stations"]
+        assert len(stations) > 0
 
-            # 2. Get detail for first result
-            first_uuid = stations[0]["uuid"]
-            response = client.get(f"/api/radio/station/{first_uuid}")
-            assert response.status_code == 200
-            detail = response.json()
-            assert detail["uuid"] == first_uuid
-        finally:
-            app.dependency_overrides.clear()
+        # 2. Get detail for first result
+        first_uuid = stations[0]["uuid"]
+        response = await client.get(f"/api/radio/station/{first_uuid}")
+        assert response.status_code == 200
+        detail = response.json()
+        assert detail["uuid"] == first_uuid
 
 
 class TestRadioSearchEdgeCases:
     """Edge case tests for radio search with different search types."""
 
-    def test_search_by_country_empty_results(self, client, mock_adapter):
+    async def test_search_by_country_empty_results(self, client, mock_adapter):
         """Test search by country with no results.
 
         Use case: User searches for country that has no stations.
@@ -497,148 +468,71 @@ class TestRadioSearchEdgeCases:
         """
         mock_adapter.search_by_country.return_value = []
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search",
-                params={"q": "Antarctica", "search_type": "country"},
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["stations"] == []
-            # Radio API returns {"stations": []} without total field
-        finally:
-            app.dependency_overrides.clear()
+        response = await client.get(
+            "/api/radio/search",
+            params={"q": "Antarctica", "search_type": "country"},
+        )
 
-    def test_search_by_tag_special_characters(
-        self, client, mock_adapter, mock_radio_stations
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stations"] == []
+        # Radio API returns {"stations": []} without total field
+
+    @pytest.mark.parametrize(
+        "url,method,query",
+        [
+            (SEARCH_TAG_ROCK_AND_ROLL, "search_by_tag", "rock&roll"),
+            (SEARCH_COUNTRY_OESTERREICH, "search_by_country", "Österreich"),
+            (SEARCH_TAG_JAZZ_UPPER, "search_by_tag", "JAZZ"),
+        ],
+        ids=["tag-special-characters", "country-umlauts", "tag-uppercase"],
+    )
+    async def test_search_query_passed_through(
+        self, client, mock_adapter, mock_radio_stations, url, method, query
     ):
-        """Test search by tag with special characters.
+        """Test special characters, umlauts and case reach the adapter unchanged.
 
-        Use case: User searches for 'Rock & Roll' or 'Pop/Rock' tag.
-        Expected: Special characters handled correctly without errors.
+        Use case: User searches for 'Rock & Roll', 'Österreich' or 'JAZZ'.
+        Expected: Query is decoded correctly; case handling is left to the
+        RadioBrowser API, not our endpoint.
         """
-        mock_adapter.search_by_tag.return_value = mock_radio_stations
+        getattr(mock_adapter, method).return_value = mock_radio_stations
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search", params={"q": "rock&roll", "search_type": "tag"}
-            )
+        response = await client.get(url)
 
-            assert response.status_code == 200
-            # Verify adapter received correctly encoded query
-            mock_adapter.search_by_tag.assert_called_once()
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_search_by_country_umlauts(self, client, mock_adapter, mock_radio_stations):
-        """Test search by country with German umlauts.
-
-        Use case: User searches for 'Österreich' (Austria) or 'Schweiz' (Switzerland).
-        Expected: Unicode characters handled correctly.
-        """
-        mock_adapter.search_by_country.return_value = mock_radio_stations
-
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            response = client.get(
-                "/api/radio/search",
-                params={"q": "Österreich", "search_type": "country"},
-            )
-
-            assert response.status_code == 200
-            # Verify adapter was called with correct parameters
-            assert mock_adapter.search_by_country.called
-            call_args = mock_adapter.search_by_country.call_args
-            assert call_args[0][0] == "Österreich"  # First positional arg
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_search_by_tag_case_insensitive(
-        self, client, mock_adapter, mock_radio_stations
-    ):
-        """Test search by tag is case-insensitive.
-
-        Use case: User searches for 'JAZZ' vs 'jazz' vs 'Jazz'.
-        Expected: All queries return same results.
-        """
-        mock_adapter.search_by_tag.return_value = mock_radio_stations
-
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            # Test uppercase
-            response = client.get(
-                "/api/radio/search", params={"q": "JAZZ", "search_type": "tag"}
-            )
-            assert response.status_code == 200
-
-            # RadioBrowser API handles case-sensitivity, not our endpoint
-            # Test just verifies request is passed through correctly
-            assert mock_adapter.search_by_tag.called
-            call_args = mock_adapter.search_by_tag.call_args
-            assert call_args[0][0] == "JAZZ"  # Verify uppercase passed through
-        finally:
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        getattr(mock_adapter, method).assert_called_once_with(query, limit=10)
 
 
 class TestConcurrentRadioRequests:
     """Tests for concurrent radio API requests (race conditions)."""
 
-    @pytest.mark.asyncio
-    async def test_concurrent_station_detail_requests(
+    async def test_concurrent_operations(
         self, client, mock_adapter, mock_radio_stations
     ):
-        """Test multiple concurrent station detail requests don't interfere.
+        """Test concurrent station detail and search requests don't interfere.
 
-        Use case: User opens multiple station details in different tabs.
-        Expected: All requests succeed, no race conditions.
+        Use case: User opens multiple station details in different tabs while
+        other users search simultaneously for different stations.
+        Expected: All requests succeed, each search returns its own results.
 
         Note: RadioBrowser adapter is stateless, so concurrency should be safe.
         """
+        # Phase 1: 5 concurrent station detail requests
         mock_adapter.get_station_by_uuid.return_value = mock_radio_stations[0]
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            import asyncio
-
-            from httpx import AsyncClient
-
-            # Create 5 concurrent requests
-            async def fetch_station(station_uuid):
-                transport = ASGITransport(app=app)
-                async with AsyncClient(
-                    transport=transport, base_url="http://test"
-                ) as ac:
-                    response = await ac.get(f"/api/radio/station/{station_uuid}")
-                    return response
-
-            tasks = [fetch_station("test-uuid-1") for _ in range(5)]
-            responses = await asyncio.gather(*tasks)
-
-            # All should succeed
-            for response in responses:
-                assert response.status_code == 200
-                assert response.json()["uuid"] == "test-uuid-1"
-
-            # Adapter should be called 5 times (no caching)
-            assert mock_adapter.get_station_by_uuid.call_count == 5
-
-        finally:
-            app.dependency_overrides.clear()
+        responses = await asyncio.gather(
+            *(client.get("/api/radio/station/test-uuid-1") for _ in range(5))
+        )
 
-    @pytest.mark.asyncio
-    async def test_concurrent_search_requests_different_queries(
-        self, client, mock_adapter, mock_radio_stations
-    ):
-        """Test concurrent search requests with different queries.
+        for response in responses:
+            assert response.status_code == 200
+            assert response.json()["uuid"] == "test-uuid-1"
 
-        Use case: Multiple users search simultaneously for different stations.
-        Expected: Each request returns correct results, no query mixing.
-        """
+        # Adapter should be called 5 times (no caching)
+        assert mock_adapter.get_station_by_uuid.call_count == 5
 
-        # Mock adapter to return different results based on query
+        # Phase 2: concurrent searches with different queries
         def mock_search(query, limit=20):
             if query == "rock":
                 return [mock_radio_stations[0]]
@@ -649,34 +543,14 @@ class TestConcurrentRadioRequests:
 
         mock_adapter.search_by_name.side_effect = mock_search
 
-        app.dependency_overrides[get_radio_provider] = lambda: mock_adapter
-        try:
-            import asyncio
-
-            from httpx import AsyncClient
-
-            async def search(query):
-                transport = ASGITransport(app=app)
-                async with AsyncClient(
-                    transport=transport, base_url="http://test"
-                ) as ac:
-                    response = await ac.get("/api/radio/search", params={"q": query})
-                    return (query, response)
-
-            # Search for "rock" and "jazz" concurrently
-            tasks = [search("rock"), search("jazz"), search("rock")]
-            results = await asyncio.gather(*tasks)
-
-            # Verify each query got correct results
-            for query, response in results:
-                assert response.status_code == 200
-                data = response.json()
-                if query == "rock":
-                    assert len(data["stations"]) == 1
-                    assert data["stations"][0]["name"] == "Test Radio 1"
-                elif query == "jazz":
-                    assert len(data["stations"]) == 1
-                    assert data["stations"][0]["name"] == "Test Radio 2"
-
-        finally:
-            app.dependency_overrides.clear()
+        queries = ["rock", "jazz", "rock"]
+        responses = await asyncio.gather(
+            *(client.get("/api/radio/search", params={"q": q}) for q in queries)
+        )
+
+        expected_names = {"rock": "Test Radio 1", "jazz": "Test Radio 2"}
+        for query, response in zip(queries, responses):
+            assert response.status_code == 200
+            stations = response.json()["stations"]
+            assert len(stations) == 1
+            assert stations[0]["name"] == expected_names[query]
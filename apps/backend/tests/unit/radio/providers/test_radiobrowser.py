@@ -4,11 +4,14 @@ Tests for RadioBrowser API Adapter
 TDD RED Phase: These tests will fail until implementation is complete.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
 
 import httpx
+import orjson
 import pytest
 
+from opencloudtouch.radio.providers import radiobrowser
 from opencloudtouch.radio.providers.radiobrowser import (
     RadioBrowserAdapter,
     RadioBrowserConnectionError,
@@ -18,6 +21,145 @@ from opencloudtouch.radio.providers.radiobrowser import (
 )
 
 
+@pytest.fixture(scope="module")
+def adapter():
+    """RadioBrowserAdapter shared across the module.
+
+    Rate limiting is off so requests from earlier tests can't delay later
+    ones. Tests that need other settings construct their own; tests that
+    swap internals (_client, _sleep) do so via monkeypatch so they are
+    restored.
+    """
+    adapter = RadioBrowserAdapter(requests_per_second=0)
+    yield adapter
+    if adapter._client is not None:
+        asyncio.run(adapter.aclose())
+
+
+@pytest.fixture(autouse=True)
+def clear_adapter_cache(adapter):
+    """Start every test with an empty response cache on the shared adapter.
+
+    Otherwise whether a request hits the test's stub or a response cached
+    by an earlier test depends on test order (-k, xdist).
+    """
+    adapter._cache.clear()
+
+
+# A complete station record as returned by /json/stations/* endpoints
+SAMPLE_API_STATION = {
+    "changeuuid": "960761d5-0601-11e8-ae97-52543be04c81",
+    "stationuuid": "960761d5-0601-11e8-ae97-52543be04c81",
+    "name": "Absolut relax",
+    "url": "http://streamlive.syndicast.fr/stream.mp3",
+    "url_resolved": "http://cdn.syndicast.fr/stream.mp3",
+    "homepage": "https://www.absolut-radio.fr",
+    "favicon": "https://www.absolut-radio.fr/favicon.png",
+    "tags": "chillout,relax",
+    "country": "France",
+    "countrycode": "FR",
+    "state": "Hauts-de-France",
+    "language": "french",
+    "languagecodes": "fr",
+    "votes": 12,
+    "codec": "MP3",
+    "bitrate": 128,
+    "hls": 0,
+    "lastcheckok": 1,
+    "clickcount": 145,
+    "clicktrend": 3,
+}
+
+
+class AsyncStub:
+    """Lightweight stand-in for an async method; much cheaper than AsyncMock.
+
+    Each call is recorded in ``calls`` as an ``(args, kwargs)`` tuple. With no
+    ``side_effect`` the stub returns ``result``. A ``side_effect`` may be an
+    exception to raise, an async callable to delegate to, or a list whose
+    items are used one per call.
+    """
+
+    def __init__(self, result=None, side_effect=None):
+        self.result = result
+        self.side_effect = side_effect
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is None:
+            return self.result
+        effect = self.side_effect
+        if isinstance(effect, list):
+            effect = effect.pop(0)
+        if isinstance(effect, BaseException):
+            raise effect
+        if callable(effect):
+            return await effect(*args, **kwargs)
+        return effect
+
+
+def _http_status_error(status_code: int, text: str) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError carrying a mocked response."""
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = status_code
+    mock_response.text = text
+    return httpx.HTTPStatusError(
+        "Server error", request=MagicMock(spec=httpx.Request), response=mock_response
+    )
+
+
+KNOWN_SERVERS = frozenset(
+    {
+        "https://all.api.radio-browser.info",
+        "https://de1.api.radio-browser.info",
+        "https://nl1.api.radio-browser.info",
+        "https://at1.api.radio-browser.info",
+    }
+)
+
+# (method name, positional args) for every public lookup that hits the API
+API_METHODS = [
+    ("search_by_name", ("test",)),
+    ("search_by_tag", ("jazz",)),
+    ("get_station_by_uuid", ("test-uuid",)),
+]
+
+# (exception factory, expected wrapped exception, expected message substring)
+FAILURES = [
+    pytest.param(
+        lambda: httpx.TimeoutException("Request timed out"),
+        RadioBrowserTimeoutError,
+        "Request timed out",
+        id="timeout",
+    ),
+    pytest.param(
+        lambda: httpx.ConnectError("Connection refused"),
+        RadioBrowserConnectionError,
+        "Connection failed",
+        id="connect",
+    ),
+    pytest.param(
+        lambda: _http_status_error(500, "Internal Server Error"),
+        RadioBrowserError,
+        "HTTP error 500",
+        id="http-500",
+    ),
+    pytest.param(
+        lambda: _http_status_error(404, "Not Found"),
+        RadioBrowserError,
+        "HTTP error 404",
+        id="http-404",
+    ),
+    pytest.param(
+        lambda: httpx.ReadError("Connection reset"),
+        RadioBrowserError,
+        "HTTP error: Connection reset",
+        id="unmapped-httpx-error",
+    ),
+]
+
+
 class TestRadioBrowserStation:
     """Tests for RadioBrowserStation data model."""
 
@@ -37,6 +179,14 @@ class TestRadioBrowserStation:
         assert station.country == "Germany"
         assert station.codec == "MP3"
 
+    def test_radio_station_uses_slots(self):
+        """Test RadioBrowserStation is slotted (no per-instance __dict__)."""
+        station = RadioBrowserStation(
+            station_uuid="uuid", name="Station", url="http://example.com"
+        )
+
+        assert not hasattr(station, "__dict__")
+
     def test_radio_station_creation_full(self):
         """Test creating RadioBrowserStation with all fields."""
         station = RadioBrowserStation(
@@ -68,30 +218,7 @@ class TestRadioBrowserStation:
 
     def test_radio_station_from_api_response(self):
         """Test creating RadioStation from API response dict."""
-        api_response = {
-            "changeuuid": "960761d5-0601-11e8-ae97-52543be04c81",
-            "stationuuid": "960761d5-0601-11e8-ae97-52543be04c81",
-            "name": "Absolut relax",
-            "url": "http://streamlive.syndicast.fr/stream.mp3",
-            "url_resolved": "http://cdn.syndicast.fr/stream.mp3",
-            "homepage": "https://www.absolut-radio.fr",
-            "favicon": "https://www.absolut-radio.fr/favicon.png",
-            "tags": "chillout,relax",
-            "country": "France",
-            "countrycode": "FR",
-            "state": "Hauts-de-France",
-            "language": "french",
-            "languagecodes": "fr",
-            "votes": 12,
-            "codec": "MP3",
-            "bitrate": 128,
-            "hls": 0,
-            "lastcheckok": 1,
-            "clickcount": 145,
-            "clicktrend": 3,
-        }
-
-        station = RadioBrowserStation.from_api_response(api_response)
+        station = RadioBrowserStation.from_api_response(SAMPLE_API_STATION)
 
         assert station.station_uuid == "960761d5-0601-11e8-ae97-52543be04c81"
         assert station.name == "Absolut relax"
@@ -103,11 +230,52 @@ class TestRadioBrowserStation:
         assert station.hls is False
         assert station.lastcheckok is True
 
+    def test_from_api_responses_matches_single_row_parse(self):
+        """Test bulk parsing gives the same stations as parsing row by row."""
+        minimal = {
+            "stationuuid": "uuid-min",
+            "name": "Minimal",
+            "url": "http://stream.example.com/min.mp3",
+            "country": "",
+            "codec": "",
+        }
+        rows = [SAMPLE_API_STATION, minimal]
+
+        stations = RadioBrowserStation.from_api_responses(rows)
+
+        assert stations == [RadioBrowserStation.from_api_response(r) for r in rows]
+        assert stations[0].lastcheckok is True
+        assert stations[1].hls is False
+        assert stations[1].bitrate is None
+
+    def test_from_api_responses_missing_required_field(self):
+        """Test bulk parsing rejects rows without a required field."""
+        row = {k: v for k, v in SAMPLE_API_STATION.items() if k != "url"}
+
+        with pytest.raises(KeyError):
+            RadioBrowserStation.from_api_responses([row])
+
+    def test_from_api_responses_reads_each_row_once(self, monkeypatch):
+        """Test bulk parsing pulls all fields of a row in a single lookup.
+
+        Guards the table-driven parse path without a wall-clock budget:
+        one itemgetter call per row, however many fields a station has.
+        """
+        getter = MagicMock(wraps=radiobrowser._API_ROW_GETTER)
+        monkeypatch.setattr(radiobrowser, "_API_ROW_GETTER", getter)
+        payload = [SAMPLE_API_STATION] * 1_000
+
+        stations = RadioBrowserStation.from_api_responses(payload)
 
+        assert len(stations) == 1_000
+        assert getter.call_count == len(payload)
+        assert stations[0] == RadioBrowserStation.from_api_response(SAMPLE_API_STATION)
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestRadioBrowserAdapter:
     """Tests for RadioBrowserAdapter."""
 
-    @pytest.mark.asyncio
     async def test_initialization(self):
         """Test adapter initialization."""
         adapter = RadioBrowserAdapter(timeout=15.0, max_retries=5)
@@ -116,19 +284,13 @@ class TestRadioBrowserAdapter:
         assert adapter.max_retries == 5
         assert adapter.base_url is not None
 
-    @pytest.mark.asyncio
-    async def test_initialization_defaults(self):
+    async def test_initialization_defaults(self, adapter):
         """Test adapter initialization with defaults."""
-        adapter = RadioBrowserAdapter()
-
         assert adapter.timeout == 10.0
         assert adapter.max_retries == 3
 
-    @pytest.mark.asyncio
-    async def test_search_by_name_success(self):
+    async def test_search_by_name_success(self, adapter, monkeypatch):
         """Test successful search by station name."""
-        adapter = RadioBrowserAdapter()
-
         mock_response = [
             {
                 "stationuuid": "uuid-1",
@@ -140,37 +302,28 @@ class TestRadioBrowserAdapter:
             }
         ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = AsyncStub(result=mock_response)
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            stations = await adapter.search_by_name("test", limit=10)
+        stations = await adapter.search_by_name("test", limit=10)
 
-            assert len(stations) == 1
-            assert stations[0].name == "Test Radio"
-            assert stations[0].station_id == "uuid-1"
-            mock_request.assert_called_once()
+        assert isinstance(stations, tuple)
+        assert len(stations) == 1
+        assert stations[0].name == "Test Radio"
+        assert stations[0].station_id == "uuid-1"
+        assert len(mock_request.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_search_by_name_empty_result(self):
+    async def test_search_by_name_empty_result(self, adapter, monkeypatch):
         """Test search with no results."""
-        adapter = RadioBrowserAdapter()
+        mock_request = AsyncStub(result=[])
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = []
+        stations = await adapter.search_by_name("nonexistent")
 
-            stations = await adapter.search_by_name("nonexistent")
+        assert len(stations) == 0
 
-            assert len(stations) == 0
-
-    @pytest.mark.asyncio
-    async def test_search_by_country_success(self):
+    async def test_search_by_country_success(self, adapter, monkeypatch):
         """Test successful search by country."""
-        adapter = RadioBrowserAdapter()
-
         mock_response = [
             {
                 "stationuuid": "uuid-2",
@@ -182,22 +335,17 @@ class TestRadioBrowserAdapter:
             }
         ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = AsyncStub(result=mock_response)
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            stations = await adapter.search_by_country("Switzerland", limit=5)
+        stations = await adapter.search_by_country("Switzerland", limit=5)
 
-            assert len(stations) == 1
-            assert stations[0].country == "Switzerland"
-            assert stations[0].codec == "AAC"
+        assert len(stations) == 1
+        assert stations[0].country == "Switzerland"
+        assert stations[0].codec == "AAC"
 
-    @pytest.mark.asyncio
-    async def test_search_by_tag_success(self):
+    async def test_search_by_tag_success(self, adapter, monkeypatch):
         """Test successful search by tag."""
-        adapter = RadioBrowserAdapter()
-
         mock_response = [
             {
                 "stationuuid": "uuid-3",
@@ -209,22 +357,17 @@ class TestRadioBrowserAdapter:
             }
         ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = AsyncStub(result=mock_response)
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            stations = await adapter.search_by_tag("jazz")
+        stations = await adapter.search_by_tag("jazz")
 
-            assert len(stations) == 1
-            # tags is now a list in unified RadioStation model
-            assert "jazz" in stations[0].tags
+        assert len(stations) == 1
+        # tags is now a list in unified RadioStation model
+        assert "jazz" in stations[0].tags
 
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_success(self):
+    async def test_get_station_by_uuid_success(self, adapter, monkeypatch):
         """Test getting station detail by UUID."""
-        adapter = RadioBrowserAdapter()
-
         mock_response = [
             {
                 "stationuuid": "test-uuid",
@@ -238,78 +381,112 @@ class TestRadioBrowserAdapter:
             }
         ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = mock_response
+        mock_request = AsyncStub(result=mock_response)
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            station = await adapter.get_station_by_uuid("test-uuid")
+        station = await adapter.get_station_by_uuid("test-uuid")
 
-            assert station.station_id == "test-uuid"
-            assert station.name == "Detailed Station"
-            assert station.bitrate == 256
-            # votes is not in unified RadioStation model
-            # assert station.votes == 500
+        assert station.station_id == "test-uuid"
+        assert station.name == "Detailed Station"
+        assert station.bitrate == 256
+        # votes is not in unified RadioStation model
+        # assert station.votes == 500
 
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_not_found(self):
+    async def test_get_station_by_uuid_not_found(self, adapter, monkeypatch):
         """Test getting non-existent station raises error."""
-        adapter = RadioBrowserAdapter()
+        mock_request = AsyncStub(result=[])
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
+
+        with pytest.raises(RadioBrowserError, match="Station .* not found"):
+            await adapter.get_station_by_uuid("nonexistent-uuid")
+
+    async def test_get_stations_by_uuids_batches(self, adapter, monkeypatch):
+        """Test UUIDs are resolved in batches of UUID_BATCH_SIZE."""
+        uuids = [f"uuid-{i}" for i in range(150)]
+
+        async def fake_request(endpoint, params):
+            return [
+                {
+                    "stationuuid": uuid,
+                    "name": uuid,
+                    "url": "http://stream.example.com/s.mp3",
+                    "country": "",
+                    "codec": "MP3",
+                }
+                for uuid in params["uuids"].split(",")
+            ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = []
+        mock_request = AsyncStub(side_effect=fake_request)
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            with pytest.raises(RadioBrowserError, match="Station .* not found"):
-                await adapter.get_station_by_uuid("nonexistent-uuid")
+        stations = await adapter.get_stations_by_uuids(uuids)
+
+        assert len(mock_request.calls) == 2
+        assert [s.station_id for s in stations] == uuids
+        batch_sizes = [
+            len(args[1]["uuids"].split(",")) for args, _ in mock_request.calls
+        ]
+        assert batch_sizes == [100, 50]
+
+    async def test_get_stations_by_uuids_cancels_batches_on_error(
+        self, adapter, monkeypatch
+    ):
+        """Test a failing batch cancels the other in-flight batch requests."""
+        cancelled = asyncio.Event()
+
+        async def fake_request(endpoint, params):
+            if params["uuids"].startswith("uuid-0,"):
+                try:
+                    await asyncio.Event().wait()  # never completes on its own
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            raise httpx.ConnectError("Connection refused")
+
+        monkeypatch.setattr(adapter, "_make_request", fake_request)
+        uuids = [f"uuid-{i}" for i in range(150)]
+
+        with pytest.raises(RadioBrowserConnectionError):
+            await adapter.get_stations_by_uuids(uuids)
+
+        assert cancelled.is_set()
 
-    @pytest.mark.asyncio
     async def test_timeout_error_handling(self):
         """Test timeout error is properly wrapped."""
         adapter = RadioBrowserAdapter(timeout=1.0)
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = httpx.TimeoutException("Request timeout")
+        mock_request = AsyncStub(side_effect=httpx.TimeoutException("Request timeout"))
+        adapter._make_request = mock_request
 
-            with pytest.raises(RadioBrowserTimeoutError):
-                await adapter.search_by_name("test")
+        with pytest.raises(RadioBrowserTimeoutError):
+            await adapter.search_by_name("test")
 
-    @pytest.mark.asyncio
-    async def test_connection_error_handling(self):
+    async def test_connection_error_handling(self, adapter, monkeypatch):
         """Test connection error is properly wrapped."""
-        adapter = RadioBrowserAdapter()
+        mock_request = AsyncStub(side_effect=httpx.ConnectError("Connection failed"))
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Connection failed")
+        with pytest.raises(RadioBrowserConnectionError):
+            await adapter.search_by_name("test")
 
-            with pytest.raises(RadioBrowserConnectionError):
-                await adapter.search_by_name("test")
-
-    @pytest.mark.asyncio
-    async def test_http_error_handling(self):
+    async def test_http_error_handling(self, adapter, monkeypatch):
         """Test HTTP error responses are handled."""
-        adapter = RadioBrowserAdapter()
-
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.side_effect = httpx.HTTPStatusError(
-                "Server error", request=MagicMock(), response=mock_response
+        mock_request = AsyncStub(
+            side_effect=httpx.HTTPStatusError(
+                "Server error",
+                request=MagicMock(spec=httpx.Request),
+                response=mock_response,
             )
+        )
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
 
-            with pytest.raises(RadioBrowserError):
-                await adapter.search_by_name("test")
+        with pytest.raises(RadioBrowserError):
+            await adapter.search_by_name("test")
 
-    @pytest.mark.asyncio
     async def test_retry_logic_success_after_retry(self):
         """Test successful request after retry."""
         adapter = RadioBrowserAdapter(max_retries=3)
@@ -324,52 +501,106 @@ class TestRadioBrowserAdapter:
             }
         ]
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            # First call fails, second succeeds
-            mock_request.side_effect = [
-                httpx.TimeoutException("Timeout"),
-                mock_response,
-            ]
+        # First call fails, second succeeds
+        adapter._make_request = AsyncStub(
+            side_effect=[httpx.TimeoutException("Timeout"), mock_response]
+        )
 
-            # Should succeed after retry (but this will raise because we mock the wrapper)
-            # Actually, we need to test _make_request directly
-            # For now, just verify the retry mechanism exists
-            pass
+        # Should succeed after retry (but this will raise because we mock the wrapper)
+        # Actually, we need to test _make_request directly
+        # For now, just verify the retry mechanism exists
+        pass
 
-    @pytest.mark.asyncio
-    async def test_search_limit_parameter(self):
+    async def test_search_limit_parameter(self, adapter, monkeypatch):
         """Test that limit parameter is passed correctly."""
+        mock_request = AsyncStub(result=[])
+        monkeypatch.setattr(adapter, "_make_request", mock_request)
+
+        await adapter.search_by_name("test", limit=25)
+
+        args, _ = mock_request.calls[-1]
+        assert args == ("/json/stations/byname/test", {"limit": 25})
+
+    async def test_http_client_shared_and_closed(self):
+        """Test the HTTP client is created once, reused, and closed by aclose()."""
         adapter = RadioBrowserAdapter()
 
-        with patch.object(
-            adapter, "_make_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = []
+        client = adapter._get_client()
 
-            await adapter.search_by_name("test", limit=25)
+        assert adapter._get_client() is client
+        assert str(client.base_url).rstrip("/") == adapter.base_url
 
-            # Verify limit was passed in the request
-            call_args = mock_request.call_args
-            assert "limit" in str(call_args)
+        await adapter.aclose()
 
-    @pytest.mark.asyncio
-    async def test_base_url_selection(self):
-        """Test that a valid API server is selected."""
+        assert client.is_closed
+        assert adapter._client is None
+
+    async def test_make_request_uses_cache(self):
+        """Test identical requests within the TTL hit the API only once."""
         adapter = RadioBrowserAdapter()
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.content = orjson.dumps([{"stationuuid": "uuid"}])
+        mock_client.get.return_value = mock_response
 
-        # Base URL should be one of the known RadioBrowser servers
-        known_servers = [
-            "https://all.api.radio-browser.info",
-            "https://de1.api.radio-browser.info",
-            "https://nl1.api.radio-browser.info",
-            "https://at1.api.radio-browser.info",
-        ]
+        first = await adapter._make_request("/json/stations/byuuid/uuid")
+        second = await adapter._make_request("/json/stations/byuuid/uuid")
+
+        assert first == second == [{"stationuuid": "uuid"}]
+        assert mock_client.get.call_count == 1
+
+    async def test_make_request_cache_disabled(self):
+        """Test cache_ttl=0 sends every request to the API."""
+        adapter = RadioBrowserAdapter(cache_ttl=0)
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.content = orjson.dumps([])
+        mock_client.get.return_value = mock_response
 
-        assert any(server in adapter.base_url for server in known_servers)
+        await adapter._make_request("/json/stations/bytag/jazz", {"limit": 10})
+        await adapter._make_request("/json/stations/bytag/jazz", {"limit": 10})
+
+        assert mock_client.get.call_count == 2
+
+    async def test_make_request_rate_limited(self, monkeypatch):
+        """Test concurrent requests are spaced out once the burst is used up."""
+        now = [1000.0]
+        monkeypatch.setattr(radiobrowser.time, "monotonic", lambda: now[0])
+
+        async def fake_sleep(delay):
+            now[0] += delay
+
+        adapter = RadioBrowserAdapter(requests_per_second=5.0)
+        adapter._sleep = fake_sleep
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.content = orjson.dumps([])
+        sent_at = []
+
+        async def fake_get(endpoint, params):
+            sent_at.append(now[0])
+            return mock_response
+
+        mock_client.get.side_effect = fake_get
+
+        await asyncio.gather(
+            *(adapter.search_by_name(f"station-{i}") for i in range(20))
+        )
+
+        assert mock_client.get.call_count == 20
+        burst = RadioBrowserAdapter.RATE_LIMIT_BURST
+        assert sent_at[:burst] == [1000.0] * burst
+        intervals = [b - a for a, b in zip(sent_at[burst - 1 :], sent_at[burst:])]
+        assert intervals == [pytest.approx(0.2)] * (20 - burst)
+
+    async def test_base_url_selection(self, adapter):
+        """Test that a valid API server is selected."""
+        # Base URL should be one of the known RadioBrowser servers
+        assert adapter.base_url in KNOWN_SERVERS
 
-    @pytest.mark.asyncio
     async def test_search_combined_filters(self):
         """Test search with combined filters (future feature)."""
         # This test documents the future API for combined search
@@ -400,207 +631,103 @@ class TestRadioBrowserErrors:
             raise RadioBrowserConnectionError("Connection failed")
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestRadioBrowserErrorHandling:
     """Tests for error handling in API methods."""
 
-    def _create_mock_async_client(self) -> AsyncMock:
-        """Helper to create a properly configured AsyncMock for httpx.AsyncClient."""
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        return mock_client
-
-    @pytest.mark.asyncio
-    async def test_search_by_name_timeout(self):
-        """Test that search_by_name handles timeout correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserTimeoutError) as exc_info:
-                await adapter.search_by_name("test")
-
-            assert "Request timed out" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_search_by_name_connection_error(self):
-        """Test that search_by_name handles connection errors correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserConnectionError) as exc_info:
-                await adapter.search_by_name("test")
-
-            assert "Connection failed" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_search_by_name_http_status_error(self):
-        """Test that search_by_name handles HTTP errors correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Server error", request=MagicMock(), response=mock_response
-        )
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserError) as exc_info:
-                await adapter.search_by_name("test")
-
-            assert "HTTP error 500" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_search_by_tag_timeout(self):
-        """Test that search_by_tag handles timeout correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserTimeoutError) as exc_info:
-                await adapter.search_by_tag("jazz")
-
-            assert "Request timed out" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_search_by_tag_connection_error(self):
-        """Test that search_by_tag handles connection errors correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserConnectionError) as exc_info:
-                await adapter.search_by_tag("jazz")
-
-            assert "Connection failed" in str(exc_info.value)
+    @pytest.mark.parametrize("method,args", API_METHODS)
+    @pytest.mark.parametrize("make_exc,expected_exc,substr", FAILURES)
+    async def test_error_surface(
+        self, adapter, monkeypatch, method, args, make_exc, expected_exc, substr
+    ):
+        """Test that each API method wraps httpx failures in RadioBrowser errors."""
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        monkeypatch.setattr(adapter, "_client", mock_client)
+        monkeypatch.setattr(adapter, "_sleep", AsyncMock())
+        mock_client.get.side_effect = make_exc()
 
-    @pytest.mark.asyncio
-    async def test_search_by_tag_http_status_error(self):
-        """Test that search_by_tag handles HTTP errors correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Not found", request=MagicMock(), response=mock_response
-        )
+        with pytest.raises(expected_exc) as exc_info:
+            await getattr(adapter, method)(*args)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserError) as exc_info:
-                await adapter.search_by_tag("jazz")
+        assert substr in str(exc_info.value)
 
-            assert "HTTP error 404" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_timeout(self):
-        """Test that get_station_by_uuid handles timeout correctly."""
-        adapter = RadioBrowserAdapter()
+    async def test_make_request_retry_logic_timeout(self):
+        """Test that _make_request retries on timeout and eventually fails."""
+        adapter = RadioBrowserAdapter(max_retries=3)
 
-        mock_client = self._create_mock_async_client()
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        adapter._sleep = AsyncMock()
         mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserTimeoutError) as exc_info:
-                await adapter.get_station_by_uuid("test-uuid")
+        with pytest.raises(httpx.TimeoutException):
+            await adapter._make_request("/test")
 
-            assert "Request timed out" in str(exc_info.value)
+        # Should have retried 3 times
+        assert mock_client.get.call_count == 3
+        # Should have backed off twice (between retries, not after last)
+        assert adapter._sleep.await_args_list == [
+            call(pytest.approx(0.5, abs=0.1)),
+            call(pytest.approx(1.0, abs=0.1)),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_connection_error(self):
-        """Test that get_station_by_uuid handles connection errors correctly."""
-        adapter = RadioBrowserAdapter()
+    async def test_make_request_retry_logic_connection_error(self):
+        """Test that _make_request retries on connection error and eventually fails."""
+        adapter = RadioBrowserAdapter(max_retries=2)
 
-        mock_client = self._create_mock_async_client()
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        adapter._sleep = AsyncMock()
         mock_client.get.side_effect = httpx.ConnectError("Connection refused")
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserConnectionError) as exc_info:
-                await adapter.get_station_by_uuid("test-uuid")
-
-            assert "Connection failed" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_http_status_error(self):
-        """Test that get_station_by_uuid handles HTTP errors correctly."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_client.get.side_effect = httpx.HTTPStatusError(
-            "Not found", request=MagicMock(), response=mock_response
-        )
+        with pytest.raises(httpx.ConnectError):
+            await adapter._make_request("/test")
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserError) as exc_info:
-                await adapter.get_station_by_uuid("test-uuid")
+        # Should have retried 2 times
+        assert mock_client.get.call_count == 2
+        # Should have backed off once (between 2 retries)
+        assert adapter._sleep.await_count == 1
 
-            assert "HTTP error 404" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_make_request_retry_logic_timeout(self):
-        """Test that _make_request retries on timeout and eventually fails."""
+    async def test_make_request_does_not_retry_404(self):
+        """Test that a permanent HTTP error fails without retrying."""
         adapter = RadioBrowserAdapter(max_retries=3)
 
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
-
-        with patch("httpx.AsyncClient", return_value=mock_client), patch(
-            "asyncio.sleep", new_callable=AsyncMock
-        ) as mock_sleep:
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        adapter._sleep = AsyncMock()
+        mock_client.get.side_effect = _http_status_error(404, "Not Found")
 
-            with pytest.raises(httpx.TimeoutException):
-                await adapter._make_request("/test")
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter._make_request("/test")
 
-            # Should have retried 3 times
-            assert mock_client.get.call_count == 3
-            # Should have slept 2 times (between retries, not after last)
-            assert mock_sleep.call_count == 2
+        assert mock_client.get.call_count == 1
+        adapter._sleep.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_make_request_retry_logic_connection_error(self):
-        """Test that _make_request retries on connection error and eventually fails."""
-        adapter = RadioBrowserAdapter(max_retries=2)
-
-        mock_client = self._create_mock_async_client()
-        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+    async def test_make_request_retries_503(self):
+        """Test that a transient server error is retried."""
+        adapter = RadioBrowserAdapter(max_retries=3)
 
-        with patch("httpx.AsyncClient", return_value=mock_client), patch(
-            "asyncio.sleep", new_callable=AsyncMock
-        ) as mock_sleep:
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
+        adapter._sleep = AsyncMock()
+        mock_client.get.side_effect = _http_status_error(503, "Unavailable")
 
-            with pytest.raises(httpx.ConnectError):
-                await adapter._make_request("/test")
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter._make_request("/test")
 
-            # Should have retried 2 times
-            assert mock_client.get.call_count == 2
-            # Should have slept 1 time (between 2 retries)
-            assert mock_sleep.call_count == 1
+        assert mock_client.get.call_count == 3
+        assert adapter._sleep.await_count == 2
 
-    @pytest.mark.asyncio
     async def test_make_request_retry_success_after_failure(self):
         """Test that _make_request succeeds after initial failures."""
         adapter = RadioBrowserAdapter(max_retries=3)
 
-        mock_client = self._create_mock_async_client()
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        adapter._client = mock_client
         # First 2 calls timeout, 3rd succeeds
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = orjson.dumps({"test": "data"})
 
         mock_client.get.side_effect = [
             httpx.TimeoutException("Timeout"),
@@ -608,31 +735,28 @@ class TestRadioBrowserErrorHandling:
             mock_response,
         ]
 
-        with patch("httpx.AsyncClient", return_value=mock_client), patch(
-            "asyncio.sleep", new_callable=AsyncMock
-        ) as mock_sleep:
+        adapter._sleep = AsyncMock()
 
-            result = await adapter._make_request("/test")
+        result = await adapter._make_request("/test")
 
-            assert result == {"test": "data"}
-            assert mock_client.get.call_count == 3
-            # Should have slept 2 times (before 2nd and 3rd attempt)
-            assert mock_sleep.call_count == 2
+        assert result == {"test": "data"}
+        assert mock_client.get.call_count == 3
+        # Should have backed off twice (before 2nd and 3rd attempt)
+        assert adapter._sleep.await_args_list == [
+            call(pytest.approx(0.5, abs=0.1)),
+            call(pytest.approx(1.0, abs=0.1)),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_station_by_uuid_not_found(self):
+    async def test_get_station_by_uuid_not_found(self, adapter, monkeypatch):
         """Test that get_station_by_uuid raises error when station not found."""
-        adapter = RadioBrowserAdapter()
-
-        mock_client = self._create_mock_async_client()
-        mock_response = MagicMock()
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        monkeypatch.setattr(adapter, "_client", mock_client)
+        mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = []  # Empty list = not found
-        mock_response.raise_for_status = MagicMock()
+        mock_response.content = orjson.dumps([])  # Empty list = not found
         mock_client.get.return_value = mock_response
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RadioBrowserError) as exc_info:
-                await adapter.get_station_by_uuid("nonexistent-uuid")
+        with pytest.raises(RadioBrowserError) as exc_info:
+            await adapter.get_station_by_uuid("nonexistent-uuid")
 
-            assert "not found" in str(exc_info.value)
+        assert "not found" in str(exc_info.value)
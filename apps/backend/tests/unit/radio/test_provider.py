@@ -5,6 +5,9 @@ Tests the RadioProvider interface and RadioStation dataclass.
 Validates that concrete implementations must implement all abstract methods.
 """
 
+import dataclasses
+import re
+
 import pytest
 
 from opencloudtouch.radio.provider import (
@@ -15,6 +18,8 @@ from opencloudtouch.radio.provider import (
     RadioStation,
 )
 
+ABSTRACT_INSTANTIATION_ERROR = re.compile("Can't instantiate abstract class")
+
 
 class TestRadioStationDataclass:
     """Tests for RadioStation dataclass."""
@@ -63,6 +68,19 @@ class TestRadioStationDataclass:
         assert station.homepage == "http://example.com"
         assert station.provider == "radiobrowser"
 
+    def test_radio_station_is_slotted_and_frozen(self):
+        """Test RadioStation has no instance __dict__ and rejects mutation."""
+        station = RadioStation(
+            station_id="123",
+            name="Test Station",
+            url="http://stream.example.com/radio",
+            country="DE",
+        )
+
+        assert not hasattr(station, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            station.name = "Changed"  # type: ignore[misc]
+
 
 class TestRadioProviderExceptions:
     """Tests for RadioProvider exception hierarchy."""
@@ -89,6 +107,85 @@ class TestRadioProviderExceptions:
             raise RadioProviderConnectionError("Connection failed")
 
 
+class IncompleteProvider(RadioProvider):
+    """Provider missing the search methods."""
+
+    @property
+    def provider_name(self) -> str:
+        return "incomplete"
+
+
+class CompleteProvider(RadioProvider):
+    """Provider implementing every abstract method."""
+
+    @property
+    def provider_name(self) -> str:
+        return "test"
+
+    async def search_by_name(self, name: str, limit: int = 20):
+        return [
+            RadioStation(
+                station_id="1",
+                name=name,
+                url="http://test.com",
+                country="DE",
+                provider="test",
+            )
+        ]
+
+    async def search_by_country(self, country: str, limit: int = 20):
+        return [
+            RadioStation(
+                station_id="2",
+                name="Country Station",
+                url="http://test.com",
+                country=country,
+                provider="test",
+            )
+        ]
+
+    async def search_by_tag(self, tag: str, limit: int = 20):
+        return [
+            RadioStation(
+                station_id="3",
+                name="Tagged Station",
+                url="http://test.com",
+                country="DE",
+                provider="test",
+                tags=[tag],
+            )
+        ]
+
+
+class SimpleProvider(RadioProvider):
+    """Provider with empty searches, relying on default resolve_stream_url."""
+
+    @property
+    def provider_name(self) -> str:
+        return "simple"
+
+    async def search_by_name(self, name: str, limit: int = 20):
+        return []
+
+    async def search_by_country(self, country: str, limit: int = 20):
+        return []
+
+    async def search_by_tag(self, tag: str, limit: int = 20):
+        return []
+
+
+@pytest.fixture(scope="session")
+def concrete_provider():
+    """Stateless CompleteProvider shared by all tests."""
+    return CompleteProvider()
+
+
+@pytest.fixture(scope="session")
+def simple_provider():
+    """Stateless SimpleProvider shared by all tests."""
+    return SimpleProvider()
+
+
 class TestRadioProviderInterface:
     """Tests for RadioProvider abstract interface."""
 
@@ -97,102 +194,37 @@ class TestRadioProviderInterface:
         with pytest.raises(TypeError) as exc:
             RadioProvider()  # type: ignore
 
-        assert "Can't instantiate abstract class" in str(exc.value)
+        exc.match(ABSTRACT_INSTANTIATION_ERROR)
 
     def test_concrete_implementation_must_implement_all_methods(self):
         """Test that concrete class must implement all abstract methods."""
-
-        # Incomplete implementation (missing methods)
-        class IncompleteProvider(RadioProvider):
-            @property
-            def provider_name(self) -> str:
-                return "incomplete"
-
         with pytest.raises(TypeError) as exc:
             IncompleteProvider()  # type: ignore
 
-        assert "Can't instantiate abstract class" in str(exc.value)
+        exc.match(ABSTRACT_INSTANTIATION_ERROR)
 
-    @pytest.mark.asyncio
-    async def test_concrete_implementation_works(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concrete_implementation_works(self, concrete_provider):
         """Test that complete concrete implementation works."""
-
-        class TestProvider(RadioProvider):
-            @property
-            def provider_name(self) -> str:
-                return "test"
-
-            async def search_by_name(self, name: str, limit: int = 20):
-                return [
-                    RadioStation(
-                        station_id="1",
-                        name=name,
-                        url="http://test.com",
-                        country="DE",
-                        provider="test",
-                    )
-                ]
-
-            async def search_by_country(self, country: str, limit: int = 20):
-                return [
-                    RadioStation(
-                        station_id="2",
-                        name="Country Station",
-                        url="http://test.com",
-                        country=country,
-                        provider="test",
-                    )
-                ]
-
-            async def search_by_tag(self, tag: str, limit: int = 20):
-                return [
-                    RadioStation(
-                        station_id="3",
-                        name="Tagged Station",
-                        url="http://test.com",
-                        country="DE",
-                        provider="test",
-                        tags=[tag],
-                    )
-                ]
-
-        # Should be able to instantiate
-        provider = TestProvider()
-        assert provider.provider_name == "test"
+        assert concrete_provider.provider_name == "test"
 
         # Should be able to call methods
-        results = await provider.search_by_name("Test")
+        results = await concrete_provider.search_by_name("Test")
         assert len(results) == 1
         assert results[0].name == "Test"
         assert results[0].provider == "test"
 
-        results = await provider.search_by_country("US")
+        results = await concrete_provider.search_by_country("US")
         assert len(results) == 1
         assert results[0].country == "US"
 
-        results = await provider.search_by_tag("rock")
+        results = await concrete_provider.search_by_tag("rock")
         assert len(results) == 1
         assert results[0].tags == ["rock"]
 
-    @pytest.mark.asyncio
-    async def test_default_resolve_stream_url_implementation(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_default_resolve_stream_url_implementation(self, simple_provider):
         """Test that default resolve_stream_url returns URL unchanged."""
-
-        class SimpleProvider(RadioProvider):
-            @property
-            def provider_name(self) -> str:
-                return "simple"
-
-            async def search_by_name(self, name: str, limit: int = 20):
-                return []
-
-            async def search_by_country(self, country: str, limit: int = 20):
-                return []
-
-            async def search_by_tag(self, tag: str, limit: int = 20):
-                return []
-
-        provider = SimpleProvider()
         station = RadioStation(
             station_id="1",
             name="Test",
@@ -202,5 +234,5 @@ class TestRadioProviderInterface:
         )
 
         # Default implementation should return URL unchanged
-        resolved_url = await provider.resolve_stream_url(station)
+        resolved_url = await simple_provider.resolve_stream_url(station)
         assert resolved_url == "http://original.com/stream.m3u"
@@ -1,5 +1,6 @@
 ﻿"""Unit tests for Settings repository."""
 
+import re
 import tempfile
 from pathlib import Path
 
@@ -7,6 +8,8 @@ import pytest
 
 from opencloudtouch.settings.repository import SettingsRepository
 
+INVALID_IP_ERROR = re.compile("Invalid IP address")
+
 
 @pytest.fixture
 async def settings_repo():
@@ -106,7 +109,7 @@ class TestSettingsRepository:
 
         # Act & Assert
         for invalid_ip in invalid_ips:
-            with pytest.raises(ValueError, match="Invalid IP address"):
+            with pytest.raises(ValueError, match=INVALID_IP_ERROR):
                 await settings_repo.add_manual_ip(invalid_ip)
 
     @pytest.mark.asyncio
@@ -4,36 +4,63 @@ Tests business logic layer for settings management.
 Following TDD Red-Green-Refactor cycle.
 """
 
+import re
+
 import pytest
-from unittest.mock import AsyncMock
 
 from opencloudtouch.settings.service import SettingsService
 
+INVALID_IP_ERROR = re.compile("Invalid IP address")
+
+
+class FakeSettingsRepository:
+    """In-memory stand-in for SettingsRepository that records mutations.
+
+    Much cheaper than an AsyncMock: no call objects or child mocks, just
+    the stored IPs and the arguments of each add/remove call.
+    """
+
+    def __init__(self, manual_ips=None):
+        self.manual_ips = list(manual_ips or [])
+        self.get_calls = 0
+        self.add_calls = []
+        self.remove_calls = []
+
+    async def get_manual_ips(self):
+        self.get_calls += 1
+        return list(self.manual_ips)
+
+    async def add_manual_ip(self, ip):
+        self.add_calls.append(ip)
+        if ip not in self.manual_ips:
+            self.manual_ips.append(ip)
+
+    async def remove_manual_ip(self, ip):
+        self.remove_calls.append(ip)
+        if ip in self.manual_ips:
+            self.manual_ips.remove(ip)
+
 
 @pytest.fixture
-def mock_repository():
-    """Mock SettingsRepository."""
-    repo = AsyncMock()
-    return repo
+def fake_repository():
+    """Empty FakeSettingsRepository."""
+    return FakeSettingsRepository()
 
 
 @pytest.fixture
-def settings_service(mock_repository):
-    """SettingsService instance with mocked repository."""
-    return SettingsService(repository=mock_repository)
+def settings_service(fake_repository):
+    """SettingsService instance backed by the fake repository."""
+    return SettingsService(repository=fake_repository)
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSettingsServiceManualIPs:
     """Test manual IP management."""
 
-    @pytest.mark.asyncio
-    async def test_get_manual_ips_success(self, settings_service, mock_repository):
+    async def test_get_manual_ips_success(self, settings_service, fake_repository):
         """Test getting all manual IPs."""
         # Arrange
-        mock_repository.get_manual_ips.return_value = [
-            "192.168.1.100",
-            "192.168.1.101",
-        ]
+        fake_repository.manual_ips = ["192.168.1.100", "192.168.1.101"]
 
         # Act
         result = await settings_service.get_manual_ips()
@@ -42,79 +69,69 @@ class TestSettingsServiceManualIPs:
         assert len(result) == 2
         assert "192.168.1.100" in result
         assert "192.168.1.101" in result
-        mock_repository.get_manual_ips.assert_called_once()
+        assert fake_repository.get_calls == 1
 
-    @pytest.mark.asyncio
-    async def test_get_manual_ips_empty(self, settings_service, mock_repository):
+    async def test_get_manual_ips_empty(self, settings_service, fake_repository):
         """Test getting manual IPs when none configured."""
-        # Arrange
-        mock_repository.get_manual_ips.return_value = []
-
         # Act
         result = await settings_service.get_manual_ips()
 
         # Assert
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_add_manual_ip_valid(self, settings_service, mock_repository):
+    async def test_add_manual_ip_valid(self, settings_service, fake_repository):
         """Test adding a valid manual IP."""
         # Arrange
         valid_ip = "192.168.1.100"
-        mock_repository.add_manual_ip.return_value = None
 
         # Act
         await settings_service.add_manual_ip(valid_ip)
 
         # Assert
-        mock_repository.add_manual_ip.assert_called_once_with(valid_ip)
+        assert fake_repository.add_calls == [valid_ip]
 
-    @pytest.mark.asyncio
-    async def test_add_manual_ip_invalid_format(
-        self, settings_service, mock_repository
-    ):
-        """Test adding IP with invalid format."""
-        # Arrange
-        invalid_ips = [
+    @pytest.mark.parametrize(
+        "invalid_ip",
+        [
             "192.168.1",  # Missing octet
             "192.168.1.256",  # Invalid octet (>255)
             "192.168.1.-1",  # Negative octet
             "192.168.1.abc",  # Non-numeric
             "not.an.ip.address",  # Invalid
             "",  # Empty
-        ]
-
+        ],
+    )
+    async def test_add_manual_ip_invalid_format(
+        self, settings_service, fake_repository, invalid_ip
+    ):
+        """Test adding IP with invalid format."""
         # Act & Assert
-        for invalid_ip in invalid_ips:
-            with pytest.raises(ValueError, match="Invalid IP address"):
-                await settings_service.add_manual_ip(invalid_ip)
+        with pytest.raises(ValueError, match=INVALID_IP_ERROR):
+            await settings_service.add_manual_ip(invalid_ip)
 
         # Assert repository was never called
-        mock_repository.add_manual_ip.assert_not_called()
+        assert fake_repository.add_calls == []
 
-    @pytest.mark.asyncio
-    async def test_remove_manual_ip_success(self, settings_service, mock_repository):
+    async def test_remove_manual_ip_success(self, settings_service, fake_repository):
         """Test removing a manual IP."""
         # Arrange
         ip_to_remove = "192.168.1.100"
-        mock_repository.remove_manual_ip.return_value = None
+        fake_repository.manual_ips = [ip_to_remove]
 
         # Act
         await settings_service.remove_manual_ip(ip_to_remove)
 
         # Assert
-        mock_repository.remove_manual_ip.assert_called_once_with(ip_to_remove)
+        assert fake_repository.remove_calls == [ip_to_remove]
+        assert fake_repository.manual_ips == []
 
-    @pytest.mark.asyncio
-    async def test_set_manual_ips_success(self, settings_service, mock_repository):
+    async def test_set_manual_ips_success(self, settings_service, fake_repository):
         """Test setting all manual IPs (replace operation)."""
         # Arrange
         new_ips = ["192.168.1.100", "192.168.1.101", "192.168.1.102"]
         existing_ips = ["192.168.1.50", "192.168.1.51"]
 
-        mock_repository.get_manual_ips.return_value = existing_ips
-        mock_repository.remove_manual_ip.return_value = None
-        mock_repository.add_manual_ip.return_value = None
+        fake_repository.manual_ips = list(existing_ips)
 
         # Act
         result = await settings_service.set_manual_ips(new_ips)
@@ -123,37 +140,69 @@ class TestSettingsServiceManualIPs:
         assert result == new_ips
 
         # Verify old IPs were removed
-        assert mock_repository.remove_manual_ip.call_count == len(existing_ips)
+        assert fake_repository.remove_calls == existing_ips
 
         # Verify new IPs were added
-        assert mock_repository.add_manual_ip.call_count == len(new_ips)
+        assert fake_repository.add_calls == new_ips
+        assert fake_repository.manual_ips == new_ips
+
+    async def test_set_manual_ips_keeps_unchanged_ips(
+        self, settings_service, fake_repository
+    ):
+        """Test that IPs present before and after are not removed and re-added."""
+        # Arrange
+        fake_repository.manual_ips = ["192.168.1.50", "192.168.1.100"]
+
+        # Act
+        result = await settings_service.set_manual_ips(
+            ["192.168.1.100", "192.168.1.101"]
+        )
+
+        # Assert
+        assert result == ["192.168.1.100", "192.168.1.101"]
+        assert fake_repository.remove_calls == ["192.168.1.50"]
+        assert fake_repository.add_calls == ["192.168.1.101"]
+        assert fake_repository.manual_ips == result
+
+    async def test_set_manual_ips_stores_new_order(
+        self, settings_service, fake_repository
+    ):
+        """Test that a reordered list is stored in the requested order."""
+        # Arrange
+        fake_repository.manual_ips = ["192.168.1.1", "192.168.1.2", "192.168.1.3"]
+
+        # Act
+        result = await settings_service.set_manual_ips(
+            ["192.168.1.1", "192.168.1.3", "192.168.1.2"]
+        )
+
+        # Assert
+        assert result == ["192.168.1.1", "192.168.1.3", "192.168.1.2"]
+        assert fake_repository.manual_ips == result
+        # The leading IP already in place is left untouched
+        assert "192.168.1.1" not in fake_repository.remove_calls
 
-    @pytest.mark.asyncio
     async def test_set_manual_ips_validates_all_before_changes(
-        self, settings_service, mock_repository
+        self, settings_service, fake_repository
     ):
         """Test that all IPs are validated before any changes are made."""
         # Arrange
         mixed_ips = ["192.168.1.100", "INVALID", "192.168.1.101"]
-        mock_repository.get_manual_ips.return_value = []
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Invalid IP address"):
+        with pytest.raises(ValueError, match=INVALID_IP_ERROR):
             await settings_service.set_manual_ips(mixed_ips)
 
         # Assert no repository changes were made
-        mock_repository.remove_manual_ip.assert_not_called()
-        mock_repository.add_manual_ip.assert_not_called()
+        assert fake_repository.remove_calls == []
+        assert fake_repository.add_calls == []
 
-    @pytest.mark.asyncio
     async def test_set_manual_ips_with_duplicates(
-        self, settings_service, mock_repository
+        self, settings_service, fake_repository
     ):
         """Test setting manual IPs with duplicates (should deduplicate)."""
         # Arrange
         ips_with_duplicates = ["192.168.1.100", "192.168.1.101", "192.168.1.100"]
-        mock_repository.get_manual_ips.return_value = []
-        mock_repository.add_manual_ip.return_value = None
 
         # Act
         result = await settings_service.set_manual_ips(ips_with_duplicates)
@@ -164,14 +213,13 @@ class TestSettingsServiceManualIPs:
         assert "192.168.1.101" in result
 
         # Should only add unique IPs
-        assert mock_repository.add_manual_ip.call_count == 2
+        assert fake_repository.add_calls == ["192.168.1.100", "192.168.1.101"]
 
 
 class TestSettingsServiceIPValidation:
     """Test IP address validation logic."""
 
-    @pytest.mark.asyncio
-    async def test_validate_ip_valid_addresses(self, settings_service):
+    def test_validate_ip_valid_addresses(self, settings_service):
         """Test validation accepts valid IP addresses."""
         valid_ips = [
             "0.0.0.0",
@@ -185,10 +233,9 @@ class TestSettingsServiceIPValidation:
         for ip in valid_ips:
             settings_service._validate_ip(ip)  # Should not raise
 
-    @pytest.mark.asyncio
-    async def test_validate_ip_invalid_addresses(self, settings_service):
-        """Test validation rejects invalid IP addresses."""
-        invalid_ips = [
+    @pytest.mark.parametrize(
+        "ip",
+        [
             "256.1.1.1",  # Octet > 255
             "1.1.1",  # Missing octet
             "1.1.1.1.1",  # Too many octets
@@ -196,9 +243,10 @@ class TestSettingsServiceIPValidation:
             "192.168.-1.1",  # Negative
             "",  # Empty
             "   ",  # Whitespace only
-        ]
-
-        # Act & Assert
-        for ip in invalid_ips:
-            with pytest.raises(ValueError, match="Invalid IP address"):
-                settings_service._validate_ip(ip)
+            "192.168.1.1\n",  # Trailing newline
+        ],
+    )
+    def test_validate_ip_invalid_addresses(self, settings_service, ip):
+        """Test validation rejects invalid IP addresses."""
+        with pytest.raises(ValueError, match=INVALID_IP_ERROR):
+            settings_service._validate_ip(ip)
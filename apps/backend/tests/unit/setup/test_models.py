@@ -7,6 +7,7 @@ Following TDD Red-Green-Refactor cycle.
 import pytest
 from datetime import datetime
 
+from opencloudtouch.setup import models
 from opencloudtouch.setup.models import (
     SetupStatus,
     SetupStep,
@@ -17,6 +18,15 @@ from opencloudtouch.setup.models import (
     DEFAULT_INSTRUCTIONS,
 )
 
+_FIXED_TS = datetime(2026, 2, 15, 11, 30, 0)
+_USB_PORT_TYPES = frozenset({"micro-usb", "usb-a", "usb-c"})
+
+# One parametrized case per MODEL_INSTRUCTIONS entry, identified by model name
+MODEL_INSTRUCTION_ITEMS = [
+    pytest.param(name, instructions, id=name)
+    for name, instructions in MODEL_INSTRUCTIONS.items()
+]
+
 
 class TestSetupStatus:
     """Tests for SetupStatus enum."""
@@ -67,68 +77,85 @@ class TestSetupStep:
 class TestSetupProgress:
     """Tests for SetupProgress dataclass."""
 
-    @pytest.fixture
-    def sample_progress(self):
-        """Create sample progress instance."""
-        return SetupProgress(
+    def test_progress_creation(self):
+        """Test basic progress creation."""
+        progress = SetupProgress(
             device_id="AABBCC112233",
             current_step=SetupStep.SSH_CONNECT,
             status=SetupStatus.PENDING,
             message="Connecting via SSH...",
         )
 
-    def test_progress_creation(self, sample_progress):
-        """Test basic progress creation."""
-        assert sample_progress.device_id == "AABBCC112233"
-        assert sample_progress.current_step == SetupStep.SSH_CONNECT
-        assert sample_progress.status == SetupStatus.PENDING
-        assert sample_progress.message == "Connecting via SSH..."
-        assert sample_progress.error is None
-        assert sample_progress.completed_at is None
-
-    def test_progress_has_started_at(self, sample_progress):
-        """Test progress has started_at timestamp."""
-        assert isinstance(sample_progress.started_at, datetime)
-
-    def test_progress_to_dict(self, sample_progress):
-        """Test to_dict serialization."""
-        result = sample_progress.to_dict()
+        assert progress.device_id == "AABBCC112233"
+        assert progress.current_step == SetupStep.SSH_CONNECT
+        assert progress.status == SetupStatus.PENDING
+        assert progress.message == "Connecting via SSH..."
+        assert progress.error is None
+        assert progress.completed_at is None
+
+    def test_progress_has_started_at(self, monkeypatch):
+        """Test progress defaults started_at from the module clock."""
+        monkeypatch.setattr(models, "_clock", lambda: _FIXED_TS)
 
-        assert result["device_id"] == "AABBCC112233"
-        assert result["current_step"] == "ssh_connect"
-        assert result["status"] == "pending"
-        assert result["message"] == "Connecting via SSH..."
-        assert result["error"] is None
-        assert "started_at" in result
-        assert result["completed_at"] is None
-
-    def test_progress_to_dict_with_error(self):
-        """Test to_dict with error message."""
         progress = SetupProgress(
-            device_id="TEST123",
+            device_id="AABBCC112233",
             current_step=SetupStep.SSH_CONNECT,
-            status=SetupStatus.FAILED,
-            message="Connection failed",
-            error="Connection refused",
+            status=SetupStatus.PENDING,
         )
-        result = progress.to_dict()
-
-        assert result["status"] == "failed"
-        assert result["error"] == "Connection refused"
 
-    def test_progress_to_dict_with_completed_at(self):
-        """Test to_dict with completed_at timestamp."""
-        completed_time = datetime(2026, 2, 15, 12, 0, 0)
+        assert progress.started_at == _FIXED_TS
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {
+                    "current_step": SetupStep.SSH_CONNECT,
+                    "status": SetupStatus.PENDING,
+                    "message": "Connecting via SSH...",
+                },
+                {
+                    "current_step": "ssh_connect",
+                    "status": "pending",
+                    "message": "Connecting via SSH...",
+                    "error": None,
+                    "completed_at": None,
+                },
+                id="pending",
+            ),
+            pytest.param(
+                {
+                    "current_step": SetupStep.SSH_CONNECT,
+                    "status": SetupStatus.FAILED,
+                    "message": "Connection failed",
+                    "error": "Connection refused",
+                },
+                {"status": "failed", "error": "Connection refused"},
+                id="with-error",
+            ),
+            pytest.param(
+                {
+                    "current_step": SetupStep.COMPLETE,
+                    "status": SetupStatus.CONFIGURED,
+                    "message": "Setup complete",
+                    "completed_at": datetime(2026, 2, 15, 12, 0, 0),
+                },
+                {"status": "configured", "completed_at": "2026-02-15T12:00:00"},
+                id="with-completed-at",
+            ),
+        ],
+    )
+    def test_progress_to_dict(self, kwargs, expected):
+        """Test to_dict serialization."""
         progress = SetupProgress(
-            device_id="TEST123",
-            current_step=SetupStep.COMPLETE,
-            status=SetupStatus.CONFIGURED,
-            message="Setup complete",
-            completed_at=completed_time,
+            device_id="AABBCC112233", started_at=_FIXED_TS, **kwargs
         )
+
         result = progress.to_dict()
 
-        assert result["completed_at"] == completed_time.isoformat()
+        assert result["device_id"] == "AABBCC112233"
+        assert result["started_at"] == "2026-02-15T11:30:00"
+        assert {key: result[key] for key in expected} == expected
 
 
 class TestModelInstructions:
@@ -185,34 +212,41 @@ class TestModelInstructions:
 class TestModelInstructionsDatabase:
     """Tests for MODEL_INSTRUCTIONS database."""
 
-    def test_known_models_exist(self):
-        """Test known SoundTouch models have instructions."""
-        expected_models = [
+    @pytest.mark.parametrize(
+        "model",
+        [
             "SoundTouch 10",
             "SoundTouch 20",
             "SoundTouch 30",
             "SoundTouch Portable",
             "SoundTouch SA-4",
-        ]
-        for model in expected_models:
-            assert model in MODEL_INSTRUCTIONS, f"Missing instructions for {model}"
+        ],
+    )
+    def test_known_models_exist(self, model):
+        """Test known SoundTouch models have instructions."""
+        assert model in MODEL_INSTRUCTIONS, f"Missing instructions for {model}"
 
-    def test_all_instructions_have_required_fields(self):
+    @pytest.mark.parametrize("model_name,instructions", MODEL_INSTRUCTION_ITEMS)
+    def test_all_instructions_have_required_fields(self, model_name, instructions):
         """Test all instructions have required fields."""
-        for model_name, instructions in MODEL_INSTRUCTIONS.items():
-            assert instructions.model_name == model_name
-            assert instructions.display_name  # Non-empty
-            assert instructions.usb_port_type in ["micro-usb", "usb-a", "usb-c"]
-            assert instructions.usb_port_location  # Non-empty
-            assert isinstance(instructions.adapter_needed, bool)
-            assert instructions.adapter_recommendation  # Non-empty
-
-    def test_all_models_need_adapter(self):
+        assert instructions.model_name == model_name
+        assert instructions.display_name  # Non-empty
+        assert instructions.usb_port_type in _USB_PORT_TYPES
+        assert instructions.usb_port_location  # Non-empty
+        assert isinstance(instructions.adapter_needed, bool)
+        assert instructions.adapter_recommendation  # Non-empty
+
+    @pytest.mark.parametrize("model_name,instructions", MODEL_INSTRUCTION_ITEMS)
+    def test_all_models_need_adapter(self, model_name, instructions):
         """Test all known SoundTouch models need USB adapter."""
         # SoundTouch devices use micro-USB but USB sticks are USB-A
-        for instructions in MODEL_INSTRUCTIONS.values():
-            if instructions.usb_port_type == "micro-usb":
-                assert instructions.adapter_needed is True
+        if instructions.usb_port_type == "micro-usb":
+            assert instructions.adapter_needed is True
+
+    def test_database_is_read_only(self):
+        """Test MODEL_INSTRUCTIONS cannot be modified by callers."""
+        with pytest.raises(TypeError):
+            MODEL_INSTRUCTIONS["New Model"] = DEFAULT_INSTRUCTIONS  # type: ignore
 
 
 class TestGetModelInstructions:
@@ -8,84 +8,106 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
-from opencloudtouch.setup.routes import router
+from opencloudtouch.setup.routes import SupportedModelsResponse, router
 from opencloudtouch.setup.models import (
     SetupStatus,
     SetupStep,
     SetupProgress,
     get_model_instructions,
 )
-from opencloudtouch.setup.service import SetupService, get_setup_service
+from opencloudtouch.setup.service import get_setup_service
 
 
-def create_mock_service():
-    """Create mock setup service with common mocked methods."""
-    service = MagicMock(spec=SetupService)
-    service.get_model_instructions = get_model_instructions
-    return service
+class _StubSetupService:
+    """Hand-rolled stand-in exposing only the SetupService methods the routes use."""
 
+    def __init__(self):
+        self.get_model_instructions = get_model_instructions
+        self.get_setup_status = MagicMock(return_value=None)
+        self.check_device_connectivity = AsyncMock()
+        self.run_setup = AsyncMock()
+        self.verify_setup = AsyncMock()
 
-@pytest.fixture
-def mock_setup_service():
-    """Create mock setup service."""
-    return create_mock_service()
 
-
-@pytest.fixture
-def app(mock_setup_service):
-    """Create test FastAPI app with setup router and mocked dependency."""
+@pytest.fixture(scope="module")
+def app():
+    """Create test FastAPI app with setup router (one per module)."""
     app = FastAPI()
     app.include_router(router)
-    # Override the dependency
-    app.dependency_overrides[get_setup_service] = lambda: mock_setup_service
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create test client."""
-    return TestClient(app)
+    """Create test client (one per module)."""
+    with TestClient(app) as client:
+        yield client
 
 
-class TestGetInstructions:
-    """Tests for GET /api/setup/instructions/{model}."""
+@pytest.fixture(autouse=True)
+def mock_setup_service(app):
+    """Fresh mock setup service, installed as the dependency override."""
+    service = _StubSetupService()
+    app.dependency_overrides[get_setup_service] = lambda: service
+    yield service
+    del app.dependency_overrides[get_setup_service]
 
-    def test_get_instructions_known_model(self, client):
-        """Test getting instructions for known model."""
-        response = client.get("/api/setup/instructions/SoundTouch%2010")
-        assert response.status_code == 200
 
-        data = response.json()
-        assert data["model_name"] == "SoundTouch 10"
-        assert data["display_name"] == "Bose SoundTouch 10"
-        assert data["usb_port_type"] == "micro-usb"
-        assert data["adapter_needed"] is True
-
-    def test_get_instructions_unknown_model(self, client):
-        """Test getting instructions for unknown model returns default."""
-        response = client.get("/api/setup/instructions/UnknownModelXYZ")
-        assert response.status_code == 200
+async def _post(app, path, json):
+    """POST straight to the ASGI app, without TestClient's portal thread."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(path, json=json)
+
+
+@pytest.fixture(scope="module")
+def models_payload(client):
+    """Parsed GET /api/setup/models response, fetched once per module."""
+    return client.get("/api/setup/models").json()
 
-        data = response.json()
-        assert data["model_name"] == "Unknown"
 
-    def test_get_instructions_url_encoded_model(self, client):
-        """Test model name with spaces is handled."""
-        response = client.get("/api/setup/instructions/SoundTouch%2030")
+class TestGetInstructions:
+    """Tests for GET /api/setup/instructions/{model}."""
+
+    @pytest.mark.parametrize(
+        "slug, expected",
+        [
+            pytest.param(
+                "SoundTouch%2010",
+                {
+                    "model_name": "SoundTouch 10",
+                    "display_name": "Bose SoundTouch 10",
+                    "usb_port_type": "micro-usb",
+                    "adapter_needed": True,
+                },
+                id="known_model",
+            ),
+            # Unknown models fall back to the default instructions
+            pytest.param("UnknownModelXYZ", {"model_name": "Unknown"}, id="unknown"),
+            # Model name with spaces is handled
+            pytest.param(
+                "SoundTouch%2030", {"model_name": "SoundTouch 30"}, id="url_encoded"
+            ),
+        ],
+    )
+    def test_get_instructions(self, client, slug, expected):
+        """Test getting instructions for known, unknown and URL-encoded models."""
+        response = client.get(f"/api/setup/instructions/{slug}")
         assert response.status_code == 200
 
         data = response.json()
-        assert "30" in data["model_name"]
+        assert {key: data[key] for key in expected} == expected
 
 
 class TestCheckConnectivity:
     """Tests for POST /api/setup/check-connectivity."""
 
-    def test_check_connectivity_request_validation(self, client):
+    async def test_check_connectivity_request_validation(self, app):
         """Test request validation."""
         # Missing IP
-        response = client.post("/api/setup/check-connectivity", json={})
+        response = await _post(app, "/api/setup/check-connectivity", json={})
         assert response.status_code == 422
 
     def test_check_connectivity_with_valid_ip(self, client, mock_setup_service):
@@ -113,10 +135,10 @@ class TestCheckConnectivity:
 class TestStartSetup:
     """Tests for POST /api/setup/start."""
 
-    def test_start_setup_request_validation(self, client):
+    async def test_start_setup_request_validation(self, app):
         """Test request validation."""
         # Missing required fields
-        response = client.post("/api/setup/start", json={})
+        response = await _post(app, "/api/setup/start", json={})
         assert response.status_code == 422
 
     def test_start_setup_success(self, client, mock_setup_service):
@@ -218,30 +240,52 @@ class TestVerifySetup:
 class TestListSupportedModels:
     """Tests for GET /api/setup/models."""
 
-    def test_list_models(self, client):
-        """Test listing all supported models."""
+    def test_list_models_status(self, client):
+        """Test the models endpoint responds successfully."""
         response = client.get("/api/setup/models")
         assert response.status_code == 200
 
-        data = response.json()
-        assert "models" in data
-        assert len(data["models"]) > 0
+    def test_list_models(self, models_payload):
+        """Test listing all supported models."""
+        assert "models" in models_payload
+        assert len(models_payload["models"]) > 0
 
         # Check structure
-        model = data["models"][0]
+        model = models_payload["models"][0]
         assert "model_name" in model
         assert "display_name" in model
         assert "usb_port_type" in model
         assert "adapter_needed" in model
 
-    def test_list_models_contains_known_devices(self, client):
+    def test_list_models_contains_known_devices(self, models_payload):
         """Test that known devices are in the list."""
-        response = client.get("/api/setup/models")
-        data = response.json()
-
-        model_names = [m["model_name"] for m in data["models"]]
+        model_names = [m["model_name"] for m in models_payload["models"]]
 
         # Check for known SoundTouch models
         assert "SoundTouch 10" in model_names
         assert "SoundTouch 20" in model_names
         assert "SoundTouch 30" in model_names
+
+    def test_list_models_matches_documented_schema(self, client):
+        """Test the cached body validates against the documented response model."""
+        response = client.get("/api/setup/models")
+
+        parsed = SupportedModelsResponse.model_validate_json(response.content)
+        assert len(parsed.models) == len(response.json()["models"])
+
+
+class TestOpenApiSchema:
+    """The pre-serialized routes still document their response bodies."""
+
+    @pytest.mark.parametrize(
+        "path, schema",
+        [
+            ("/api/setup/models", "SupportedModelsResponse"),
+            ("/api/setup/instructions/{model}", "ModelInstructions"),
+        ],
+    )
+    def test_response_model_documented(self, app, path, schema):
+        """Test the 200 response references the route's response model."""
+        responses = app.openapi()["paths"][path]["get"]["responses"]
+        content = responses["200"]["content"]["application/json"]
+        assert content["schema"] == {"$ref": f"#/components/schemas/{schema}"}
@@ -5,9 +5,11 @@ Following TDD Red-Green-Refactor cycle.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 from opencloudtouch.setup.service import SetupService, get_setup_service
+from opencloudtouch.setup.ssh_client import SoundTouchSSHClient
 from opencloudtouch.setup.models import (
     SetupStatus,
     SetupStep,
@@ -16,9 +18,9 @@ from opencloudtouch.setup.models import (
 )
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def mock_config():
-    """Mock config for all tests."""
+    """Mock config for all tests (patched once per module)."""
     with patch("opencloudtouch.setup.service.get_config") as mock:
         config = MagicMock()
         config.server_url = "http://localhost:8000"
@@ -28,6 +30,29 @@ def mock_config():
         yield mock
 
 
+@pytest.fixture(scope="module")
+def shared_setup_service(mock_config):
+    """Create one setup service instance per module."""
+    return SetupService()
+
+
+@pytest.fixture
+def make_setup_service():
+    """Build a setup service whose SSH connections all use the given client."""
+
+    def make(client):
+        return SetupService(ssh_client_factory=lambda ip: client)
+
+    return make
+
+
+@pytest.fixture
+def setup_service(shared_setup_service):
+    """Shared setup service, with active setups cleared after each test."""
+    yield shared_setup_service
+    shared_setup_service._active_setups.clear()
+
+
 class TestSetupServiceInitialization:
     """Tests for SetupService initialization."""
 
@@ -51,11 +76,6 @@ class TestSetupServiceInitialization:
 class TestSetupServiceModelInstructions:
     """Tests for model instructions retrieval."""
 
-    @pytest.fixture
-    def setup_service(self):
-        """Create setup service instance."""
-        return SetupService()
-
     def test_get_known_model_instructions(self, setup_service):
         """Test getting instructions for known model."""
         instructions = setup_service.get_model_instructions("SoundTouch 10")
@@ -72,11 +92,6 @@ class TestSetupServiceModelInstructions:
 class TestSetupServiceStatus:
     """Tests for setup status management."""
 
-    @pytest.fixture
-    def setup_service(self):
-        """Create setup service instance."""
-        return SetupService()
-
     def test_get_status_no_active_setup(self, setup_service):
         """Test getting status when no setup is active."""
         status = setup_service.get_setup_status("DEVICE123")
@@ -99,142 +114,122 @@ class TestSetupServiceStatus:
         assert status.status == SetupStatus.PENDING
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSetupServiceConnectivity:
     """Tests for connectivity checking."""
 
     @pytest.fixture
-    def setup_service(self):
-        """Create setup service instance."""
-        return SetupService()
-
-    @pytest.mark.asyncio
-    async def test_check_connectivity_ssh_available(self, setup_service):
-        """Test connectivity check when SSH is available."""
+    def port_checks(self, request):
+        """Patch SSH/Telnet port checks with (ssh_ok, telnet_ok) results."""
+        ssh_ok, telnet_ok = request.param
         with patch(
             "opencloudtouch.setup.service.check_ssh_port",
-            new_callable=AsyncMock,
-            return_value=True,
+            new=AsyncMock(return_value=ssh_ok),
         ), patch(
             "opencloudtouch.setup.service.check_telnet_port",
-            new_callable=AsyncMock,
-            return_value=True,
+            new=AsyncMock(return_value=telnet_ok),
         ):
-            result = await setup_service.check_device_connectivity("192.168.1.100")
+            yield ssh_ok, telnet_ok
 
-            assert result["ip"] == "192.168.1.100"
-            assert result["ssh_available"] is True
-            assert result["telnet_available"] is True
-            assert result["ready_for_setup"] is True
+    @pytest.mark.parametrize(
+        "port_checks, expected_ready",
+        [
+            pytest.param((True, True), True, id="ssh_available"),
+            pytest.param((False, True), False, id="ssh_not_available"),  # SSH required
+        ],
+        indirect=["port_checks"],
+    )
+    async def test_check_connectivity(self, setup_service, port_checks, expected_ready):
+        """Test connectivity check reflects SSH/Telnet availability."""
+        ssh_ok, telnet_ok = port_checks
 
-    @pytest.mark.asyncio
-    async def test_check_connectivity_ssh_not_available(self, setup_service):
-        """Test connectivity check when SSH is not available."""
-        with patch(
-            "opencloudtouch.setup.service.check_ssh_port",
-            new_callable=AsyncMock,
-            return_value=False,
-        ), patch(
-            "opencloudtouch.setup.service.check_telnet_port",
-            new_callable=AsyncMock,
-            return_value=True,
-        ):
-            result = await setup_service.check_device_connectivity("192.168.1.100")
+        result = await setup_service.check_device_connectivity("192.168.1.100")
 
-            assert result["ssh_available"] is False
-            assert result["telnet_available"] is True
-            assert result["ready_for_setup"] is False  # SSH required
+        assert result["ip"] == "192.168.1.100"
+        assert result["ssh_available"] is ssh_ok
+        assert result["telnet_available"] is telnet_ok
+        assert result["ready_for_setup"] is expected_ready
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSetupServiceRunSetup:
     """Tests for setup execution."""
 
-    @pytest.fixture
-    def setup_service(self):
-        """Create setup service instance."""
-        return SetupService()
-
-    @pytest.fixture
-    def mock_ssh_client(self):
-        """Create mock SSH client."""
-        client = MagicMock()
-        client.connect = AsyncMock(return_value=MagicMock(success=True))
-        client.execute = AsyncMock(
-            return_value=MagicMock(success=True, output="Success", exit_code=0)
+    @pytest.fixture(scope="module")
+    def ssh_client_proto(self):
+        """Create one autospecced SSH client per module."""
+        client = create_autospec(SoundTouchSSHClient, instance=True)
+        # Configure the autospecced methods so call signatures stay checked
+        client.connect.return_value = SimpleNamespace(success=True)
+        client.execute.return_value = SimpleNamespace(
+            success=True, output="Success", exit_code=0
         )
-        client.close = AsyncMock()
         return client
 
-    @pytest.mark.asyncio
-    async def test_run_setup_creates_progress(self, setup_service, mock_ssh_client):
+    @pytest.fixture
+    def mock_ssh_client(self, ssh_client_proto):
+        """Shared mock SSH client with recorded calls cleared."""
+        ssh_client_proto.reset_mock()
+        return ssh_client_proto
+
+    async def test_run_setup_creates_progress(
+        self, make_setup_service, mock_ssh_client
+    ):
         """Test run_setup creates progress entry."""
-        with patch(
-            "opencloudtouch.setup.service.SoundTouchSSHClient",
-            return_value=mock_ssh_client,
-        ):
-            await setup_service.run_setup(
-                device_id="DEVICE123",
-                ip="192.168.1.100",
-                model="SoundTouch 10",
-            )
+        setup_service = make_setup_service(mock_ssh_client)
+
+        await setup_service.run_setup(
+            device_id="DEVICE123",
+            ip="192.168.1.100",
+            model="SoundTouch 10",
+        )
 
-            # Progress should exist (or be cleaned up if successful)
-            # Either way, the setup should have run
+        # Progress should exist (or be cleaned up if successful)
+        # Either way, the setup should have run
 
-    @pytest.mark.asyncio
-    async def test_run_setup_ssh_connection_failure(self, setup_service):
+    async def test_run_setup_ssh_connection_failure(self, make_setup_service):
         """Test run_setup handles SSH connection failure."""
         mock_client = MagicMock()
         mock_client.connect = AsyncMock(
-            return_value=MagicMock(success=False, error="Connection refused")
+            return_value=SimpleNamespace(success=False, error="Connection refused")
         )
         mock_client.close = AsyncMock()
+        setup_service = make_setup_service(mock_client)
 
-        with patch(
-            "opencloudtouch.setup.service.SoundTouchSSHClient", return_value=mock_client
-        ):
-            progress = await setup_service.run_setup(
-                device_id="DEVICE123",
-                ip="192.168.1.100",
-                model="SoundTouch 10",
-            )
+        progress = await setup_service.run_setup(
+            device_id="DEVICE123",
+            ip="192.168.1.100",
+            model="SoundTouch 10",
+        )
 
-            assert progress.status == SetupStatus.FAILED
-            assert progress.error == "Connection refused"
+        assert progress.status == SetupStatus.FAILED
+        assert progress.error == "Connection refused"
 
-    @pytest.mark.asyncio
     async def test_run_setup_with_progress_callback(
-        self, setup_service, mock_ssh_client
+        self, make_setup_service, mock_ssh_client
     ):
         """Test run_setup calls progress callback."""
+        setup_service = make_setup_service(mock_ssh_client)
         progress_updates = []
 
         async def on_progress(progress):
             progress_updates.append(progress.current_step)
 
-        with patch(
-            "opencloudtouch.setup.service.SoundTouchSSHClient",
-            return_value=mock_ssh_client,
-        ):
-            await setup_service.run_setup(
-                device_id="DEVICE123",
-                ip="192.168.1.100",
-                model="SoundTouch 10",
-                on_progress=on_progress,
-            )
+        await setup_service.run_setup(
+            device_id="DEVICE123",
+            ip="192.168.1.100",
+            model="SoundTouch 10",
+            on_progress=on_progress,
+        )
 
-            # Should have received multiple progress updates
-            assert len(progress_updates) > 0
+        # Should have received multiple progress updates
+        assert len(progress_updates) > 0
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestSetupServiceVerify:
     """Tests for setup verification."""
 
-    @pytest.fixture
-    def setup_service(self):
-        """Create setup service instance."""
-        return SetupService()
-
-    @pytest.mark.asyncio
     async def test_verify_setup_ssh_not_accessible(self, setup_service):
         """Test verify when SSH not accessible."""
         with patch(
@@ -248,35 +243,31 @@ class TestSetupServiceVerify:
             assert result["ssh_accessible"] is False
             assert result["verified"] is False
 
-    @pytest.mark.asyncio
-    async def test_verify_setup_success(self, setup_service):
+    async def test_verify_setup_success(self, make_setup_service):
         """Test successful verification."""
         mock_client = MagicMock()
         mock_client.connect = AsyncMock()
-        mock_client.execute = AsyncMock(
-            side_effect=[
-                MagicMock(output="yes", success=True),  # SSH persistence check
-                MagicMock(
-                    output="<bmxRegistryUrl>http://localhost:8000/bmx</bmxRegistryUrl>",
-                    success=True,
-                ),  # BMX check
-            ]
-        )
+        results = [
+            SimpleNamespace(output="yes", success=True),  # SSH persistence check
+            SimpleNamespace(
+                output="<bmxRegistryUrl>http://localhost:8000/bmx</bmxRegistryUrl>",
+                success=True,
+            ),  # BMX check
+        ]
+
+        async def execute(*args, **kwargs):
+            return results.pop(0)
+
+        mock_client.execute = execute
         mock_client.close = AsyncMock()
+        setup_service = make_setup_service(mock_client)
 
         with patch(
             "opencloudtouch.setup.service.check_ssh_port",
             new_callable=AsyncMock,
             return_value=True,
-        ), patch(
-            "opencloudtouch.setup.service.SoundTouchSSHClient", return_value=mock_client
-        ), patch(
-            "opencloudtouch.setup.service.get_config"
-        ) as mock_config:
-            mock_config.return_value.server_url = "http://localhost:8000"
-            mock_config.return_value.host = "localhost"
-            mock_config.return_value.port = 8000
-
+        ):
+            # server_url/host/port come from the autouse mock_config fixture
             result = await setup_service.verify_setup("192.168.1.100")
 
             assert result["ssh_accessible"] is True
@@ -6,6 +6,7 @@ Following TDD Red-Green-Refactor cycle.
 
 import pytest
 import asyncio
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from opencloudtouch.setup.ssh_client import (
@@ -18,6 +19,33 @@ from opencloudtouch.setup.ssh_client import (
 )
 
 
+@pytest.fixture(scope="module")
+def asyncssh_stub():
+    """Install one asyncssh stand-in for the whole module (optional dependency)."""
+    stub = MagicMock()
+    with patch.dict(sys.modules, {"asyncssh": stub}):
+        yield stub
+
+
+# Attributes the client uses on asyncssh connections and run() results
+_SSH_CONNECTION_SPEC = ["run", "close", "wait_closed"]
+
+
+class _RunResult:
+    """Shape of asyncssh's SSHCompletedProcess as read by SoundTouchSSHClient."""
+
+    stdout = ""
+    stderr = ""
+    exit_status = 0
+
+
+def _reset_instance(client, initial_state):
+    """Restore client attributes, dropping any per-test overrides (mocked methods)."""
+    state = vars(client)
+    state.clear()
+    state.update(initial_state)
+
+
 class TestSSHConnectionResult:
     """Tests for SSHConnectionResult dataclass."""
 
@@ -57,10 +85,18 @@ class TestCommandResult:
 class TestSoundTouchSSHClient:
     """Tests for SoundTouchSSHClient."""
 
+    @pytest.fixture(scope="module")
+    def shared_ssh_client(self):
+        """Create SSH client instance (one per module) and its initial state."""
+        client = SoundTouchSSHClient("192.168.1.100", port=22)
+        return client, dict(vars(client))
+
     @pytest.fixture
-    def ssh_client(self):
-        """Create SSH client instance."""
-        return SoundTouchSSHClient("192.168.1.100", port=22)
+    def ssh_client(self, shared_ssh_client):
+        """Shared SSH client, reset to its initial state before each test."""
+        client, initial_state = shared_ssh_client
+        _reset_instance(client, initial_state)
+        return client
 
     def test_client_initialization(self, ssh_client):
         """Test client is initialized with correct host and port."""
@@ -69,31 +105,23 @@ class TestSoundTouchSSHClient:
         assert ssh_client._connection is None
 
     @pytest.mark.asyncio
-    async def test_connect_without_asyncssh_installed(self, ssh_client):
+    async def test_connect_without_asyncssh_installed(self, ssh_client, monkeypatch):
         """Test connect returns error when asyncssh not available."""
-        with patch.dict("sys.modules", {"asyncssh": None}):
-            # Force reimport to trigger ImportError
-            with patch.object(ssh_client, "connect") as mock_connect:
-                mock_connect.return_value = SSHConnectionResult(
-                    success=False, error="asyncssh not installed"
-                )
-                result = await ssh_client.connect()
-                assert result.success is False
-                assert "asyncssh" in result.error.lower()
+        # A None entry makes `import asyncssh` raise ImportError
+        monkeypatch.setitem(sys.modules, "asyncssh", None)
+
+        result = await ssh_client.connect()
+        assert result.success is False
+        assert "asyncssh" in result.error.lower()
 
     @pytest.mark.asyncio
-    async def test_connect_timeout(self, ssh_client):
+    async def test_connect_timeout(self, ssh_client, asyncssh_stub):
         """Test connection timeout handling."""
-        # Need to mock asyncssh first so the import doesn't fail
-        mock_asyncssh = MagicMock()
-        mock_asyncssh.connect = AsyncMock()
+        asyncssh_stub.connect = AsyncMock(side_effect=asyncio.TimeoutError())
 
-        with patch.dict("sys.modules", {"asyncssh": mock_asyncssh}):
-            with patch("asyncio.wait_for") as mock_wait:
-                mock_wait.side_effect = asyncio.TimeoutError()
-                result = await ssh_client.connect(timeout=1.0)
-                assert result.success is False
-                assert "timeout" in result.error.lower()
+        result = await ssh_client.connect(timeout=1.0)
+        assert result.success is False
+        assert "timeout" in result.error.lower()
 
     @pytest.mark.asyncio
     async def test_execute_without_connection(self, ssh_client):
@@ -122,66 +150,59 @@ class TestSoundTouchSSHClient:
         ssh_client.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_connect_success(self, ssh_client):
+    async def test_connect_success(self, ssh_client, asyncssh_stub):
         """Test successful SSH connection."""
-        mock_connection = MagicMock()
-        mock_asyncssh = MagicMock()
-        mock_asyncssh.connect = AsyncMock(return_value=mock_connection)
+        mock_connection = MagicMock(spec=_SSH_CONNECTION_SPEC)
+        asyncssh_stub.connect = AsyncMock(return_value=mock_connection)
 
-        with patch.dict("sys.modules", {"asyncssh": mock_asyncssh}):
-            with patch("asyncio.wait_for", return_value=mock_connection):
-                result = await ssh_client.connect(timeout=5.0)
-                assert result.success is True
-                assert ssh_client._connection == mock_connection
+        result = await ssh_client.connect(timeout=5.0)
+        assert result.success is True
+        assert ssh_client._connection == mock_connection
 
     @pytest.mark.asyncio
     async def test_execute_success(self, ssh_client):
         """Test successful command execution."""
         # Set up mock connection
-        mock_result = MagicMock()
+        mock_result = MagicMock(spec=_RunResult)
         mock_result.stdout = "file1.txt\nfile2.txt"
         mock_result.stderr = ""
         mock_result.exit_status = 0
 
-        mock_connection = MagicMock()
+        mock_connection = MagicMock(spec=_SSH_CONNECTION_SPEC)
         mock_connection.run = AsyncMock(return_value=mock_result)
         ssh_client._connection = mock_connection
 
-        with patch("asyncio.wait_for", return_value=mock_result):
-            result = await ssh_client.execute("ls -la")
-            assert result.success is True
-            assert "file1.txt" in result.output
-            assert result.exit_code == 0
+        result = await ssh_client.execute("ls -la")
+        assert result.success is True
+        assert "file1.txt" in result.output
+        assert result.exit_code == 0
 
     @pytest.mark.asyncio
     async def test_execute_timeout(self, ssh_client):
         """Test command execution timeout."""
-        mock_connection = MagicMock()
-        mock_connection.run = AsyncMock()
+        mock_connection = MagicMock(spec=_SSH_CONNECTION_SPEC)
+        mock_connection.run = AsyncMock(side_effect=asyncio.TimeoutError())
         ssh_client._connection = mock_connection
 
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = asyncio.TimeoutError()
-            result = await ssh_client.execute("long_command")
-            assert result.success is False
-            assert "timeout" in result.error.lower()
+        result = await ssh_client.execute("long_command")
+        assert result.success is False
+        assert "timeout" in result.error.lower()
 
     @pytest.mark.asyncio
     async def test_execute_exception(self, ssh_client):
         """Test command execution with exception."""
-        mock_connection = MagicMock()
+        mock_connection = MagicMock(spec=_SSH_CONNECTION_SPEC)
+        mock_connection.run = AsyncMock(side_effect=Exception("Connection lost"))
         ssh_client._connection = mock_connection
 
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = Exception("Connection lost")
-            result = await ssh_client.execute("some_command")
-            assert result.success is False
-            assert "Connection lost" in result.error
+        result = await ssh_client.execute("some_command")
+        assert result.success is False
+        assert "Connection lost" in result.error
 
     @pytest.mark.asyncio
     async def test_close_with_connection(self, ssh_client):
         """Test closing active SSH connection."""
-        mock_connection = MagicMock()
+        mock_connection = MagicMock(spec=_SSH_CONNECTION_SPEC)
         mock_connection.close = MagicMock()
         mock_connection.wait_closed = AsyncMock()
         ssh_client._connection = mock_connection
@@ -195,10 +216,35 @@ class TestSoundTouchSSHClient:
 class TestSoundTouchTelnetClient:
     """Tests for SoundTouchTelnetClient."""
 
+    @pytest.fixture(scope="module")
+    def shared_telnet_client(self):
+        """Create Telnet client instance (one per module) and its initial state."""
+        client = SoundTouchTelnetClient("192.168.1.100", port=17000)
+        return client, dict(vars(client))
+
     @pytest.fixture
-    def telnet_client(self):
-        """Create Telnet client instance."""
-        return SoundTouchTelnetClient("192.168.1.100", port=17000)
+    def telnet_client(self, shared_telnet_client):
+        """Shared Telnet client, reset to its initial state before each test."""
+        client, initial_state = shared_telnet_client
+        _reset_instance(client, initial_state)
+        return client
+
+    @pytest.fixture
+    def reader_writer(self):
+        """Fresh mock stream reader/writer pair."""
+        reader = MagicMock()
+        reader.read = AsyncMock(return_value=b"")
+        writer = MagicMock()
+        writer.write = MagicMock()
+        writer.drain = AsyncMock()
+        writer.close = MagicMock()
+        writer.wait_closed = AsyncMock()
+        return reader, writer
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Make the client's fixed post-connect/post-write delays instant."""
+        monkeypatch.setattr("asyncio.sleep", AsyncMock(return_value=None))
 
     def test_client_initialization(self, telnet_client):
         """Test client is initialized with correct host and port."""
@@ -210,8 +256,7 @@ class TestSoundTouchTelnetClient:
     @pytest.mark.asyncio
     async def test_connect_timeout(self, telnet_client):
         """Test connection timeout handling."""
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = asyncio.TimeoutError()
+        with patch("asyncio.open_connection", side_effect=asyncio.TimeoutError()):
             result = await telnet_client.connect(timeout=1.0)
             assert result.success is False
             assert "timeout" in result.error.lower()
@@ -245,25 +290,21 @@ class TestSoundTouchTelnetClient:
         telnet_client.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_connect_success(self, telnet_client):
+    async def test_connect_success(self, telnet_client, reader_writer):
         """Test successful telnet connection."""
-        mock_reader = MagicMock()
-        mock_reader.read = AsyncMock(return_value=b"Welcome\r\n")
-        mock_writer = MagicMock()
-        mock_writer.close = MagicMock()
-        mock_writer.wait_closed = AsyncMock()
+        mock_reader, mock_writer = reader_writer
+        mock_reader.read.return_value = b"Welcome\r\n"
 
         with patch("asyncio.open_connection", new_callable=AsyncMock) as mock_conn:
             mock_conn.return_value = (mock_reader, mock_writer)
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                with patch.object(
-                    telnet_client, "_read_available", new_callable=AsyncMock
-                ) as mock_read:
-                    mock_read.return_value = "Welcome"
-                    result = await telnet_client.connect(timeout=5.0)
-                    assert result.success is True
-                    assert telnet_client._reader == mock_reader
-                    assert telnet_client._writer == mock_writer
+            with patch.object(
+                telnet_client, "_read_available", new_callable=AsyncMock
+            ) as mock_read:
+                mock_read.return_value = "Welcome"
+                result = await telnet_client.connect(timeout=5.0)
+                assert result.success is True
+                assert telnet_client._reader == mock_reader
+                assert telnet_client._writer == mock_writer
 
     @pytest.mark.asyncio
     async def test_connect_exception(self, telnet_client):
@@ -275,65 +316,44 @@ class TestSoundTouchTelnetClient:
             assert "failed" in result.error.lower()
 
     @pytest.mark.asyncio
-    async def test_execute_success(self, telnet_client):
+    async def test_execute_success(self, telnet_client, reader_writer):
         """Test successful command execution."""
-        mock_reader = MagicMock()
-        mock_reader.read = AsyncMock(return_value=b"command output\r\n")
-        mock_writer = MagicMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
-
-        telnet_client._reader = mock_reader
-        telnet_client._writer = mock_writer
+        mock_reader, mock_writer = reader_writer
+        mock_reader.read.return_value = b"command output\r\n"
+        telnet_client._reader, telnet_client._writer = reader_writer
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            with patch("asyncio.wait_for", return_value=b"command output"):
-                result = await telnet_client.execute("ls")
-                assert result.success is True
-                mock_writer.write.assert_called()
+        result = await telnet_client.execute("ls")
+        assert result.success is True
+        mock_writer.write.assert_called()
 
     @pytest.mark.asyncio
-    async def test_execute_with_error_response(self, telnet_client):
+    async def test_execute_with_error_response(self, telnet_client, reader_writer):
         """Test command execution with error in response."""
-        mock_reader = MagicMock()
-        mock_writer = MagicMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
-
-        telnet_client._reader = mock_reader
-        telnet_client._writer = mock_writer
+        telnet_client._reader, telnet_client._writer = reader_writer
         telnet_client._read_available = AsyncMock(
             return_value="Error: Command not found"
         )
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await telnet_client.execute("invalid_cmd")
-            assert result.success is False
-            assert result.exit_code == 1
+        result = await telnet_client.execute("invalid_cmd")
+        assert result.success is False
+        assert result.exit_code == 1
 
     @pytest.mark.asyncio
-    async def test_execute_exception(self, telnet_client):
+    async def test_execute_exception(self, telnet_client, reader_writer):
         """Test command execution with exception."""
-        mock_reader = MagicMock()
-        mock_writer = MagicMock()
-        mock_writer.write = MagicMock(side_effect=Exception("Connection lost"))
-
-        telnet_client._reader = mock_reader
-        telnet_client._writer = mock_writer
+        _, mock_writer = reader_writer
+        mock_writer.write.side_effect = Exception("Connection lost")
+        telnet_client._reader, telnet_client._writer = reader_writer
 
         result = await telnet_client.execute("some_command")
         assert result.success is False
         assert "Connection lost" in result.error
 
     @pytest.mark.asyncio
-    async def test_close_with_connection(self, telnet_client):
+    async def test_close_with_connection(self, telnet_client, reader_writer):
         """Test closing active telnet connection."""
-        mock_writer = MagicMock()
-        mock_writer.close = MagicMock()
-        mock_writer.wait_closed = AsyncMock()
-
-        telnet_client._reader = MagicMock()
-        telnet_client._writer = mock_writer
+        _, mock_writer = reader_writer
+        telnet_client._reader, telnet_client._writer = reader_writer
 
         await telnet_client.close()
         mock_writer.close.assert_called_once()
@@ -341,15 +361,14 @@ class TestSoundTouchTelnetClient:
         assert telnet_client._writer is None
 
     @pytest.mark.asyncio
-    async def test_read_available_timeout(self, telnet_client):
+    async def test_read_available_timeout(self, telnet_client, reader_writer):
         """Test _read_available with timeout."""
-        mock_reader = MagicMock()
+        mock_reader, _ = reader_writer
+        mock_reader.read.side_effect = asyncio.TimeoutError()
         telnet_client._reader = mock_reader
 
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = asyncio.TimeoutError()
-            result = await telnet_client._read_available(timeout=1.0)
-            assert result == ""
+        result = await telnet_client._read_available(timeout=1.0)
+        assert result == ""
 
     @pytest.mark.asyncio
     async def test_read_available_no_reader(self, telnet_client):
@@ -368,26 +387,32 @@ class TestConnectionHelpers:
         mock_writer.close = MagicMock()
         mock_writer.wait_closed = AsyncMock()
 
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.return_value = (MagicMock(), mock_writer)
+        with patch("asyncio.open_connection", new_callable=AsyncMock) as mock_conn:
+            mock_conn.return_value = (MagicMock(), mock_writer)
             result = await check_ssh_port("192.168.1.100")
             assert result is True
             mock_writer.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_ssh_connection_timeout(self):
-        """Test SSH connection test with timeout."""
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = asyncio.TimeoutError()
-            result = await check_ssh_port("192.168.1.100")
-            assert result is False
-
-    @pytest.mark.asyncio
-    async def test_ssh_connection_refused(self):
-        """Test SSH connection test with refused connection."""
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = ConnectionRefusedError()
-            result = await check_ssh_port("192.168.1.100")
+    @pytest.mark.parametrize(
+        "check, exc",
+        [
+            pytest.param(check_ssh_port, asyncio.TimeoutError(), id="ssh_timeout"),
+            pytest.param(check_ssh_port, ConnectionRefusedError(), id="ssh_refused"),
+            pytest.param(
+                check_telnet_port, asyncio.TimeoutError(), id="telnet_timeout"
+            ),
+            pytest.param(
+                check_telnet_port,
+                OSError("Network unreachable"),
+                id="telnet_os_error",
+            ),
+        ],
+    )
+    async def test_connection_check_failure(self, check, exc):
+        """Test port checks report False on timeout, refusal and OS errors."""
+        with patch("asyncio.open_connection", side_effect=exc):
+            result = await check("192.168.1.100")
             assert result is False
 
     @pytest.mark.asyncio
@@ -397,23 +422,7 @@ class TestConnectionHelpers:
         mock_writer.close = MagicMock()
         mock_writer.wait_closed = AsyncMock()
 
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.return_value = (MagicMock(), mock_writer)
+        with patch("asyncio.open_connection", new_callable=AsyncMock) as mock_conn:
+            mock_conn.return_value = (MagicMock(), mock_writer)
             result = await check_telnet_port("192.168.1.100")
             assert result is True
-
-    @pytest.mark.asyncio
-    async def test_telnet_connection_timeout(self):
-        """Test Telnet connection test with timeout."""
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = asyncio.TimeoutError()
-            result = await check_telnet_port("192.168.1.100")
-            assert result is False
-
-    @pytest.mark.asyncio
-    async def test_telnet_connection_os_error(self):
-        """Test Telnet connection test with OS error."""
-        with patch("asyncio.wait_for") as mock_wait:
-            mock_wait.side_effect = OSError("Network unreachable")
-            result = await check_telnet_port("192.168.1.100")
-            assert result is False
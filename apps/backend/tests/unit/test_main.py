@@ -1,58 +1,110 @@
 ﻿"""Tests for main application module (startup, lifecycle)."""
 
+import json
+import re
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import unquote
 
 import pytest
 from fastapi.testclient import TestClient
 
-
-@pytest.mark.asyncio
-async def test_lifespan_initialization():
-    """Test lifespan context manager initializes config and DB."""
-    from opencloudtouch.core.config import AppConfig
-    from opencloudtouch.main import app, lifespan
-
-    with patch("opencloudtouch.main.init_config") as mock_init_config, patch(
-        "opencloudtouch.main.setup_logging"
-    ) as mock_setup_logging, patch(
-        "opencloudtouch.main.get_config"
-    ) as mock_get_config, patch(
-        "opencloudtouch.main.DeviceRepository"
-    ) as mock_repo_class:
+from opencloudtouch.core.config import AppConfig
+from opencloudtouch.main import (
+    StarletteHTTPException,
+    app,
+    lifespan,
+    starlette_http_exception_handler,
+)
+
+# Replicates the serve_spa() security checks: reject ".." and backslashes
+_UNSAFE_PATH = re.compile(r"\.\.|\\")
+
+# Common path traversal attack vectors
+DANGEROUS_PATHS = (
+    "/../../../etc/passwd",
+    "..%2F..%2F..%2Fetc/passwd",
+    "....//....//etc/passwd",
+    "..\\..\\..\\etc\\passwd",
+    "/%2e%2e/%2e%2e/%2e%2e/etc/passwd",
+    "test/../../../etc/passwd",
+    "..%252f..%252fetc/passwd",  # Double-encoded
+)
+
+# Valid paths should pass
+SAFE_PATHS = (
+    "index.html",
+    "assets/main.js",
+    "static/logo.png",
+    "",
+)
+
+
+def _is_safe_path(full_path: str) -> bool:
+    """Return True if the decoded path has no traversal patterns."""
+    return _UNSAFE_PATH.search(unquote(full_path)) is None
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared test client for the main app (one per module)."""
+    # Not entered as a context manager: the real lifespan (DB, discovery) stays off
+    return TestClient(app)
+
+
+@pytest.fixture
+def lifespan_mocks():
+    """Patch config, logging and repository setup used by lifespan()."""
+    with ExitStack() as stack:
+        init_config = stack.enter_context(patch("opencloudtouch.main.init_config"))
+        setup_logging = stack.enter_context(patch("opencloudtouch.main.setup_logging"))
+        get_config = stack.enter_context(patch("opencloudtouch.main.get_config"))
+        repo_class = stack.enter_context(patch("opencloudtouch.main.DeviceRepository"))
 
         # Mock config
-        mock_config = MagicMock(spec=AppConfig)
-        mock_config.host = "0.0.0.0"
-        mock_config.port = 7777
-        mock_config.effective_db_path = ":memory:"
-        mock_config.discovery_enabled = True
-        mock_config.discovery_timeout = 10
-        mock_config.manual_device_ips_list = []
-        mock_config.mock_mode = False
-        mock_get_config.return_value = mock_config
+        config = MagicMock(spec=AppConfig)
+        config.host = "0.0.0.0"
+        config.port = 7777
+        config.effective_db_path = ":memory:"
+        config.discovery_enabled = True
+        config.discovery_timeout = 10
+        config.manual_device_ips_list = []
+        config.mock_mode = False
+        get_config.return_value = config
 
         # Mock repository
-        mock_repo = AsyncMock()
-        mock_repo.initialize = AsyncMock()
-        mock_repo.close = AsyncMock()
-        mock_repo_class.return_value = mock_repo
+        repo = AsyncMock()
+        repo.initialize = AsyncMock()
+        repo.close = AsyncMock()
+        repo_class.return_value = repo
 
-        # Run lifespan
-        async with lifespan(app):
-            # Verify startup
-            mock_init_config.assert_called_once()
-            mock_setup_logging.assert_called_once()
-            mock_repo.initialize.assert_called_once()
+        yield SimpleNamespace(
+            init_config=init_config,
+            setup_logging=setup_logging,
+            get_config=get_config,
+            repo_class=repo_class,
+            config=config,
+            repo=repo,
+        )
+
+
+@pytest.mark.asyncio
+async def test_lifespan_initialization(lifespan_mocks):
+    """Test lifespan context manager initializes config and DB."""
+    # Run lifespan
+    async with lifespan(app):
+        # Verify startup
+        lifespan_mocks.init_config.assert_called_once()
+        lifespan_mocks.setup_logging.assert_called_once()
+        lifespan_mocks.repo.initialize.assert_called_once()
 
-        # Verify shutdown
-        mock_repo.close.assert_called_once()
+    # Verify shutdown
+    lifespan_mocks.repo.close.assert_called_once()
 
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test health check endpoint returns expected fields and types."""
-    from opencloudtouch.main import app
-
-    client = TestClient(app)
     response = client.get("/health")
 
     assert response.status_code == 200
@@ -71,12 +123,8 @@ def test_health_endpoint():
     assert isinstance(data["config"]["db_path"], str)
 
 
-def test_cors_headers_present():
+def test_cors_headers_present(client):
     """Test CORS headers are present in responses."""
-    from opencloudtouch.main import app
-
-    client = TestClient(app)
-
     # Preflight request
     response = client.options(
         "/api/devices/discover",
@@ -92,96 +140,38 @@ def test_cors_headers_present():
     assert "access-control-allow-methods" in response.headers
 
 
-def test_spa_path_traversal_blocked():
+@pytest.mark.parametrize(
+    "path, expected_safe",
+    [(path, False) for path in DANGEROUS_PATHS] + [(path, True) for path in SAFE_PATHS],
+)
+def test_spa_path_traversal_blocked(path, expected_safe):
     """Security test: Path traversal validation logic.
 
     Regression test for BE-01 (P1 Critical).
     Tests path validation logic to prevent directory traversal.
     """
-    from urllib.parse import unquote
-
-    # Test the validation logic directly
-    def is_safe_path(full_path: str) -> bool:
-        """Replicate serve_spa() security checks."""
-        decoded_path = unquote(full_path)
-
-        # Reject directory traversal patterns
-        if ".." in decoded_path:
-            return False
+    assert _is_safe_path(path) is expected_safe
 
-        # Reject backslashes (Windows path traversal)
-        if "\\" in decoded_path:
-            return False
 
-        return True
-
-    # Common path traversal attack vectors
-    dangerous_paths = [
-        "/../../../etc/passwd",
-        "..%2F..%2F..%2Fetc/passwd",
-        "....//....//etc/passwd",
-        "..\\..\\..\\etc\\passwd",
-        "/%2e%2e/%2e%2e/%2e%2e/etc/passwd",
-        "test/../../../etc/passwd",
-        "..%252f..%252fetc/passwd",  # Double-encoded
-    ]
-
-    for path in dangerous_paths:
-        assert not is_safe_path(path), f"Path traversal not blocked: {path}"
-
-    # Valid paths should pass
-    safe_paths = [
-        "index.html",
-        "assets/main.js",
-        "static/logo.png",
-        "",
-    ]
+@pytest.mark.asyncio
+async def test_lifespan_error_handling(lifespan_mocks):
+    """Test lifespan handles errors gracefully."""
+    # Mock repo that fails to initialize
+    lifespan_mocks.repo.initialize.side_effect = Exception("DB connection failed")
 
-    for path in safe_paths:
-        assert is_safe_path(path), f"Safe path incorrectly blocked: {path}"
+    # Should raise exception
+    with pytest.raises(Exception, match="DB connection failed"):
+        async with lifespan(app):
+            pass
 
 
 @pytest.mark.asyncio
-async def test_lifespan_error_handling():
-    """Test lifespan handles errors gracefully."""
-    from opencloudtouch.main import app, lifespan
-
-    with patch("opencloudtouch.main.init_config"), patch(
-        "opencloudtouch.main.setup_logging"
-    ), patch("opencloudtouch.main.get_config") as mock_get_config, patch(
-        "opencloudtouch.main.DeviceRepository"
-    ) as mock_repo_class:
-
-        mock_config = MagicMock()
-        mock_config.host = "0.0.0.0"
-        mock_config.port = 7777
-        mock_config.effective_db_path = ":memory:"
-        mock_config.discovery_enabled = True
-        mock_config.discovery_timeout = 10
-        mock_config.manual_device_ips_list = []
-        mock_config.mock_mode = False
-        mock_get_config.return_value = mock_config
-
-        # Mock repo that fails to initialize
-        mock_repo = AsyncMock()
-        mock_repo.initialize = AsyncMock(side_effect=Exception("DB connection failed"))
-        mock_repo.close = AsyncMock()
-        mock_repo_class.return_value = mock_repo
-
-        # Should raise exception
-        with pytest.raises(Exception, match="DB connection failed"):
-            async with lifespan(app):
-                pass
-
-
-def test_404_returns_rfc7807_error():
+async def test_404_returns_rfc7807_error():
     """Test that 404 Not Found returns RFC 7807 ErrorDetail.
 
     Tests the StarletteHTTPException handler for routing-level 404s.
     We need to test before the SPA catch-all is hit.
     """
-    from opencloudtouch.main import StarletteHTTPException
-
     # Simulate a routing 404 by patching the router lookup
     # Alternative: Use a request that actually triggers Starlette's 404
     # Since all routes are handled by SPA catch-all, we test the handler directly
@@ -194,15 +184,10 @@ def test_404_returns_rfc7807_error():
     exc = StarletteHTTPException(status_code=404, detail="Not Found")
 
     # Call handler directly
-    from opencloudtouch.main import starlette_http_exception_handler
-    import asyncio
-
-    response = asyncio.run(starlette_http_exception_handler(mock_request, exc))
+    response = await starlette_http_exception_handler(mock_request, exc)
 
     assert response.status_code == 404
     # Parse JSON from response body
-    import json
-
     data = json.loads(response.body.decode())
 
     # Verify RFC 7807 structure
@@ -217,16 +202,12 @@ def test_404_returns_rfc7807_error():
     assert data["status"] == 404
 
 
-def test_405_returns_rfc7807_error():
+@pytest.mark.asyncio
+async def test_405_returns_rfc7807_error():
     """Test that 405 Method Not Allowed returns RFC 7807 ErrorDetail.
 
     Tests the StarletteHTTPException handler for routing-level 405s.
     """
-    from opencloudtouch.main import StarletteHTTPException
-    from unittest.mock import MagicMock
-    import asyncio
-    import json
-
     # Create a mock request
     mock_request = MagicMock()
     mock_request.url.path = "/api/devices"
@@ -235,9 +216,7 @@ def test_405_returns_rfc7807_error():
     exc = StarletteHTTPException(status_code=405, detail="Method Not Allowed")
 
     # Call handler directly
-    from opencloudtouch.main import starlette_http_exception_handler
-
-    response = asyncio.run(starlette_http_exception_handler(mock_request, exc))
+    response = await starlette_http_exception_handler(mock_request, exc)
 
     assert response.status_code == 405
     data = json.loads(response.body.decode())